@@ -0,0 +1,365 @@
+# File: bench_app.py
+# 목적:
+#  - 합성 데이터(synth_bluehands)로 1k / 10k / 100k / 1M 지점 규모에서
+#    1) 임포트(읽기 / 정리 / 적재 단계별)
+#    2) final.py get_bluehands_data 필터 조합별 조회 + get_nearby_bluehands 내 주변 조회
+#    3) 지도(folium 마커) / 표(HTML) 렌더링
+#    시간을 재고, 규모별로 비교할 수 있는 JSON 리포트를 남긴다.
+#
+# 사용 예:
+#  python bench_app.py --scales 1000 10000 100000 --report bench_app.json
+#  python bench_app.py --scales 1000000 --max-map-rows 20000 --repeat 5
+#
+# 동작:
+#  - 벤치마크 전용 DB(BENCH_MYSQL_DB, 기본 bluehands_bench)를 규모마다 schema.sql로 새로 만든다.
+#    접속 정보(MYSQL_HOST/PORT/USER/PASSWORD)는 임포터와 같은 환경변수를 쓴다. 운영 DB 이름이면 중단.
+#  - final.py는 Streamlit 페이지 스크립트라 import 하면 화면 전체가 실행된다.
+#    그래서 소스에서 조회/렌더링 함수와 필요한 상수만 골라서(ast) 벤치마크 DB에 연결된 채로 실행한다.
+#    @st.cache_data 데코레이터는 떼고 실행 -> 캐시 없이 매번 DB를 치는 비용(캐시 미스)을 잰다.
+
+import argparse
+import ast
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import folium
+import mysql.connector
+import streamlit as st
+
+import import_csv_to_mysql as importer
+from crawl_output import read_crawl_output
+from synth_bluehands import write_synthetic
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "..", "final.py")
+SCHEMA_PATH = os.path.join(BASE_DIR, "schema.sql")
+
+BENCH_DB = os.getenv("BENCH_MYSQL_DB", "bluehands_bench")
+DEFAULT_SCALES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_MAX_MAP_ROWS = 20_000  # 이보다 많은 결과는 folium 렌더링을 건너뜀(100만 마커 HTML은 수 GB)
+
+# final.py에서 가져올 이름
+APP_CONSTANTS = [
+    "FILTER_OPTIONS", "FLAG_COLS_SQL", "PAGE_SIZE",
+    "NEARBY_START_RADIUS_KM", "NEARBY_MAX_RADIUS_KM", "KM_PER_DEG_LAT",
+    "MAP_MARKER_LIMIT",
+]
+APP_FUNCTIONS = [
+    "build_bluehands_where", "get_bluehands_data",
+    "count_bluehands", "_keyset_query", "get_bluehands_page", "seek_bluehands_cursor",
+    "_bbox_wkt", "get_nearby_bluehands",
+    "haversine", "_service_text_from_row", "format_services_html",
+    "add_markers_to_map", "build_hy_table_html",
+]
+
+# (이름, 검색어, 서비스 필터, 지역) - 앱에서 자주 쓰는 조합
+QUERY_CASES = [
+    ("전체", "", [], "(전체)"),
+    ("지역", "", [], "서울"),
+    ("필터1", "", ["is_ev"], "(전체)"),
+    ("필터2+지역", "", ["is_ev", "is_hydrogen"], "경기"),
+    ("검색어", "강남", [], "(전체)"),
+    ("검색어+필터+지역", "중앙로", ["is_frame"], "부산"),
+    ("다단어 검색어", "서울 현대", [], "(전체)"),
+    ("1글자 검색어", "강", [], "(전체)"),
+]
+
+DEEP_PAGE = 100  # 표 페이지 벤치마크에서 바로 건너뛸 페이지 번호
+
+# (이름, kwargs) - 강남역 기준 내 주변 검색
+NEARBY_ORIGIN = (37.4979, 127.0276)
+NEARBY_CASES = [
+    ("반경 3km", {"radius_km": 3}),
+    ("반경 10km+필터", {"radius_km": 10, "selected_filters": ["is_ev"]}),
+    ("최근접 20개", {"k": 20}),
+]
+
+
+def load_app_functions(get_conn) -> dict:
+    """
+    목적:
+      - final.py에서 APP_CONSTANTS / APP_FUNCTIONS만 골라서 실행한 namespace를 돌려준다.
+      - get_conn은 벤치마크 DB 연결 함수로 바꿔 끼운다.
+    """
+    with open(APP_PATH, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=APP_PATH)
+
+    picked = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id in APP_CONSTANTS for t in node.targets
+        ):
+            picked.append(node)
+        elif isinstance(node, ast.FunctionDef) and node.name in APP_FUNCTIONS:
+            node.decorator_list = []  # st.cache_data 제거
+            picked.append(node)
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(APP_PATH)))  # final.py가 import 하는 Function/ 모듈용
+    from Function.service_mask import service_filter_sql
+    from Function.keyset import keyset_cursor, keyset_query
+    from Function.text_search import build_text_search
+
+    namespace = {
+        "service_filter_sql": service_filter_sql,
+        "keyset_query": keyset_query, "keyset_cursor": keyset_cursor, "build_text_search": build_text_search,
+        "st": st, "folium": folium, "math": math, "get_conn": get_conn,
+        "radians": math.radians, "cos": math.cos, "sin": math.sin, "asin": math.asin, "sqrt": math.sqrt,
+    }
+    exec(compile(ast.Module(body=picked, type_ignores=[]), APP_PATH, "exec"), namespace)
+
+    missing = [name for name in APP_CONSTANTS + APP_FUNCTIONS if name not in namespace]
+    if missing:
+        raise RuntimeError(f"final.py에서 찾지 못한 이름: {missing}")
+    return namespace
+
+
+def reset_database():
+    # schema.sql의 DB 이름만 벤치마크 DB로 바꿔서 통째로 실행(테이블 전부 새로 만듦)
+    with open(SCHEMA_PATH, encoding="utf-8") as f:
+        sql = f.read().replace("bluehands_db", BENCH_DB)
+    statements = []
+    for stmt in sql.split(";"):
+        lines = [line for line in stmt.splitlines() if not line.strip().startswith("--")]
+        stmt = "\n".join(lines).strip()
+        if stmt:
+            statements.append(stmt)
+
+    conn = mysql.connector.connect(
+        host=importer.MYSQL_HOST, port=importer.MYSQL_PORT,
+        user=importer.MYSQL_USER, password=importer.MYSQL_PASSWORD,
+    )
+    try:
+        cur = conn.cursor()
+        for stmt in statements:
+            cur.execute(stmt)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def bench_conn():
+    return mysql.connector.connect(
+        host=importer.MYSQL_HOST, port=importer.MYSQL_PORT,
+        user=importer.MYSQL_USER, password=importer.MYSQL_PASSWORD,
+        database=BENCH_DB, charset="utf8mb4",
+    )
+
+
+def _timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def bench_import(path: str, bulk: str) -> dict:
+    # 임포터 main()과 같은 순서로, 단계별 시간을 따로 잰다.
+    df, read_s = _timed(read_crawl_output, path)
+    importer.ensure_required_columns(df)
+    df, clean_s = _timed(importer.clean_frame, df)
+
+    use_bulk = bulk == "on" or (bulk == "auto" and len(df) >= importer.BULK_LOAD_THRESHOLD)
+    importer.MYSQL_DB = BENCH_DB
+    conn = importer.connect_mysql(local_infile=use_bulk)
+    try:
+        with conn.cursor() as cur:
+            started = time.perf_counter()
+            importer.insert_dim_table(cur, "regions", sorted(df[importer.COL_REGION].unique().tolist()))
+            importer.insert_dim_table(cur, "service_types", sorted(df[importer.COL_TYPE].unique().tolist()))
+            region_map = importer.load_name_to_id(cur, "regions")
+            type_map = importer.load_name_to_id(cur, "service_types")
+            frame = importer.build_bluehands_frame(df, region_map, type_map)
+            build_s = time.perf_counter() - started
+
+            if use_bulk:
+                _, write_s = _timed(importer.load_bluehands_bulk, cur, frame)
+            else:
+                _, write_s = _timed(importer.insert_bluehands, cur, frame)
+        _, commit_s = _timed(conn.commit)
+    finally:
+        conn.close()
+
+    total = read_s + clean_s + build_s + write_s + commit_s
+    return {
+        "rows": len(frame),
+        "write_path": "LOAD DATA" if use_bulk else "executemany",
+        "read_s": round(read_s, 3),
+        "clean_s": round(clean_s, 3),
+        "build_s": round(build_s, 3),
+        "write_s": round(write_s, 3),
+        "commit_s": round(commit_s, 3),
+        "total_s": round(total, 3),
+        "rows_per_s": round(len(frame) / total) if total else None,
+    }
+
+
+def bench_queries(app: dict, repeat: int) -> tuple[list[dict], list[dict]]:
+    results = []
+    widest_rows = []
+    for name, search_text, filters, region in QUERY_CASES:
+        times = []
+        rows = []
+        for _ in range(repeat):
+            rows, seconds = _timed(app["get_bluehands_data"], search_text, filters, region)
+            times.append(seconds)
+        results.append({
+            "case": name,
+            "search_text": search_text,
+            "filters": filters,
+            "region": region,
+            "rows": len(rows),
+            "median_ms": round(statistics.median(times) * 1000, 2),
+            "max_ms": round(max(times) * 1000, 2),
+        })
+        if len(rows) > len(widest_rows):
+            widest_rows = rows
+
+        # 앱 DB 경로: 지도용 앞쪽 MAP_MARKER_LIMIT(+1)개
+        # 표 페이지(keyset): 개수 + 첫 페이지 + DEEP_PAGE 페이지(앞 페이지들을 건너뛰는 seek 포함)
+        query_args = (search_text, tuple(filters), region)
+        _, map_s = _timed(app["get_bluehands_page"], *query_args, limit=app["MAP_MARKER_LIMIT"] + 1)
+        _, count_s = _timed(app["count_bluehands"], *query_args)
+        _, page1_s = _timed(app["get_bluehands_page"], *query_args)
+        started = time.perf_counter()
+        cursor = app["seek_bluehands_cursor"](*query_args, None, (DEEP_PAGE - 1) * app["PAGE_SIZE"])
+        if cursor:
+            app["get_bluehands_page"](*query_args, after=cursor)
+        deep_s = time.perf_counter() - started
+        results[-1].update({
+            "map_rows_ms": round(map_s * 1000, 2),
+            "count_ms": round(count_s * 1000, 2),
+            "page1_ms": round(page1_s * 1000, 2),
+            f"page{DEEP_PAGE}_ms": round(deep_s * 1000, 2) if cursor else None,
+        })
+
+    for name, kwargs in NEARBY_CASES:
+        times = []
+        rows = []
+        for _ in range(repeat):
+            rows, seconds = _timed(app["get_nearby_bluehands"], *NEARBY_ORIGIN, **kwargs)
+            times.append(seconds)
+        results.append({
+            "case": name,
+            "nearby": kwargs,
+            "rows": len(rows),
+            "median_ms": round(statistics.median(times) * 1000, 2),
+            "max_ms": round(max(times) * 1000, 2),
+        })
+    return results, widest_rows
+
+
+def bench_snapshot(repeat: int) -> dict:
+    # final.py 기본 조회 경로: 메모리 스냅샷 적재 1회 + QUERY_CASES 조회(DB 왕복 없음)
+    from Function.branch_snapshot import SnapshotStore  # load_app_functions가 sys.path에 프로젝트 루트를 넣어 둠
+
+    store = SnapshotStore(bench_conn)
+    snapshot, load_s = _timed(store.reload)
+    cases = []
+    for name, search_text, filters, region in QUERY_CASES:
+        times = []
+        rows = []
+        for _ in range(repeat):
+            rows, seconds = _timed(snapshot.search, search_text, filters, region)
+            times.append(seconds)
+        cases.append({
+            "case": name,
+            "rows": len(rows),
+            "median_ms": round(statistics.median(times) * 1000, 3),
+        })
+    return {"load_s": round(load_s, 3), "rows": snapshot.size, "queries": cases}
+
+
+def bench_render(app: dict, rows: list[dict], max_map_rows: int) -> dict:
+    # 표: 앱은 한 페이지(PAGE_SIZE행)만 HTML로 만든다
+    page = rows[:app["PAGE_SIZE"]]
+    table_html, table_s = _timed(app["build_hy_table_html"], page)
+    report = {
+        "table_page_ms": round(table_s * 1000, 3),
+        "table_page_bytes": len(table_html.encode("utf-8")),
+        "map_markers": len(rows),
+    }
+
+    # 지도: 결과 전체를 마커로 올리고 HTML까지 만든다(st_folium이 브라우저로 보내는 것)
+    if len(rows) > max_map_rows:
+        report["map_skipped"] = f"결과 {len(rows)}행 > --max-map-rows {max_map_rows}"
+        return report
+
+    def build_map():
+        m = folium.Map(location=[37.4979, 127.0276], zoom_start=13)
+        app["add_markers_to_map"](m, rows, 37.4979, 127.0276)
+        return m
+
+    m, markers_s = _timed(build_map)
+    html, html_s = _timed(m.get_root().render)
+    report.update({
+        "map_markers_ms": round(markers_s * 1000, 1),
+        "map_html_ms": round(html_s * 1000, 1),
+        "map_html_mb": round(len(html.encode("utf-8")) / 1024 / 1024, 2),
+    })
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임포트 / 조회 / 렌더링 규모별 벤치마크")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--bulk", choices=["auto", "on", "off"], default="auto", help="임포터 --bulk와 같음")
+    parser.add_argument("--repeat", type=int, default=3, help="조회 반복 횟수(중앙값 기록)")
+    parser.add_argument("--max-map-rows", type=int, default=DEFAULT_MAX_MAP_ROWS)
+    parser.add_argument("--report", default="bench_app.json", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    if BENCH_DB == "bluehands_db":
+        importer.die("BENCH_MYSQL_DB가 운영 DB(bluehands_db)입니다. 벤치마크는 DB를 새로 만들기 때문에 중단합니다.")
+
+    app = load_app_functions(bench_conn)
+    report = {
+        "meta": {
+            "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "database": BENCH_DB,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "scales": [],
+    }
+
+    for n_rows in args.scales:
+        print(f"📦 {n_rows:,}행 ...")
+        reset_database()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "synth.parquet")
+            _, generate_s = _timed(write_synthetic, path, n_rows, args.seed)
+            import_report = bench_import(path, args.bulk)
+
+        queries, widest_rows = bench_queries(app, args.repeat)
+        snapshot = bench_snapshot(args.repeat)
+        render = bench_render(app, widest_rows, args.max_map_rows)
+        report["scales"].append({
+            "rows": n_rows,
+            "generate_s": round(generate_s, 3),
+            "import": import_report,
+            "queries": queries,
+            "snapshot": snapshot,
+            "render": render,
+        })
+        print(
+            f"   import {import_report['total_s']}s ({import_report['rows_per_s']} rows/sec), "
+            f"query median {[q['median_ms'] for q in queries]} ms, "
+            f"snapshot load {snapshot['load_s']}s / query median {[q['median_ms'] for q in snapshot['queries']]} ms"
+        )
+
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n '{args.report}' 파일로 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
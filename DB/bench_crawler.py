@@ -0,0 +1,125 @@
+# File: bench_crawler.py
+# 목적:
+#  - 네트워크 없이 크롤러 처리량을 재현성 있게 측정한다.
+#    1) replay_server를 백그라운드로 띄우고(지연/에러 주입 가능)
+#    2) crawler.crawl_all을 그 서버로 돌려서 pages/sec, rows/sec를 재고
+#    3) 보관된 원본 응답으로 JSON 파싱 + 디코딩 비용(페이지당)을 따로 잰다.
+#
+# 사용 예:
+#  python crawler.py --record ./raw                      # (한 번만) 실제 응답 보관
+#  python bench_crawler.py --archive ./raw --latency-ms 80 --workers 8 --rate 1000 --report bench.json
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import tempfile
+import time
+
+import crawler
+from replay_server import ReplayConfig, start_server
+
+
+def bench_crawl(args) -> dict:
+    config = ReplayConfig(args.archive, args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+    server = start_server(config)
+    crawler.url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    pages = 0
+    rows = 0
+
+    def on_page(region_alias, page_no, page_rows):
+        nonlocal pages, rows
+        pages += 1
+        rows += len(page_rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = crawler.CrawlCheckpoint(os.path.join(tmp, "checkpoint.sqlite3"))
+        try:
+            started = time.perf_counter()
+            crawler.crawl_all(checkpoint, on_page=on_page, workers=args.workers, rate=args.rate, burst=args.burst)
+            elapsed = time.perf_counter() - started
+            missing = len(checkpoint.missing_pages())
+        finally:
+            checkpoint.close()
+            server.shutdown()
+            server.server_close()
+
+    return {
+        "workers": args.workers,
+        "rate": args.rate,
+        "latency_ms": args.latency_ms,
+        "error_rate": args.error_rate,
+        "pages": pages,
+        "rows": rows,
+        "missing_pages": missing,
+        "server_requests": config.requests,
+        "injected_errors": config.errors,
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_s": round(pages / elapsed, 1) if elapsed else None,
+        "rows_per_s": round(rows / elapsed, 1) if elapsed else None,
+    }
+
+
+def bench_decode(args) -> dict:
+    # 파일 읽기/압축 해제는 빼고, JSON 파싱과 parse_items만 잰다.
+    alias_by_full_name = {full: alias for alias, full in crawler.regions.items()}
+    raw_pages = []
+    for path in sorted(glob.glob(os.path.join(args.archive, "*.json.gz"))):
+        region_full_name = os.path.basename(path).rsplit("_", 1)[0]
+        with gzip.open(path, "rb") as f:
+            raw_pages.append((alias_by_full_name.get(region_full_name, region_full_name), f.read()))
+
+    if not raw_pages:
+        return {"pages": 0}
+
+    parse_s = 0.0
+    decode_s = 0.0
+    rows = 0
+    for _ in range(args.decode_repeat):
+        for region_alias, raw in raw_pages:
+            t0 = time.perf_counter()
+            items = json.loads(raw).get("data", {}).get("result", [])
+            t1 = time.perf_counter()
+            rows += len(crawler.parse_items(region_alias, items))
+            t2 = time.perf_counter()
+            parse_s += t1 - t0
+            decode_s += t2 - t1
+
+    n = len(raw_pages) * args.decode_repeat
+    return {
+        "pages": len(raw_pages),
+        "repeat": args.decode_repeat,
+        "parse_us_per_page": round(parse_s / n * 1e6, 1),
+        "decode_us_per_page": round(decode_s / n * 1e6, 1),
+        "decode_us_per_row": round(decode_s / rows * 1e6, 2) if rows else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 오프라인 벤치마크")
+    parser.add_argument("--archive", required=True, help="crawler.py --record 로 만든 폴더")
+    parser.add_argument("--workers", type=int, default=crawler.DEFAULT_WORKERS)
+    parser.add_argument("--rate", type=float, default=1000.0, help="토큰 버킷 속도 (측정할 땐 충분히 크게)")
+    parser.add_argument("--burst", type=int, default=crawler.DEFAULT_BURST)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--decode-repeat", type=int, default=20, help="디코딩 측정 반복 횟수")
+    parser.add_argument("--report", default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    report = {"crawl": bench_crawl(args), "decode": bench_decode(args)}
+
+    print("=" * 50)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n '{args.report}' 파일로 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
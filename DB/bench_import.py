@@ -0,0 +1,144 @@
+# File: bench_import.py
+# 목적:
+#  - 임포터의 "정리 + INSERT 튜플 만들기" 단계(DB 쓰기 전까지)를 합성 CSV(synth_bluehands)로 측정한다.
+#  - 예전 방식(셀마다 apply + iterrows로 행 dict 생성)과 지금 방식(컬럼 단위 벡터 연산)을
+#    같은 입력으로 돌려서 시간과 결과가 같은지 비교한다.
+#
+# 사용 예:
+#  python bench_import.py --rows 1000000 --report bench_import.json
+#  python bench_import.py --rows 100000 --skip-legacy     # 예전 방식은 느리니 빼고 측정
+
+import argparse
+import json
+import os
+import re
+import tempfile
+import time
+
+import pandas as pd
+
+import import_csv_to_mysql as importer
+from branch_hash import branch_key, row_hash
+from crawl_output import FLAG_COLUMNS, read_crawl_output
+from synth_bluehands import region_aliases, type_names, write_synthetic
+
+DIRTY_RATIO = 0.2  # 정리 로직이 실제로 일하도록 전화번호/공백을 흐트러뜨릴 비율
+
+
+# ===== 예전 방식(비교 기준) =====
+def _legacy_normalize_str(x):
+    if x is None:
+        return None
+    if isinstance(x, float) and pd.isna(x):
+        return None
+    s = str(x).strip()
+    return s if s != "" else None
+
+
+def _legacy_format_phone_kor(x):
+    s = _legacy_normalize_str(x)
+    if s is None:
+        return None
+    digits = re.sub(r"[^0-9]", "", s)
+    if digits == "":
+        return None
+    if len(digits) == 11 and digits.startswith("010"):
+        return f"{digits[0:3]}-{digits[3:7]}-{digits[7:11]}"
+    if digits.startswith("02"):
+        if len(digits) == 9:
+            return f"{digits[0:2]}-{digits[2:5]}-{digits[5:9]}"
+        if len(digits) == 10:
+            return f"{digits[0:2]}-{digits[2:6]}-{digits[6:10]}"
+    if len(digits) == 10:
+        return f"{digits[0:3]}-{digits[3:6]}-{digits[6:10]}"
+    if len(digits) == 11:
+        return f"{digits[0:3]}-{digits[3:7]}-{digits[7:11]}"
+    return digits
+
+
+def legacy_prepare(df: pd.DataFrame, region_map: dict, type_map: dict) -> list[tuple]:
+    df = df.copy()
+    for col in ["region", "name", "type", "address"]:
+        df[col] = df[col].apply(_legacy_normalize_str)
+    df["phone"] = df["phone"].apply(_legacy_format_phone_kor)
+    df = df.dropna(subset=["region", "name", "type"])
+
+    out_rows = {}
+    for _, row in df.iterrows():
+        def safe_int(v, default=0):
+            if v is None or (isinstance(v, float) and pd.isna(v)):
+                return int(default)
+            return int(v)
+
+        region_id = region_map.get(row["region"])
+        type_id = type_map.get(row["type"])
+        if region_id is None or type_id is None:
+            continue
+        lat = None if pd.isna(row["latitude"]) else float(row["latitude"])
+        lng = None if pd.isna(row["longitude"]) else float(row["longitude"])
+        out = {"name": row["name"], "region_id": int(region_id), "type_id": int(type_id),
+               "address": row["address"], "phone": row["phone"], "latitude": lat, "longitude": lng}
+        for col in FLAG_COLUMNS:
+            out[col] = safe_int(row[col], 0)
+        out["branch_key"] = branch_key(out["name"], out["address"])
+        out["row_hash"] = row_hash({**out, "region": row["region"], "type": row["type"]})
+        out_rows[out["branch_key"]] = out
+    return [tuple(r[c] for c in importer.BLUEHANDS_COLUMNS) for r in out_rows.values()]
+
+
+def vectorized_prepare(df: pd.DataFrame, region_map: dict, type_map: dict) -> list[tuple]:
+    frame = importer.build_bluehands_frame(importer.clean_frame(df), region_map, type_map)
+    return importer.frame_to_tuples(frame)
+
+
+def _same_rows(old_rows: list[tuple], new_rows: list[tuple]) -> bool:
+    # 예전 방식은 빈 전화번호가 None 대신 NaN으로 남는 경우가 있어서(apply 결과 dtype 추론) NaN == None으로 본다
+    def norm(v):
+        return None if isinstance(v, float) and v != v else v
+    return len(old_rows) == len(new_rows) and all(
+        tuple(map(norm, a)) == tuple(map(norm, b)) for a, b in zip(old_rows, new_rows)
+    )
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임포터 정리 단계 벤치마크 (DB 없이)")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-legacy", action="store_true", help="예전 방식(iterrows) 측정 생략")
+    parser.add_argument("--report", default=None, help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "synthetic.csv")
+        write_synthetic(csv_path, args.rows, args.seed, dirty=DIRTY_RATIO)
+        df, read_s = _timed(read_crawl_output, csv_path)
+
+    region_map = {name: i + 1 for i, name in enumerate(region_aliases())}
+    type_map = {name: i + 1 for i, name in enumerate(type_names())}
+
+    report = {"rows": args.rows, "read_s": round(read_s, 3)}
+    new_rows, new_s = _timed(vectorized_prepare, df, region_map, type_map)
+    report["vectorized"] = {"seconds": round(new_s, 3), "rows_per_s": round(len(new_rows) / new_s)}
+
+    if not args.skip_legacy:
+        old_rows, old_s = _timed(legacy_prepare, df, region_map, type_map)
+        report["legacy"] = {"seconds": round(old_s, 3), "rows_per_s": round(len(old_rows) / old_s)}
+        report["speedup"] = round(old_s / new_s, 1)
+        report["identical"] = _same_rows(old_rows, new_rows)
+
+    print("=" * 50)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n '{args.report}' 파일로 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
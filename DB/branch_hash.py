@@ -0,0 +1,69 @@
+# File: branch_hash.py
+# 목적:
+#  - 지점 1개를 식별하는 자연키(branch_key)와 내용 해시(row_hash)를 만든다.
+#  - 크롤러(변경 감지)와 임포터(증분 적재)가 같은 규칙을 쓰도록 한 곳에 모아둔다.
+#
+# 규칙:
+#  - branch_key: 지점명 + 주소 (공백 정리 후) 의 sha1
+#  - row_hash : branch_key에 포함되지 않는 값까지 전부(좌표, 전화, 타입, 플래그) 합친 sha1
+#    -> 같은 지점인데 row_hash가 다르면 "변경", branch_key가 없어졌으면 "삭제"
+
+import hashlib
+
+import pandas as pd
+
+# 해시에 들어가는 컬럼 (순서 고정, 바꾸면 이전 스냅샷과 전부 다르게 나옴)
+HASH_COLUMNS = [
+    "region", "name", "type", "address", "phone", "latitude", "longitude",
+    "is_ev", "is_ev_tech", "is_hydrogen",
+    "is_frame", "is_al_frame", "is_n_line",
+    "is_commercial_mid", "is_commercial_big", "is_commercial_ev",
+    "is_cs_excellent",
+]
+
+COORD_DIGITS = 7  # 소수점 7자리 = 약 1cm, float 출력 차이로 해시가 흔들리지 않게 반올림
+
+
+def _norm(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return ""
+        return f"{round(value, COORD_DIGITS):.{COORD_DIGITS}f}"
+    return str(value).strip()
+
+
+def branch_key(name, address) -> str:
+    raw = f"{_norm(name)}\x1f{_norm(address)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def row_hash(row: dict) -> str:
+    raw = "\x1f".join(_norm(row.get(col)) for col in HASH_COLUMNS)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _norm_column(col: pd.Series) -> pd.Series:
+    # _norm()과 같은 결과를 컬럼 단위로 만든다(문자열/정수 컬럼은 셀마다 함수 호출 없이 처리).
+    kind = pd.api.types.infer_dtype(col, skipna=True)
+    if kind == "string":
+        return col.where(col.notna(), "").astype(str).str.strip()
+    if kind == "integer" and not col.isna().any():
+        return col.map({v: str(v) for v in col.unique().tolist()})  # 플래그는 값 종류가 0/1뿐
+    if kind == "floating":
+        # round(v, 7) 후 .7f 출력은 v를 바로 .7f로 출력한 것과 같다(둘 다 정확한 반올림)
+        return pd.Series(
+            ["" if v != v else f"{v:.{COORD_DIGITS}f}" for v in pd.to_numeric(col).tolist()],
+            index=col.index,
+        )
+    return col.map(_norm)  # 섞인 타입은 _norm 그대로
+
+
+def row_hashes(columns: dict) -> list[str]:
+    # columns: 컬럼명 -> pandas Series (HASH_COLUMNS를 모두 포함, 같은 index)
+    # row_hash()를 행마다 부르는 것과 같은 값을 돌려준다. 임포터처럼 행이 많을 때 사용.
+    joined = _norm_column(columns[HASH_COLUMNS[0]])
+    for col in HASH_COLUMNS[1:]:
+        joined = joined + "\x1f" + _norm_column(columns[col])
+    return [hashlib.sha1(raw.encode("utf-8")).hexdigest() for raw in joined.tolist()]
@@ -0,0 +1,99 @@
+# File: crawl_metrics.py
+# 목적:
+#  - 크롤러가 요청한 페이지마다 단계별 소요 시간을 기록하고(메트릭 파일, 한 줄에 JSON 하나),
+#    수집이 끝나면 지연시간 분포(p50/p95/p99), pages/sec, 전송량, 지역별 재시도 수를 요약해서 출력한다.
+#
+# 단계(초 단위):
+#  - throttle_s : 토큰 버킷(요청 속도 제한)에서 기다린 시간 -> 우리 쪽 sleep
+#  - backoff_s  : 실패 후 재시도 전에 쉰 시간
+#  - connect_s  : TCP/TLS 연결 시간 (keep-alive로 재사용되면 0)
+#  - wait_s     : 요청 전송 ~ 응답 헤더 도착 (서버 처리 대기)
+#  - download_s : 응답 본문 다운로드
+#  - parse_s    : JSON 파싱
+#  - decode_s   : item -> 행 변환(parse_items)
+#  - total_s    : 위 단계 합계 (한 페이지를 얻는 데 걸린 전체 시간)
+
+import json
+from collections import defaultdict
+
+import numpy as np
+
+PHASES = ["throttle_s", "backoff_s", "connect_s", "wait_s", "download_s", "parse_s", "decode_s"]
+PERCENTILES = [50, 95, 99]
+
+
+def new_request_metrics(region_alias: str, page_no: int) -> dict:
+    metrics = {"region": region_alias, "page": page_no, "ok": False, "status": None,
+               "attempts": 0, "bytes": 0, "rows": 0}
+    for phase in PHASES:
+        metrics[phase] = 0.0
+    return metrics
+
+
+class CrawlMetrics:
+    """
+    목적:
+      - record()로 받은 요청 메트릭을 파일에 바로 한 줄씩 쓰고, 요약용 값만 메모리에 남긴다.
+    주의:
+      - 결과 수집 루프(메인 스레드)에서만 호출한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "w", encoding="utf-8")
+        self.records = 0
+        self.phase_values = defaultdict(list)  # phase -> [초, ...]
+        self.by_region = defaultdict(lambda: {"pages": 0, "failed": 0, "retries": 0, "bytes": 0, "total_s": []})
+
+    def record(self, metrics: dict):
+        metrics["total_s"] = sum(metrics[phase] for phase in PHASES)
+        self.file.write(json.dumps(metrics, ensure_ascii=False) + "\n")
+        self.file.flush()
+        self.records += 1
+
+        region = self.by_region[metrics["region"]]
+        region["retries"] += max(0, metrics["attempts"] - 1)
+        region["bytes"] += metrics["bytes"]
+        if not metrics["ok"]:
+            region["failed"] += 1
+            return
+        region["pages"] += 1
+        region["total_s"].append(metrics["total_s"])
+        for phase in PHASES + ["total_s"]:
+            self.phase_values[phase].append(metrics[phase])
+
+    def close(self):
+        self.file.close()
+
+    def print_summary(self, elapsed: float):
+        pages = sum(r["pages"] for r in self.by_region.values())
+        total_bytes = sum(r["bytes"] for r in self.by_region.values())
+        retries = sum(r["retries"] for r in self.by_region.values())
+        failed = sum(r["failed"] for r in self.by_region.values())
+
+        print("=" * 50)
+        print(f"⏱️ 요청 메트릭 ({self.records}건 → '{self.path}')")
+        print(
+            f"   {pages} 페이지 / {elapsed:.1f}초 = {pages / elapsed if elapsed else 0:.1f} pages/sec, "
+            f"{total_bytes / 1024:.1f} KB, 재시도 {retries}회, 실패 {failed}건"
+        )
+        if not pages:
+            return
+
+        header = "   단계(ms)      " + "".join(f"{'p' + str(p):>9}" for p in PERCENTILES)
+        print(header)
+        for phase in PHASES + ["total_s"]:
+            values = np.percentile(np.asarray(self.phase_values[phase]) * 1000, PERCENTILES)
+            print(f"   {phase[:-2]:<14}" + "".join(f"{v:9.1f}" for v in values))
+
+        print("   지역별 (페이지 / 재시도 / 실패 / KB / total p50·p95·p99 ms)")
+        for region_alias, r in self.by_region.items():
+            if r["total_s"]:
+                p = np.percentile(np.asarray(r["total_s"]) * 1000, PERCENTILES)
+                pct = " / ".join(f"{v:.0f}" for v in p)
+            else:
+                pct = "-"
+            print(
+                f"   [{region_alias}] {r['pages']} / {r['retries']} / {r['failed']} / "
+                f"{r['bytes'] / 1024:.1f} / {pct}"
+            )
@@ -0,0 +1,214 @@
+# File: crawl_output.py
+# 목적:
+#  - 크롤러 결과를 페이지가 도착할 때마다 파일에 바로 흘려보내는(streaming) writer.
+#    (전체 결과를 리스트/DataFrame으로 모았다가 마지막에 한 번에 쓰지 않는다 -> 메모리 일정)
+#  - 임포터가 같은 타입 정의로 파일을 바로 읽을 수 있게 reader도 같이 둔다.
+#
+# 지원 형식(확장자로 결정):
+#  - .parquet : 타입이 파일에 같이 저장됨(좌표 float64, 플래그 uint8). pyarrow 필요.
+#  - .ndjson  : 한 줄에 한 행(JSON). 배치 단위로 이어 쓴다.
+#  - .csv     : 기존 형식(utf-8-sig). 읽을 때 dtype을 명시해서 추론 비용/전화번호 0 누락을 막는다.
+
+import csv
+import json
+import os
+from collections import Counter
+
+import pandas as pd
+
+# 컬럼 -> 타입 (순서가 곧 파일 컬럼 순서)
+STRING_COLUMNS = ["region", "name", "type", "address", "phone"]
+COORD_COLUMNS = ["latitude", "longitude"]
+FLAG_COLUMNS = [
+    "is_ev", "is_ev_tech", "is_hydrogen",
+    "is_frame", "is_al_frame", "is_n_line",
+    "is_commercial_mid", "is_commercial_big", "is_commercial_ev",
+    "is_cs_excellent",
+]
+OUTPUT_COLUMNS = STRING_COLUMNS + COORD_COLUMNS + FLAG_COLUMNS
+
+# delta 파일에만 붙는 컬럼
+DELTA_COLUMNS = ["change", "branch_key"] + OUTPUT_COLUMNS
+
+DEFAULT_BATCH_ROWS = 500  # 이만큼 쌓이면 파일에 flush (parquet row group 크기)
+
+
+def output_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        return "parquet"
+    if ext in (".ndjson", ".jsonl"):
+        return "ndjson"
+    return "csv"
+
+
+def _arrow_schema(columns: list[str]):
+    import pyarrow as pa  # parquet을 쓸 때만 필요
+
+    fields = []
+    for col in columns:
+        if col in COORD_COLUMNS:
+            fields.append(pa.field(col, pa.float64()))
+        elif col in FLAG_COLUMNS:
+            fields.append(pa.field(col, pa.uint8()))
+        else:
+            fields.append(pa.field(col, pa.string()))
+    return pa.schema(fields)
+
+
+class CrawlOutputWriter:
+    """
+    목적:
+      - write_rows()로 받은 행을 batch_rows개씩 모아서 파일에 이어 쓴다.
+      - 쓰는 동안은 '<path>.partial'에 쓰고, commit() 때 원래 이름으로 교체한다.
+        (수집이 중간에 실패하면 abort()로 지워서 불완전한 결과 파일이 남지 않게 한다)
+    """
+
+    def __init__(self, path: str, columns: list[str] = OUTPUT_COLUMNS, batch_rows: int = DEFAULT_BATCH_ROWS):
+        self.path = path
+        self.tmp_path = path + ".partial"
+        self.columns = columns
+        self.batch_rows = batch_rows
+        self.fmt = output_format(path)
+
+        self.buffer = []
+        self.rows_written = 0
+        self.region_counts = Counter()
+
+        self._file = None  # csv / ndjson
+        self._csv = None
+        self._parquet = None  # pyarrow.parquet.ParquetWriter
+        self._schema = None
+
+    def _open(self):
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            self._schema = _arrow_schema(self.columns)
+            self._parquet = pq.ParquetWriter(self.tmp_path, self._schema)
+        elif self.fmt == "ndjson":
+            self._file = open(self.tmp_path, "w", encoding="utf-8")
+        else:
+            self._file = open(self.tmp_path, "w", encoding="utf-8-sig", newline="")
+            self._csv = csv.DictWriter(self._file, fieldnames=self.columns, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write_rows(self, rows: list[dict]):
+        self.buffer.extend(rows)
+        for row in rows:
+            self.region_counts[row.get("region")] += 1
+        if len(self.buffer) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if self._parquet is None and self._file is None:
+            self._open()
+        if not self.buffer:
+            return
+
+        if self.fmt == "parquet":
+            import pyarrow as pa
+
+            table = pa.Table.from_pylist(
+                [{col: row.get(col) for col in self.columns} for row in self.buffer],
+                schema=self._schema,
+            )
+            self._parquet.write_table(table)
+        elif self.fmt == "ndjson":
+            self._file.write("".join(
+                json.dumps({col: row.get(col) for col in self.columns}, ensure_ascii=False) + "\n"
+                for row in self.buffer
+            ))
+        else:
+            self._csv.writerows(self.buffer)
+
+        self.rows_written += len(self.buffer)
+        self.buffer.clear()
+
+    def _close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def commit(self):
+        self.flush()  # 행이 0개여도 헤더/스키마만 있는 파일은 만든다
+        self._close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        self._close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def _pandas_dtypes(columns) -> dict:
+    dtypes = {}
+    for col in columns:
+        if col in COORD_COLUMNS:
+            dtypes[col] = "float64"
+        elif col in FLAG_COLUMNS:
+            dtypes[col] = "UInt8"  # 빈 칸이 있을 수 있어서 일단 nullable로 읽고 0으로 채운다
+        else:
+            dtypes[col] = "object"
+    return dtypes
+
+
+def _fix_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    for col in FLAG_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna(0).astype("uint8")
+    for col in COORD_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("float64")
+    for col in STRING_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("object")
+    return df
+
+
+def _csv_dtypes(path: str) -> dict:
+    # 헤더에 없는 컬럼은 dtype에서 빼야 read_csv가 에러를 안 낸다 (누락 검증은 임포터가 함)
+    header = pd.read_csv(path, encoding="utf-8", nrows=0).columns
+    return _pandas_dtypes([c for c in header if c in OUTPUT_COLUMNS])
+
+
+def read_crawl_output(path: str) -> pd.DataFrame:
+    """
+    목적:
+      - 크롤러 결과 파일(parquet/ndjson/csv)을 확장자에 맞게 읽는다.
+      - 어떤 형식이든 좌표 float64, 플래그 uint8, 문자열 object로 맞춰서 돌려준다.
+    """
+    fmt = output_format(path)
+    if fmt == "parquet":
+        df = pd.read_parquet(path)
+    elif fmt == "ndjson":
+        df = pd.read_json(path, lines=True, dtype=_pandas_dtypes(OUTPUT_COLUMNS))
+    else:
+        df = pd.read_csv(path, encoding="utf-8", dtype=_csv_dtypes(path))
+    return _fix_dtypes(df)
+
+
+def iter_crawl_output(path: str, chunksize: int):
+    """
+    목적:
+      - read_crawl_output()과 같은 타입 규칙으로, 파일 전체가 아니라 chunksize행씩 DataFrame을 내준다.
+        (파일이 커도 메모리는 chunk 하나 분량만 사용)
+      - parquet은 row group과 상관없이 chunksize행 단위로 잘라준다.
+    """
+    fmt = output_format(path)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield _fix_dtypes(batch.to_pandas())
+    elif fmt == "ndjson":
+        with pd.read_json(path, lines=True, dtype=_pandas_dtypes(OUTPUT_COLUMNS), chunksize=chunksize) as reader:
+            for df in reader:
+                yield _fix_dtypes(df)
+    else:
+        with pd.read_csv(path, encoding="utf-8", dtype=_csv_dtypes(path), chunksize=chunksize) as reader:
+            for df in reader:
+                yield _fix_dtypes(df)
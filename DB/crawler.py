@@ -1,7 +1,22 @@
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import numpy as np
 import requests
-import pandas as pd
+import threading
 import time
 import math  # 페이지 계산용
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import Counter
+from branch_hash import branch_key, row_hash
+from crawl_metrics import CrawlMetrics, new_request_metrics
+from crawl_output import CrawlOutputWriter, DELTA_COLUMNS
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 # 1. 설정
 url = "https://www.hyundai.com/wsvc/kr/front/biz/serviceNetwork.list.do"
@@ -33,157 +48,565 @@ regions = {
     "제주": "제주특별자치도"
 }
 
-all_data = []
-
-print("🔧 전체 데이터 수집 시작")
-   # 도명
-for region_alias, region_full_name in regions.items():
-    print(f"\n🔄 [{region_alias}] 수집 시작")
-
-    current_page = 1
-    total_pages = 1  # 일단 1로 시작해서 첫 요청 후 업데이트
-
-    while current_page <= total_pages:
-        # Payload 설정 (pageNo가 계속 변함)
-        payload = {
-            "pageNo": current_page,
-            "searchWord": "",
-            "snGubunListSearch": "",
-            "selectBoxCity": region_full_name,
-            "selectBoxCitySearch": region_full_name,
-            "selectBoxTownShipSearch": "",
-            "asnCd": ""
+
+# f12 개발자 도구 까서 확인한 것 !
+# 기본 정보: 'API_KEY': '컬럼명'
+BASE_MAP = {
+    'asnNm': 'name',
+    'apimCeqPlntNm': 'type',
+    'pbzAdrSbc': 'address',
+    'repnTn': 'phone',
+}
+COORD_KEYS = ('mapLaeVal', 'mapLoeVal')  # 위도/경도가 뒤바뀌어 오는 경우가 있어서 decode_items에서 보정
+
+# 서비스 플래그: 'API_KEY': 'DB 컬럼명'
+# 새 플래그는 여기에 한 줄만 추가하면 된다(crawl_output.FLAG_COLUMNS / DB 컬럼도 같이 추가).
+SERVICE_MAP = {
+    # 1. 친환경차 관련
+    'spcialSrvH003': 'is_ev',             # 전기차 수리
+    'spcialSrvC002': 'is_ev_tech',        # 전동차 기술력 우수
+    'spcialSrvH001': 'is_hydrogen',       # 수소 전기차 수리
+
+    # 2. 차체/도장 및 특수 수리
+    'spcialSrvC001': 'is_frame',          # 차체/도장 수리 인증
+    'spcialSrvC006': 'is_al_frame',       # 알루미늄 프레임 수리
+    'spcialSrvC009': 'is_n_line',         # 고성능 N 모델 수리
+
+    # 3. 상용차(트럭/버스) 관련
+    'spcialSrvC010': 'is_commercial_mid', # 중형 상용 수리
+    'spcialSrvC011': 'is_commercial_big', # 대형 상용 수리
+    'spcialSrvC012': 'is_commercial_ev',  # 상용 전동차 수리
+
+    # 4. CS 우수
+    'spcialSrvC003': 'is_cs_excellent',   # CS 우수 업체
+}
+
+PAGE_SIZE = 10  # 서버가 한 페이지에 10개씩 내려줌
+OUTPUT_PATH = "bluehands_final_all.parquet"  # 확장자(.parquet/.ndjson/.csv)로 형식 결정
+CHECKPOINT_PATH = "crawl_checkpoint.sqlite3"
+SNAPSHOT_ROW_COLUMNS = ["region", "name", "address"]  # 삭제 목록에 남길 식별 정보
+SNAPSHOT_PATH = "bluehands_snapshot.json"  # 지난 수집 결과(지점별 해시) - 변경 감지 기준
+DELTA_PATH = "bluehands_delta.csv"  # 지난 수집 대비 추가/변경/삭제 목록
+METRICS_PATH = "crawl_metrics.jsonl"  # 요청별 단계 소요 시간 (한 줄에 JSON 하나)
+
+# 동시 수집 설정
+# - 워커 수와 상관없이 전체 요청 속도는 토큰 버킷 하나로 제한한다(서버 부하 방지).
+DEFAULT_WORKERS = 8
+DEFAULT_RATE = 10.0  # 초당 요청 수(전체 공유)
+DEFAULT_BURST = 5  # 순간적으로 몰아서 보낼 수 있는 요청 수
+MAX_RETRIES = 3
+REQUEST_TIMEOUT = 10
+
+# --record 로 지정하면 받은 원본 응답(JSON)을 gzip으로 보관한다 (replay_server.py로 재생 가능)
+record_dir = None
+
+
+class TokenBucket:
+    """
+    목적:
+      - 모든 워커 스레드가 공유하는 요청 속도 제한기.
+      - 초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓인다.
+      - 토큰이 없으면 다음 토큰이 생길 때까지 기다린다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = float(rate)
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_s = (1 - self.tokens) / self.rate
+            time.sleep(wait_s)
+
+
+# 스레드마다 Session 하나씩 두고 재사용 (keep-alive로 TCP/TLS 핸드셰이크 절약)
+_local = threading.local()
+
+
+# --- 연결(TCP/TLS) 시간 측정용 커넥션 클래스 ---
+# requests는 연결 시간을 따로 알려주지 않아서, urllib3 커넥션의 connect()를 감싸서 스레드별로 더한다.
+# keep-alive로 재사용되면 connect()가 안 불리므로 0으로 남는다.
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _local.connect_s = getattr(_local, "connect_s", 0.0) + time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _local.connect_s = getattr(_local, "connect_s", 0.0) + time.perf_counter() - started
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
         }
 
+
+def get_session() -> requests.Session:
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(headers)
+        adapter = TimedAdapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _local.session = session
+    return session
+
+
+def build_payload(region_full_name: str, page_no: int) -> dict:
+    # Payload 설정 (pageNo가 계속 변함)
+    return {
+        "pageNo": page_no,
+        "searchWord": "",
+        "snGubunListSearch": "",
+        "selectBoxCity": region_full_name,
+        "selectBoxCitySearch": region_full_name,
+        "selectBoxTownShipSearch": "",
+        "asnCd": ""
+    }
+
+
+def archive_path(archive_dir: str, region_full_name: str, page_no: int) -> str:
+    # 원본 응답 보관 파일 이름 규칙 (replay_server.py도 같은 규칙으로 찾는다)
+    return os.path.join(archive_dir, f"{region_full_name}_{page_no:04d}.json.gz")
+
+
+def record_response(region_full_name: str, page_no: int, raw: bytes):
+    path = archive_path(record_dir, region_full_name, page_no)
+    tmp_path = path + ".tmp"
+    with gzip.open(tmp_path, "wb") as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+
+
+def fetch_page(limiter: TokenBucket, region_full_name: str, page_no: int, metrics: dict = None) -> dict:
+    """
+    목적:
+      - 한 페이지를 요청해서 응답의 data 블록(result, totalCount)을 돌려준다.
+      - 실패하면 잠깐 쉬었다가 MAX_RETRIES번까지 다시 시도하고, 그래도 안 되면 예외를 던진다.
+      - metrics(dict)를 넘기면 단계별 소요 시간/시도 횟수/바이트 수를 채워준다(crawl_metrics.PHASES).
+        시간은 마지막 시도 기준, 대기(throttle/backoff)는 전체 시도 합계.
+    """
+    if metrics is None:
+        metrics = {}
+    for key in ("throttle_s", "backoff_s", "connect_s", "wait_s", "download_s", "parse_s"):
+        metrics[key] = 0.0
+    metrics["bytes"] = 0
+
+    last_error = None
+    for attempt in range(1, MAX_RETRIES + 1):
+        metrics["attempts"] = attempt
+
+        t0 = time.perf_counter()
+        limiter.acquire()
+        t1 = time.perf_counter()
+        metrics["throttle_s"] += t1 - t0
+
+        _local.connect_s = 0.0
         try:
-            response = requests.post(url, data=payload, headers=headers)
+            # stream=True: 헤더 도착(서버 대기)과 본문 다운로드 시간을 나눠서 재기 위함
+            response = get_session().post(
+                url, data=build_payload(region_full_name, page_no), timeout=REQUEST_TIMEOUT, stream=True
+            )
+            t2 = time.perf_counter()
+            body = response.content
+            t3 = time.perf_counter()
+
+            metrics["status"] = response.status_code
+            metrics["connect_s"] = _local.connect_s
+            metrics["wait_s"] = t2 - t1 - _local.connect_s
+            metrics["download_s"] = t3 - t2
+            metrics["bytes"] += len(body)
 
             if response.status_code == 200:
-                data = response.json()
-                result_block = data.get('data', {})
-                items = result_block.get('result', [])
-
-                # 첫 페이지일 때만 전체 개수 확인해서 목표 페이지 설정
-                if current_page == 1:
-                    total_count = result_block.get('totalCount', 0)
-                    # 10개씩 보여주니까, 총 페이지 = (전체개수 / 10) 올림 처리
-                    total_pages = math.ceil(total_count / 10)
-                    print(f"   📊 총 {total_count}개 발견 (약 {total_pages} 페이지 예상)")
-
-                if not items:  # 데이터가 없으면 중단
-                    break
-
-                for item in items:
-                    # 좌표값 가져오기
-                    val1 = float(item.get('mapLaeVal', 0) or 0)
-                    val2 = float(item.get('mapLoeVal', 0) or 0)
-
-                    # 1. 좌표가 0이면 건너뛰기 (continue 필수!)
-                    if val1 == 0 or val2 == 0:
-                        print(f"   ⚠️ 좌표 누락된 데이터는 제외: {item.get('asnNm')}")
-                        continue  # 👈 이게 있어야 밑으로 안 내려가고 다음 루프로 넘어갑니다.
-
-                    # 2. 좌표 보정 (경도 127... 위도 37...)
-                    if val1 > 100:
-                        lon, lat = val1, val2
-                    else:
-                        lon, lat = val2, val1
-
-                    # f12 개발자 도구 까서 확인한 것 !
-                    info = {
-                        # --- 기본 정보 ---
-                        'region': region_alias,
-                        'name': item.get('asnNm'),
-                        'type': item.get('apimCeqPlntNm'),
-                        'address': item.get('pbzAdrSbc'),
-                        'phone': item.get('repnTn', '').strip(),
-                        'latitude': lat,
-                        'longitude': lon,
-
-                        # 1. 친환경차 관련
-                        'is_ev': 1 if item.get('spcialSrvH003', '').strip() == 'Y' else 0,  # 전기차 수리
-                        'is_ev_tech': 1 if item.get('spcialSrvC002', '').strip() == 'Y' else 0, # 전동차 기술력 우수
-                        'is_hydrogen': 1 if item.get('spcialSrvH001', '').strip() == 'Y' else 0,  # 수소 전기차 수리
-                        # 2. 차체/도장 및 특수 수리
-                        'is_frame': 1 if item.get('spcialSrvC001', '').strip() == 'Y' else 0,  # 차체/도장 수리 인증
-                        'is_al_frame': 1 if item.get('spcialSrvC006', '').strip() == 'Y' else 0,  # 알루미늄 프레임 수리
-                        'is_n_line': 1 if item.get('spcialSrvC009', '').strip() == 'Y' else 0,  # 고성능 N 모델 수리
-                        # 3. 상용차(트럭/버스) 관련
-                        'is_commercial_mid': 1 if item.get('spcialSrvC010', '').strip() == 'Y' else 0,  # 중형 상용 수리
-                        'is_commercial_big': 1 if item.get('spcialSrvC011', '').strip() == 'Y' else 0,  # 대형 상용 수리
-                        'is_commercial_ev': 1 if item.get('spcialSrvC012', '').strip() == 'Y' else 0,  # 상용 전동차 수리
-                        # 4. CS 우수
-                        'is_cs_excellent': 1 if item.get('spcialSrvC003', '').strip() == 'Y' else 0,  # CS 우수 업체
-                    }
-                    all_data.append(info)
-
-                # 진행 상황 출력 (너무 자주 찍으면 지저분하니 5페이지마다)
-                if current_page % 5 == 0:
-                    print(f"      ▶ {current_page}/{total_pages} 페이지 수집 중")
-
-                current_page += 1  # 다음 페이지로
-
-            else:
-                print(f"      ❌ 요청 실패: {response.status_code}")
-                break
-
-        except Exception as e:
-            print(f"      ⚠️ 에러 발생: {e}")
-            break
-
-        time.sleep(0.2)  # 서버 부하 방지
-
-    print(f"   ✅ [{region_alias}] 완료.")
-
-# 결과 저장
-print("=" * 50)
-df = pd.DataFrame(all_data)
-print(f"💾 최종 수집 결과: 총 {len(df)}개")
-print(df.groupby('region')['name'].count())  # 지역별 개수 확인
-print(df.head())
-
-# CSV 저장
-df.to_csv("bluehands_final_all.csv", index=False, encoding="utf-8-sig")
-print("\n 'bluehands_final_all.csv' 파일로 저장했습니다.")
-
-
-"""
-# 1. 매핑 정의 (코드 상단이나 별도 설정 파일에 둠)
-# 형식: 'API_KEY': 'DB_변수명'
-SERVICE_MAP = {
-    # 친환경
-    'spcialSrvH003': 'is_ev',             # 전기차
-    'spcialSrvC002': 'is_ev_tech',        # 전동차 기술 우수
-    'spcialSrvH001': 'is_hydrogen',       # 수소차
-    
-    # 차체/도장
-    'spcialSrvC001': 'is_frame',          # 차체/도장
-    'spcialSrvC006': 'is_al_frame',       # 알루미늄
-    'spcialSrvC009': 'is_n_line',         # N-Line
-    
-    # 상용차
-    'spcialSrvC010': 'is_commercial_mid', # 중형 상용
-    'spcialSrvC011': 'is_commercial_big', # 대형 상용
-    'spcialSrvC012': 'is_commercial_ev',  # 상용 전기
-    
-    # 기타
-    'spcialSrvC003': 'is_cs_excellent',   # CS 우수
-}
+                data = json.loads(body)
+                metrics["parse_s"] = time.perf_counter() - t3
+                if record_dir:
+                    record_response(region_full_name, page_no, body)
+                return data.get('data', {})
+            last_error = f"HTTP {response.status_code}"
+        except (requests.RequestException, ValueError) as e:
+            last_error = e
+        t4 = time.perf_counter()
+        time.sleep(0.5 * attempt)  # 재시도 전 대기 (점점 길게)
+        metrics["backoff_s"] += time.perf_counter() - t4
+    raise RuntimeError(f"{page_no}페이지 요청 실패 ({MAX_RETRIES}회 시도): {last_error}")
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def decode_items(region_alias: str, items: list) -> dict:
+    """
+    목적:
+      - 원본 item(dict) 목록(한 페이지든 한 지역 전체든)을 SERVICE_MAP 기준으로 한 번에 컬럼(numpy 배열)으로 바꾼다.
+      - item에서 값을 꺼내는 건 컬럼마다 한 번씩만 돌고, 좌표 보정/누락 제외/플래그 타입 변환은 배열 연산으로 처리한다.
+    반환:
+      - {컬럼명: numpy 배열}  (좌표 float64, 플래그 uint8, 문자열은 object)
+    """
+    n = len(items)
+
+    # 좌표값 가져오기 (숫자가 아니거나 비어 있으면 0)
+    val1 = np.array([_to_float(item.get(COORD_KEYS[0])) for item in items], dtype=np.float64)
+    val2 = np.array([_to_float(item.get(COORD_KEYS[1])) for item in items], dtype=np.float64)
+
+    # 1. 좌표가 0이면 제외
+    valid = (val1 != 0) & (val2 != 0)
+    for i in np.flatnonzero(~valid):
+        print(f"   ⚠️ 좌표 누락된 데이터는 제외: {items[i].get('asnNm')}")
+
+    # 2. 좌표 보정 (경도 127... 위도 37...) : 100보다 큰 쪽이 경도
+    swap = val1 > 100
+
+    columns = {"region": np.full(n, region_alias, dtype=object)}
+    for api_key, col in BASE_MAP.items():
+        columns[col] = np.array([item.get(api_key) for item in items], dtype=object)
+    columns["phone"] = np.array([(item.get("repnTn") or "").strip() for item in items], dtype=object)
+    columns["latitude"] = np.where(swap, val2, val1)
+    columns["longitude"] = np.where(swap, val1, val2)
+
+    # 3. 서비스 플래그: 값이 'Y'이면 1, 아니면 0
+    for api_key, col in SERVICE_MAP.items():
+        columns[col] = np.array([(item.get(api_key) or "").strip() == "Y" for item in items], dtype=np.uint8)
+
+    if valid.all():
+        return columns
+    return {col: values[valid] for col, values in columns.items()}
+
+
+def parse_items(region_alias: str, items: list) -> list[dict]:
+    # 체크포인트(JSON)/결과 writer/변경 감지는 행 단위 dict를 받으므로 마지막에 한 번 변환한다.
+    columns = decode_items(region_alias, items)
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(columns[col].tolist() for col in names))]
+
+
+class CrawlCheckpoint:
+    """
+    목적:
+      - 완료된 (지역, pageNo)와 그 페이지에서 나온 행들을 SQLite 파일에 저장한다.
+      - 중간에 실패해도 --resume으로 빠진 페이지만 다시 받아서 전체 결과를 만들 수 있다.
+    주의:
+      - sqlite3 연결은 만든 스레드에서만 써야 하므로, 기록은 메인 스레드(결과 수집 루프)에서만 한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS region_progress (
+                region      TEXT PRIMARY KEY,
+                total_pages INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                region    TEXT NOT NULL,
+                page_no   INTEGER NOT NULL,
+                rows_json TEXT NOT NULL,
+                PRIMARY KEY (region, page_no)
+            );
+        """)
+
+    def reset(self):
+        self.conn.execute("DELETE FROM region_progress")
+        self.conn.execute("DELETE FROM pages")
+        self.conn.commit()
+
+    def total_pages(self) -> dict:
+        cur = self.conn.execute("SELECT region, total_pages FROM region_progress")
+        return dict(cur.fetchall())
+
+    def done_pages(self) -> set:
+        cur = self.conn.execute("SELECT region, page_no FROM pages")
+        return set(cur.fetchall())
+
+    def save_total_pages(self, region_alias: str, total_pages: int):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO region_progress (region, total_pages) VALUES (?, ?)",
+            (region_alias, total_pages),
+        )
+        self.conn.commit()
+
+    def save_page(self, region_alias: str, page_no: int, rows: list[dict]):
+        # 페이지 하나 끝날 때마다 바로 commit (프로세스가 죽어도 여기까지는 남음)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pages (region, page_no, rows_json) VALUES (?, ?, ?)",
+            (region_alias, page_no, json.dumps(rows, ensure_ascii=False)),
+        )
+        self.conn.commit()
+
+    def missing_pages(self) -> list:
+        # 전체 페이지 수를 아는 지역은 빠진 페이지만, 1페이지도 못 받은 지역은 1페이지부터
+        totals = self.total_pages()
+        done = self.done_pages()
+        missing = []
+        for region_alias in regions:
+            if region_alias not in totals:
+                missing.append((region_alias, 1))
+                continue
+            for page_no in range(1, totals[region_alias] + 1):
+                if (region_alias, page_no) not in done:
+                    missing.append((region_alias, page_no))
+        return missing
+
+    def iter_pages(self):
+        # 이전 실행에서 받은 페이지를 한 페이지씩 꺼낸다 (전부 메모리에 올리지 않음)
+        region_order = {alias: i for i, alias in enumerate(regions)}
+        cur = self.conn.execute("SELECT region, page_no FROM pages")
+        keys = sorted(cur.fetchall(), key=lambda k: (region_order.get(k[0], len(region_order)), k[1]))
+        for region_alias, page_no in keys:
+            row = self.conn.execute(
+                "SELECT rows_json FROM pages WHERE region = ? AND page_no = ?", (region_alias, page_no)
+            ).fetchone()
+            yield region_alias, page_no, json.loads(row[0])
+
+    def close(self):
+        self.conn.close()
+
+
+def crawl_all(checkpoint: CrawlCheckpoint, on_page=None, workers: int = DEFAULT_WORKERS,
+              rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST, metrics: CrawlMetrics = None):
+    """
+    목적:
+      - 체크포인트에 없는 페이지만 동시에 요청한다(처음 실행이면 17개 지역의 1페이지부터).
+      - 1페이지에서 totalCount를 받으면 나머지 페이지를 한꺼번에 작업 큐에 넣는다.
+      - 요청 속도는 TokenBucket 하나로 전체 제한한다.
+      - 받은 페이지는 즉시 checkpoint에 기록하고 on_page(region_alias, pageNo, rows)로 넘긴다.
+      - metrics를 넘기면 요청마다 단계별 소요 시간을 기록한다.
+    반환:
+      - failed: [(region_alias, pageNo), ...]  재시도 후에도 실패한 페이지
+    """
+    limiter = TokenBucket(rate, burst)
+    failed = []
+    done = checkpoint.done_pages()
+    remaining = {}  # 지역별 남은 페이지 수 (완료 메시지 출력용)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+
+        def submit(region_alias, page_no):
+            remaining[region_alias] = remaining.get(region_alias, 0) + 1
+            request_metrics = new_request_metrics(region_alias, page_no)
+            fut = pool.submit(fetch_page, limiter, regions[region_alias], page_no, request_metrics)
+            pending[fut] = (region_alias, page_no, request_metrics)
+
+        for region_alias, page_no in checkpoint.missing_pages():
+            if region_alias not in remaining:
+                print(f"🔄 [{region_alias}] 수집 시작")
+            submit(region_alias, page_no)
+
+        while pending:
+            done_futs, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done_futs:
+                region_alias, page_no, request_metrics = pending.pop(fut)
+                remaining[region_alias] -= 1
+
+                try:
+                    result_block = fut.result()
+                except Exception as e:
+                    print(f"      ⚠️ [{region_alias}] 에러 발생: {e}")
+                    failed.append((region_alias, page_no))
+                else:
+                    # 첫 페이지일 때만 전체 개수 확인해서 나머지 페이지를 한 번에 요청
+                    if page_no == 1:
+                        total_count = result_block.get('totalCount', 0)
+                        # 10개씩 보여주니까, 총 페이지 = (전체개수 / 10) 올림 처리
+                        total_pages = math.ceil(total_count / PAGE_SIZE)
+                        print(f"   📊 [{region_alias}] 총 {total_count}개 발견 (약 {total_pages} 페이지 예상)")
+                        checkpoint.save_total_pages(region_alias, total_pages)
+                        for next_page in range(2, total_pages + 1):
+                            if (region_alias, next_page) not in done:
+                                submit(region_alias, next_page)
+
+                    items = result_block.get('result', [])
+                    t0 = time.perf_counter()
+                    rows = parse_items(region_alias, items)
+                    request_metrics["decode_s"] = time.perf_counter() - t0
+                    request_metrics["rows"] = len(rows)
+                    request_metrics["ok"] = True
+                    checkpoint.save_page(region_alias, page_no, rows)
+                    if on_page is not None:
+                        on_page(region_alias, page_no, rows)
+
+                if metrics is not None:
+                    metrics.record(request_metrics)
+
+                if remaining[region_alias] == 0:
+                    print(f"   ✅ [{region_alias}] 완료.")
+
+    return failed
+
+
+def load_snapshot(path: str) -> dict:
+    # 스냅샷 형식: {branch_key: {"hash": row_hash, "row": {...}}}
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("branches", {})
+
+
+def save_snapshot(path: str, branches: dict):
+    # 쓰는 도중 죽어도 이전 스냅샷이 깨지지 않게 임시 파일에 쓰고 교체한다.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"created_at": time.strftime("%Y-%m-%d %H:%M:%S"), "branches": branches}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class DeltaTracker:
+    """
+    목적:
+      - 페이지가 들어올 때마다 지난 스냅샷과 비교해서 추가(insert)/변경(update)을 바로 delta writer로 보낸다.
+      - 지점 식별은 branch_key(지점명+주소), 변경 여부는 row_hash(좌표/전화/플래그 포함)로 판단한다.
+      - 수집이 끝나면 finish()에서 이번에 안 보인 지점을 삭제(delete)로 보낸다.
+      - 스냅샷에는 해시와 식별용 컬럼(지역/지점명/주소)만 남겨서 메모리를 작게 유지한다.
+    """
+
+    def __init__(self, old_branches: dict, writer: CrawlOutputWriter):
+        self.old_branches = old_branches
+        self.new_branches = {}
+        self.writer = writer
+        self.counts = Counter()
+
+    def add_rows(self, rows: list[dict]):
+        changed = []
+        for row in rows:
+            key = branch_key(row.get('name'), row.get('address'))
+            if key in self.new_branches:
+                print(f"   ⚠️ 지점명+주소가 같은 데이터가 중복됨(마지막 값 사용): {row.get('name')}")
+            h = row_hash(row)
+            self.new_branches[key] = {"hash": h, "row": {col: row.get(col) for col in SNAPSHOT_ROW_COLUMNS}}
+
+            old = self.old_branches.get(key)
+            if old is None:
+                changed.append({"change": "insert", "branch_key": key, **row})
+            elif old["hash"] != h:
+                changed.append({"change": "update", "branch_key": key, **row})
+        for row in changed:
+            self.counts[row["change"]] += 1
+        self.writer.write_rows(changed)
+
+    def finish(self):
+        deleted = [
+            {"change": "delete", "branch_key": key, **old["row"]}
+            for key, old in self.old_branches.items()
+            if key not in self.new_branches
+        ]
+        self.counts["delete"] += len(deleted)
+        self.writer.write_rows(deleted)
+
+
+def main():
+    global url, record_dir
+
+    parser = argparse.ArgumentParser(description="블루핸즈 지점 전체 수집")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 요청 스레드 수 (1이면 순차 수집)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="초당 최대 요청 수 (전체 공유)")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST, help="순간 최대 요청 수")
+    parser.add_argument("--output", default=OUTPUT_PATH, help="저장할 결과 파일 (.parquet / .ndjson / .csv)")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH, help="진행 상황 저장 파일(SQLite)")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에 없는 페이지만 이어서 수집")
+    parser.add_argument("--snapshot", default=SNAPSHOT_PATH, help="변경 감지 기준 스냅샷(JSON)")
+    parser.add_argument("--delta", default=DELTA_PATH, help="추가/변경/삭제 목록 파일 (.parquet / .ndjson / .csv)")
+    parser.add_argument("--url", default=url, help="요청 주소 (replay_server.py로 오프라인 재생할 때 변경)")
+    parser.add_argument("--record", default=None, help="원본 응답을 gzip으로 보관할 폴더")
+    parser.add_argument("--metrics", default=METRICS_PATH, help="요청별 소요 시간을 기록할 파일(JSON lines)")
+    args = parser.parse_args()
+
+    url = args.url
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+        record_dir = args.record
+
+    checkpoint = CrawlCheckpoint(args.checkpoint)
+    metrics = CrawlMetrics(args.metrics)
+    writer = CrawlOutputWriter(args.output)
+    delta = DeltaTracker(load_snapshot(args.snapshot), CrawlOutputWriter(args.delta, columns=DELTA_COLUMNS))
+
+    def on_page(region_alias, page_no, rows):
+        # 페이지가 도착하는 대로 결과 파일/변경 감지로 흘려보낸다 (전체를 메모리에 모으지 않음)
+        writer.write_rows(rows)
+        delta.add_rows(rows)
+
+    committed = False  # 결과 파일을 확정했는지 (아니면 finally에서 임시 파일을 지운다)
+    missing = []
+    try:
+        if args.resume:
+            print(f"🔧 이어서 수집 시작 (이미 받은 페이지 {len(checkpoint.done_pages())}개)")
+            for region_alias, page_no, rows in checkpoint.iter_pages():
+                on_page(region_alias, page_no, rows)
+        else:
+            checkpoint.reset()
+            print("🔧 전체 데이터 수집 시작")
+
+        started = time.perf_counter()
+        crawl_all(checkpoint, on_page=on_page, workers=args.workers, rate=args.rate, burst=args.burst,
+                  metrics=metrics)
+        elapsed = time.perf_counter() - started
+        metrics.print_summary(elapsed)
+
+        print("=" * 50)
+        # 실패한 페이지가 남아 있으면 불완전한 결과 파일로 덮어쓰지 않는다.
+        missing = checkpoint.missing_pages()
+        if not missing:
+            page_count = len(checkpoint.done_pages())
+            writer.commit()
+            delta.finish()
+            delta.writer.commit()
+            save_snapshot(args.snapshot, delta.new_branches)
+            committed = True
+    finally:
+        # 정리는 여기서만 한다 (예외 / 빠진 페이지 / 정상 종료 모두)
+        if not committed:
+            writer.abort()
+            delta.writer.abort()
+        checkpoint.close()
+        metrics.close()
+
+    if missing:
+        print(f"⚠️ 받지 못한 페이지 {len(missing)}개: {missing}")
+        print("   '--resume' 옵션으로 다시 실행하면 빠진 페이지만 이어서 수집합니다.")
+        sys.exit(1)
+
+    # 결과 요약
+    print(f"💾 최종 수집 결과: 총 {writer.rows_written}개 ({page_count} 페이지, {elapsed:.1f}초)")
+    for region_alias in regions:
+        print(f"   {region_alias}: {writer.region_counts.get(region_alias, 0)}")  # 지역별 개수 확인
+    print(f"\n '{args.output}' 파일로 저장했습니다.")
+    print(
+        f" 🔁 변경 감지: 추가 {delta.counts['insert']} / 변경 {delta.counts['update']} / "
+        f"삭제 {delta.counts['delete']} → '{args.delta}'"
+    )
 
-# 2. 데이터 처리 (info 생성 부분)
-info = {
-    'region': region_alias,
-    'name': item.get('asnNm'),
-    'type': item.get('apimCeqPlntNm'),
-    'address': item.get('pbzAdrSbc'),
-    'phone': item.get('repnTn', '').strip(),
-    'latitude': lat,
-    'longitude': lon,
-}
 
-# ⭐ 핵심: 반복문으로 자동 처리 (지저분한 if-else 제거)
-for api_key, db_field in SERVICE_MAP.items():
-    # 값이 'Y'이면 1, 아니면 0
-    raw_val = item.get(api_key, '').strip()
-    info[db_field] = 1 if raw_val == 'Y' else 0
-    """
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,47 @@
 # File: import_csv_to_mysql.py
 # 목적:
-#  - bluehands_final_all.csv 를 읽어서
+#  - 크롤러 결과(bluehands_final_all.parquet / .ndjson / .csv)를 읽어서
 #    regions / service_types / bluehands 테이블에 "정규화"된 형태로 적재한다.
 #
 # 전제:
 #  - pandas를 임포트 해야한다.
 #  - CSV는 크롤러 단계에서 이미 전처리 완료(위경도 float, 플래그 0/1)라고 가정한다.
+#  - 파일 형식은 확장자로 판단한다(crawl_output.read_crawl_output). parquet은 타입이 같이 저장돼 있어
+#    dtype 추론 없이 바로 읽힌다(pyarrow 필요).
 #  - MySQL에 bluehands_db 및 테이블 3개(regions, service_types, bluehands)가 생성되어 있어야 한다.
 #
+# 실행 모드:
+#  - 기본      : 전체 INSERT (빈 테이블에 처음 적재할 때. 이미 있는 지점이면 branch_key 중복으로 실패)
+#  - --incremental : branch_key(지점명+주소) 기준 upsert. row_hash가 달라진 지점만 쓰고,
+#                    입력에서 사라진 지점은 deleted_at만 기록(soft delete)한다. 야간 갱신용.
+#  - --bulk        : 전체 INSERT를 executemany 대신 LOAD DATA LOCAL INFILE(임시 TSV)로 적재.
+#                    auto(기본)면 행 수가 BULK_LOAD_THRESHOLD 이상일 때만 사용한다.
+#                    서버에 local_infile=ON 설정이 필요하다.
+#  - --chunksize N : 파일을 N행씩 읽어서 정리 -> upsert -> commit 을 반복(메모리/락 시간 일정).
+#                    진행 상황은 import_progress 테이블에 chunk마다 같이 commit 되므로,
+#                    중간에 실패하면 --resume으로 마지막 commit 다음 chunk부터 이어서 넣는다.
+#  - --swap        : 라이브 bluehands는 건드리지 않고 bluehands_staging에 전체를 적재/검증한 뒤
+#                    RENAME TABLE 한 번으로 교체(blue/green). 직전 세대는 bluehands_old로 남겨서
+#                    --rollback-swap으로 즉시 되돌릴 수 있다. 앱은 적재 중에도 이전 데이터를 그대로 읽는다.
+#  - --workers N   : 전체 INSERT를 시/도(region)별로 나눠서 N개 프로세스가 동시에 적재(프로세스마다 연결 1개).
+#                    regions/service_types는 먼저 한 번만 채우고 commit. 실패한 지역만 rollback 되고 보고된다.
+#
 # 주의:
 #  - DB 비번을 절대 git에 올리지 말 것(로컬에서만 사용).
 #  - 가능하면 환경변수(.env)로 분리하고 .gitignore 처리.
 
 import os
 import sys
-import re
+import argparse
+import csv
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import pymysql
 from dotenv import load_dotenv  # .env 로드
+from crawl_output import FLAG_COLUMNS, iter_crawl_output, read_crawl_output
+from branch_hash import branch_key, row_hashes
 
 load_dotenv()
 # ===== 사용자 설정(필요시 수정) =====
@@ -27,9 +51,10 @@ MYSQL_PORT = int(os.getenv("MYSQL_PORT", "3306"))
 MYSQL_USER = os.getenv("MYSQL_USER")
 MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")  # 로컬 테스트용. git 커밋 금지.
 MYSQL_DB = os.getenv("MYSQL_DB")
+# 크롤러 결과 파일 경로 (.parquet / .ndjson / .csv 모두 가능)
 CSV_PATH = os.getenv(
     "CSV_PATH",
-    os.path.join(os.path.dirname(__file__), "bluehands_final_all.csv")
+    os.path.join(os.path.dirname(__file__), "bluehands_final_all.parquet")
 )
 
 
@@ -53,6 +78,27 @@ COL_IS_COMMERCIAL_BIG = "is_commercial_big"
 COL_IS_COMMERCIAL_EV = "is_commercial_ev"
 COL_IS_CS_EXCELLENT = "is_cs_excellent"
 
+# ===== bluehands INSERT 컬럼(순서 = VALUES 순서) =====
+BLUEHANDS_COLUMNS = [
+    "name", "region_id", "type_id",
+    "address", "phone", "latitude", "longitude",
+    "is_ev", "is_ev_tech", "is_hydrogen",
+    "is_frame", "is_al_frame", "is_n_line",
+    "is_commercial_mid", "is_commercial_big", "is_commercial_ev",
+    "is_cs_excellent",
+    "branch_key", "row_hash",
+]
+
+# blue/green 적재용 테이블 이름
+STAGING_TABLE = "bluehands_staging"
+PREVIOUS_TABLE = "bluehands_old"
+
+# 이 행 수 이상이면 --bulk auto가 LOAD DATA 경로를 쓴다(그 아래는 executemany가 더 간단하고 충분히 빠름)
+BULK_LOAD_THRESHOLD = int(os.getenv("BULK_LOAD_THRESHOLD", "5000"))
+
+# 증분 적재 시 한 번에 soft delete 할 수 있는 최대 비율(입력 파일이 잘못됐을 때 전체가 지워지는 사고 방지)
+MAX_DELETE_RATIO = 0.5
+
 
 def die(msg: str) -> None:
     # 목적:
@@ -61,10 +107,11 @@ def die(msg: str) -> None:
     sys.exit(1)
 
 
-def connect_mysql():
+def connect_mysql(local_infile: bool = False):
     # 목적:
     #  - pymysql로 MySQL 연결을 만든다.
     #  - autocommit=False로 두고, 성공 시 commit / 실패 시 rollback으로 안전하게 처리한다.
+    #  - LOAD DATA LOCAL INFILE을 쓸 때만 local_infile=True (클라이언트 쪽 허용)
     return pymysql.connect(
         host=MYSQL_HOST,
         port=MYSQL_PORT,
@@ -74,57 +121,61 @@ def connect_mysql():
         charset="utf8mb4",
         autocommit=False,
         cursorclass=pymysql.cursors.DictCursor,
+        local_infile=local_infile,
     )
 
 
-def normalize_str(x):
+def normalize_str(col: pd.Series) -> pd.Series:
     # 목적:
-    #  - CSV에서 읽은 값 중 None/NaN/빈문자열을 모두 None으로 통일한다.
+    #  - 읽은 값 중 None/NaN/빈문자열을 모두 None으로 통일한다.
     #  - 문자열은 좌우 공백을 제거한다.
-    if x is None:
-        return None
-    if isinstance(x, float) and pd.isna(x):
-        return None
-    s = str(x).strip()
-    return s if s != "" else None
+    #  - 셀마다 파이썬 함수를 부르지 않고 pandas .str 연산으로 컬럼 전체를 한 번에 처리한다.
+    s = col.astype("string").str.strip()
+    s = s.mask(s == "")
+    return s.astype(object).where(s.notna(), None)
+
 
+def _join_digits(digits: pd.Series, cuts: list[int]) -> pd.Series:
+    # digits를 cuts 위치에서 잘라 하이픈으로 잇는다. 예: cuts=[3, 7] -> "010-1234-5678"
+    bounds = [0] + cuts + [None]
+    parts = [digits.str[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+    out = parts[0]
+    for part in parts[1:]:
+        out = out + "-" + part
+    return out
 
-def format_phone_kor(x):
+
+def format_phone_kor(col: pd.Series) -> pd.Series:
     # 목적:
     #  - 전화번호를 "문자열"로 저장하기 위해 하이픈(-)을 넣어준다.
-    #  - CSV에서 이미 하이픈이 들어있어도 OK (숫자만 추출 후 재포맷).
+    #  - 이미 하이픈이 들어있어도 OK (숫자만 추출 후 재포맷).
     #  - 규칙(대표):
     #     010XXXXXXXX  -> 010-XXXX-XXXX
     #     02XXXXXXXX   -> 02-XXXX-XXXX (또는 02-XXX-XXXX)
     #     0XXYYYYYYYY  -> 0XX-YYY-YYYY (또는 0XX-XXXX-XXXX)
     #  - 매칭이 애매하면 원문(정리된 숫자) 그대로 반환한다.
-    s = normalize_str(x)
-    if s is None:
-        return None
-
-    digits = re.sub(r"[^0-9]", "", s)
-    if digits == "":
-        return None
-
-    # 휴대폰 010 (11자리)
-    if len(digits) == 11 and digits.startswith("010"):
-        return f"{digits[0:3]}-{digits[3:7]}-{digits[7:11]}"
-
-    # 서울 02 (9~10자리)
-    if digits.startswith("02"):
-        if len(digits) == 9:
-            return f"{digits[0:2]}-{digits[2:5]}-{digits[5:9]}"
-        if len(digits) == 10:
-            return f"{digits[0:2]}-{digits[2:6]}-{digits[6:10]}"
+    #  - 규칙별 마스크를 만들어서 컬럼 단위로 한 번에 포맷한다(위에 있는 규칙이 우선).
+    digits = normalize_str(col).astype("string").str.replace(r"[^0-9]", "", regex=True)
+    digits = digits.mask(digits == "")
+    n = digits.str.len()
+
+    rules = [
+        ((n == 11) & digits.str.startswith("010"), [3, 7]),  # 휴대폰 010 (11자리)
+        (digits.str.startswith("02") & (n == 9), [2, 5]),    # 서울 02 (9자리)
+        (digits.str.startswith("02") & (n == 10), [2, 6]),   # 서울 02 (10자리)
+        (n == 10, [3, 6]),                                   # 그 외 지역번호(보통 3자리) + 국번
+        (n == 11, [3, 7]),
+    ]
 
-    # 그 외 지역번호(보통 3자리) + 국번
-    if len(digits) == 10:
-        return f"{digits[0:3]}-{digits[3:6]}-{digits[6:10]}"
-    if len(digits) == 11:
-        return f"{digits[0:3]}-{digits[3:7]}-{digits[7:11]}"
+    out = digits.copy()  # 기타(대표번호 1588 등) / 예외 케이스는 숫자만
+    done = pd.Series(False, index=digits.index)
+    for mask, cuts in rules:
+        mask = mask.fillna(False).astype(bool) & ~done
+        if mask.any():
+            out[mask] = _join_digits(digits[mask], cuts)
+        done |= mask
 
-    # 기타(대표번호 1588 등) / 예외 케이스는 숫자만 반환
-    return digits
+    return out.astype(object).where(out.notna(), None)
 
 
 def ensure_required_columns(df: pd.DataFrame):
@@ -168,70 +219,512 @@ def load_name_to_id(cur, table_name: str) -> dict:
     return {r["name"]: r["id"] for r in rows}
 
 
-def insert_bluehands(cur, rows: list[dict]):
+def extend_name_to_id(cur, table_name: str, names: list[str], mapping: dict):
+    # 목적:
+    #  - chunk 단위 적재용. 처음 보는 이름만 차원 테이블에 넣고, 그 이름들의 id만 다시 읽어서 mapping에 추가한다.
+    #    (chunk마다 테이블 전체를 다시 읽지 않음)
+    new_names = [n for n in names if n not in mapping]
+    if not new_names:
+        return
+    insert_dim_table(cur, table_name, new_names)
+    placeholders = ", ".join(["%s"] * len(new_names))
+    cur.execute(f"SELECT id, name FROM {table_name} WHERE name IN ({placeholders})", new_names)
+    mapping.update({r["name"]: r["id"] for r in cur.fetchall()})
+
+
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # 목적:
+    #  - 문자열 정리(공백/빈값/NaN -> None), 전화번호 포맷, 필수값 없는 행 제거까지 컬럼 단위로 처리한다.
+    df = df.copy()
+    for col in [COL_REGION, COL_NAME, COL_TYPE, COL_ADDRESS]:
+        df[col] = normalize_str(df[col])
+
+    # phone은 하이픈 포맷까지 적용(문자열로 저장)
+    df[COL_PHONE] = format_phone_kor(df[COL_PHONE])
+
+    # 필수값이 비어있는 행 제거(최소한 region/name/type는 있어야 함)
+    return df.dropna(subset=[COL_REGION, COL_NAME, COL_TYPE])
+
+
+def build_bluehands_frame(df: pd.DataFrame, region_map: dict, type_map: dict) -> pd.DataFrame:
     # 목적:
-    #  - bluehands 테이블에 데이터를 bulk insert 한다.
+    #  - 정리된 DataFrame을 BLUEHANDS_COLUMNS 컬럼만 가진 적재용 DataFrame으로 바꾼다.
+    #  - 위경도/플래그는 크롤러 단계에서 이미 전처리 완료라고 가정.
+    #    다만 NaN으로 들어올 수 있으니 위경도 NaN -> None, 플래그 NaN -> 0 정도만 최소 방어.
+    #  - 증분 적재용 branch_key / row_hash도 여기서 같이 계산한다.
+    out = pd.DataFrame(index=df.index)
+    out["name"] = df[COL_NAME]
+    out["region_id"] = df[COL_REGION].map(region_map)
+    out["type_id"] = df[COL_TYPE].map(type_map)
+    out["address"] = df[COL_ADDRESS]
+    out["phone"] = df[COL_PHONE]
+    for col in [COL_LAT, COL_LNG]:
+        values = pd.to_numeric(df[col], errors="coerce")
+        out[col] = values.astype(object).where(values.notna(), None)
+    for col in FLAG_COLUMNS:
+        out[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype("uint8")
+
+    # 차원 테이블에 없는 값은 제외
+    keep = out["region_id"].notna() & out["type_id"].notna()
+    out = out[keep]
+    out["region_id"] = out["region_id"].astype("int64")
+    out["type_id"] = out["type_id"].astype("int64")
+
+    out["branch_key"] = [branch_key(n, a) for n, a in zip(out["name"].tolist(), out["address"].tolist())]
+    out["row_hash"] = row_hashes({**dict(out.items()), COL_REGION: df.loc[keep, COL_REGION], COL_TYPE: df.loc[keep, COL_TYPE]})
+
+    # 같은 지점(지점명+주소)이 두 번 나오면 마지막 행만 남긴다(branch_key는 UNIQUE).
+    deduped = out.drop_duplicates(subset="branch_key", keep="last")
+    if len(deduped) != len(out):
+        print(f"[WARN] 지점명+주소가 중복된 행 {len(out) - len(deduped)}개는 마지막 값만 사용합니다.")
+    return deduped[BLUEHANDS_COLUMNS]
+
+
+def frame_to_tuples(frame: pd.DataFrame, columns: list[str] = BLUEHANDS_COLUMNS) -> list[tuple]:
+    # 목적:
+    #  - 컬럼 배열을 zip 해서 executemany용 튜플 리스트를 바로 만든다(행마다 dict를 만들지 않음).
+    #  - tolist()가 numpy 값을 파이썬 int/float/str로 바꿔주므로 드라이버에 그대로 넘길 수 있다.
+    return list(zip(*(frame[c].tolist() for c in columns)))
+
+
+def insert_bluehands(cur, frame: pd.DataFrame, table: str = "bluehands"):
+    # 목적:
+    #  - bluehands(또는 staging) 테이블에 데이터를 bulk insert 한다. 컬럼은 frame 컬럼 그대로.
     # 전제:
     #  - DB 스키마는 최신 컬럼을 모두 가지고 있다고 가정한다(동적 컬럼 감지 제거).
-    sql = """
-    INSERT INTO bluehands (
-        name, region_id, type_id,
-        address, phone, latitude, longitude,
-        is_ev, is_ev_tech, is_hydrogen,
-        is_frame, is_al_frame, is_n_line,
-        is_commercial_mid, is_commercial_big, is_commercial_ev,
-        is_cs_excellent
-    ) VALUES (
-        %s, %s, %s,
-        %s, %s, %s, %s,
-        %s, %s, %s,
-        %s, %s, %s,
-        %s, %s, %s,
-        %s
+    columns = list(frame.columns)
+    col_sql = ", ".join(columns)
+    val_sql = ", ".join(["%s"] * len(columns))
+    sql = f"INSERT INTO {table} ({col_sql}) VALUES ({val_sql})"
+
+    data = frame_to_tuples(frame, columns)
+    if data:
+        cur.executemany(sql, data)
+
+
+def write_bluehands_tsv(frame: pd.DataFrame, path: str):
+    # 목적:
+    #  - LOAD DATA용 임시 TSV를 frame 컬럼 순서로 쓴다(헤더 없음).
+    #  - LOAD DATA 기본 규칙: NULL은 \N, 역슬래시/탭/줄바꿈은 역슬래시로 이스케이프
+    out = frame.copy()
+    for col in ["name", "address", "phone", "branch_key", "row_hash"]:
+        s = out[col].astype("string")
+        for raw, escaped in [("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r")]:
+            s = s.str.replace(raw, escaped, regex=False)
+        out[col] = s
+    out.to_csv(path, sep="\t", header=False, index=False, na_rep="\\N",
+               quoting=csv.QUOTE_NONE, lineterminator="\n", encoding="utf-8")
+
+
+def validate_bluehands_load(cur, table: str = "bluehands", region_id: int = None):
+    # 목적:
+    #  - FK/UNIQUE 검사를 끄고 적재했으므로, 적재 후에 직접 확인한다.
+    #  - 문제가 있으면 예외를 던져서 main()에서 rollback 되게 한다.
+    #  - region_id를 주면 그 지역 행만 검사한다(지역별 병렬 적재에서 자기 몫만 확인).
+    region_sql = "" if region_id is None else f" AND a.region_id = {int(region_id)}"
+    cur.execute(f"""
+        SELECT COUNT(*) AS cnt
+          FROM {table} a
+          LEFT JOIN regions r ON a.region_id = r.id
+          LEFT JOIN service_types t ON a.type_id = t.id
+         WHERE (r.id IS NULL OR t.id IS NULL){region_sql}
+    """)
+    orphans = cur.fetchone()["cnt"]
+    if orphans:
+        raise RuntimeError(f"regions/service_types에 없는 id를 가진 행 {orphans}개")
+
+    cur.execute(f"""
+        SELECT COUNT(*) AS cnt
+          FROM (SELECT branch_key FROM {table} a WHERE 1 = 1{region_sql}
+                GROUP BY branch_key HAVING COUNT(*) > 1) d
+    """)
+    duplicates = cur.fetchone()["cnt"]
+    if duplicates:
+        raise RuntimeError(f"branch_key 중복 {duplicates}건")
+
+
+def load_bluehands_bulk(cur, frame: pd.DataFrame, table: str = "bluehands", region_id: int = None):
+    # 목적:
+    #  - 행 수가 많을 때 executemany 대신 LOAD DATA LOCAL INFILE로 한 번에 적재한다.
+    #    (행마다 튜플/파라미터 바인딩을 만들지 않고, 서버가 파일을 직접 파싱)
+    #  - 적재하는 동안만 FK/UNIQUE 검사를 끄고, 끝나면 되돌린 뒤 validate_bluehands_load()로 검증.
+    if frame.empty:
+        return
+
+    fd, tsv_path = tempfile.mkstemp(prefix="bluehands_", suffix=".tsv")
+    os.close(fd)
+    try:
+        write_bluehands_tsv(frame, tsv_path)
+
+        cur.execute("SET SESSION foreign_key_checks = 0")
+        cur.execute("SET SESSION unique_checks = 0")
+        try:
+            loaded = cur.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+                f"CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+                f"LINES TERMINATED BY '\\n' "
+                f"({', '.join(frame.columns)})",
+                (tsv_path,),
+            )
+        finally:
+            cur.execute("SET SESSION unique_checks = 1")
+            cur.execute("SET SESSION foreign_key_checks = 1")
+    finally:
+        os.remove(tsv_path)
+
+    if loaded != len(frame):
+        raise RuntimeError(f"LOAD DATA 적재 행 수 불일치: {loaded} / {len(frame)}")
+    validate_bluehands_load(cur, table, region_id)
+
+
+def upsert_bluehands(cur, frame: pd.DataFrame):
+    # 목적:
+    #  - branch_key(UNIQUE) 기준으로 없으면 INSERT, 있으면 값 갱신 + soft delete 해제.
+    col_sql = ", ".join(BLUEHANDS_COLUMNS)
+    val_sql = ", ".join(["%s"] * len(BLUEHANDS_COLUMNS))
+    update_sql = ", ".join(f"{c} = VALUES({c})" for c in BLUEHANDS_COLUMNS if c != "branch_key")
+    sql = (
+        f"INSERT INTO bluehands ({col_sql}) VALUES ({val_sql}) "
+        f"ON DUPLICATE KEY UPDATE {update_sql}, deleted_at = NULL"
     )
-    """
-
-    data = []
-    for r in rows:
-        data.append((
-            r["name"], r["region_id"], r["type_id"],
-            r["address"], r["phone"], r["latitude"], r["longitude"],
-            r["is_ev"], r["is_ev_tech"], r["is_hydrogen"],
-            r["is_frame"], r["is_al_frame"], r["is_n_line"],
-            r["is_commercial_mid"], r["is_commercial_big"], r["is_commercial_ev"],
-            r["is_cs_excellent"],
-        ))
 
+    data = frame_to_tuples(frame)
     if data:
         cur.executemany(sql, data)
 
 
-def main():
-    # 0) CSV 파일 존재 확인
-    if not os.path.exists(CSV_PATH):
-        die(f"CSV 파일을 찾을 수 없습니다: {CSV_PATH}")
+def load_existing_branches(cur) -> dict:
+    # 목적:
+    #  - DB에 있는 지점의 "branch_key -> (row_hash, 삭제여부)" 매핑을 만든다.
+    cur.execute("SELECT branch_key, row_hash, deleted_at IS NOT NULL AS is_deleted FROM bluehands")
+    return {r["branch_key"]: (r["row_hash"], bool(r["is_deleted"])) for r in cur.fetchall()}
 
-    # 1) CSV 로드 + 헤더 검증
-    df = pd.read_csv(CSV_PATH, encoding="utf-8")
-    ensure_required_columns(df)
 
-    # 2) 문자열 컬럼 정리(공백/빈값/NaN -> None)
-    df[COL_REGION] = df[COL_REGION].apply(normalize_str)
-    df[COL_NAME] = df[COL_NAME].apply(normalize_str)
-    df[COL_TYPE] = df[COL_TYPE].apply(normalize_str)
-    df[COL_ADDRESS] = df[COL_ADDRESS].apply(normalize_str)
+def soft_delete_branches(cur, keys: list[str], batch_size: int = 500):
+    # 목적:
+    #  - 입력에서 사라진 지점을 지우지 않고 deleted_at만 기록한다.
+    for i in range(0, len(keys), batch_size):
+        batch = keys[i:i + batch_size]
+        placeholders = ", ".join(["%s"] * len(batch))
+        cur.execute(
+            f"UPDATE bluehands SET deleted_at = NOW() "
+            f"WHERE deleted_at IS NULL AND branch_key IN ({placeholders})",
+            batch,
+        )
+
+
+def import_incremental(cur, frame: pd.DataFrame, force: bool = False) -> dict:
+    # 목적:
+    #  - 바뀐 지점만 upsert 하고, 사라진 지점은 soft delete 한다.
+    #  - 변경 없는 행은 아예 보내지 않아서 쓰기/락 시간을 최소화한다.
+    existing = load_existing_branches(cur)
+    live_keys = {k for k, (_, is_deleted) in existing.items() if not is_deleted}
+
+    old_hash = frame["branch_key"].map({k: h for k, (h, _) in existing.items()})
+    was_deleted = frame["branch_key"].map({k: d for k, (_, d) in existing.items()}).fillna(False).astype(bool)
+    is_new = old_hash.isna()
+    is_changed = ~is_new & ((old_hash != frame["row_hash"]) | was_deleted)
+    deleted = sorted(live_keys - set(frame["branch_key"].tolist()))
+
+    if live_keys and len(deleted) > len(live_keys) * MAX_DELETE_RATIO and not force:
+        die(
+            f"입력에 없는 지점이 {len(deleted)}/{len(live_keys)}개입니다. 입력 파일이 맞는지 확인하세요. "
+            "(의도한 것이면 --force)"
+        )
+
+    upsert_bluehands(cur, frame[is_new | is_changed])
+    soft_delete_branches(cur, deleted)
+    return {
+        "inserted": int(is_new.sum()),
+        "updated": int(is_changed.sum()),
+        "deleted": len(deleted),
+        "unchanged": int(len(frame) - is_new.sum() - is_changed.sum()),
+    }
 
-    # phone은 하이픈 포맷까지 적용(문자열로 저장)
-    df[COL_PHONE] = df[COL_PHONE].apply(format_phone_kor)
 
+def _import_region_partition(region_id: int, frame: pd.DataFrame, use_bulk: bool) -> dict:
+    # 목적:
+    #  - 병렬 적재 작업 1개(= 지역 1개). 자기 연결/트랜잭션으로 적재하고 commit.
+    #  - 실패하면 이 지역만 rollback 하고 에러를 결과로 돌려준다(다른 지역은 계속 진행).
+    started = time.perf_counter()
+    conn = connect_mysql(local_infile=use_bulk)
+    try:
+        with conn.cursor() as cur:
+            if use_bulk:
+                load_bluehands_bulk(cur, frame, region_id=region_id)
+            else:
+                insert_bluehands(cur, frame)
+        conn.commit()
+        error = None
+    except Exception as e:
+        conn.rollback()
+        error = str(e)
+    finally:
+        conn.close()
+    return {"region_id": region_id, "rows": len(frame), "seconds": time.perf_counter() - started, "error": error}
+
+
+def import_parallel(frame: pd.DataFrame, use_bulk: bool, workers: int) -> list[dict]:
+    # 목적:
+    #  - region_id별로 나눈 파티션을 workers개 프로세스가 동시에 적재한다.
+    #  - 큰 지역부터 넣어서 마지막에 큰 지역 하나만 혼자 도는 상황을 줄인다.
+    #  - branch_key 중복은 build_bluehands_frame에서 이미 제거했으므로 파티션끼리 겹치지 않는다.
+    partitions = sorted(frame.groupby("region_id"), key=lambda p: len(p[1]), reverse=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(partitions))) as pool:
+        futures = [
+            pool.submit(_import_region_partition, int(region_id), part, use_bulk)
+            for region_id, part in partitions
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results
+
+
+def assign_stable_ids(cur, frame: pd.DataFrame) -> pd.DataFrame:
+    # 목적:
+    #  - staging에 넣을 때 기존 지점은 라이브 테이블의 id를 그대로 쓰고, 새 지점만 max(id) 다음 번호를 준다.
+    #    (교체 후에도 앱이 들고 있는 지점 id가 같은 지점을 가리키게)
+    cur.execute("SELECT id, branch_key FROM bluehands")
+    rows = cur.fetchall()
+    ids = frame["branch_key"].map({r["branch_key"]: r["id"] for r in rows})
+    next_id = max((r["id"] for r in rows), default=0) + 1
+    is_new = ids.isna()
+    ids[is_new] = range(next_id, next_id + int(is_new.sum()))
+
+    frame = frame.copy()
+    frame.insert(0, "id", ids.astype("int64"))
+    return frame
+
+
+def count_rows(cur, table: str, where: str = "1 = 1") -> int:
+    cur.execute(f"SELECT COUNT(*) AS cnt FROM {table} WHERE {where}")
+    return cur.fetchone()["cnt"]
+
+
+def import_swap(cur, frame: pd.DataFrame, use_bulk: bool, force: bool = False) -> dict:
+    # 목적:
+    #  - blue/green 적재. 라이브 bluehands는 읽기만 하고, 새 세대는 STAGING_TABLE에 만든다.
+    #  1) STAGING_TABLE을 bluehands와 같은 구조(인덱스 포함)로 새로 만들고 전체 적재
+    #  2) 입력에서 사라진 지점은 soft delete 상태로 옮겨 담는다(--incremental과 같은 결과)
+    #  3) 행 수 / FK / branch_key 중복 검증 + 삭제 비율 확인
+    #  4) FK 추가 후 RENAME TABLE 한 번으로 bluehands <-> staging 교체 (직전 세대는 PREVIOUS_TABLE)
+    # 주의:
+    #  - DDL은 암묵적으로 commit 된다. 검증에서 실패하면 라이브 테이블은 그대로고 staging만 남는다.
+    frame = assign_stable_ids(cur, frame)
+    live_before = count_rows(cur, "bluehands", "deleted_at IS NULL")
+
+    cur.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+    cur.execute(f"CREATE TABLE {STAGING_TABLE} LIKE bluehands")  # FK는 복사되지 않음 -> 4)에서 추가
+
+    if use_bulk:
+        load_bluehands_bulk(cur, frame, table=STAGING_TABLE)
+    else:
+        insert_bluehands(cur, frame, table=STAGING_TABLE)
+
+    # 2) 사라진 지점 이어 담기(이미 삭제된 지점은 deleted_at 유지)
+    copy_cols = ["id"] + BLUEHANDS_COLUMNS + ["updated_at"]
+    cur.execute(
+        f"INSERT INTO {STAGING_TABLE} ({', '.join(copy_cols)}, deleted_at) "
+        f"SELECT {', '.join('a.' + c for c in copy_cols)}, COALESCE(a.deleted_at, NOW()) "
+        f"  FROM bluehands a LEFT JOIN {STAGING_TABLE} s ON s.branch_key = a.branch_key "
+        f" WHERE s.id IS NULL"
+    )
+    deleted = count_rows(cur, "bluehands a", (
+        f"a.deleted_at IS NULL AND NOT EXISTS "
+        f"(SELECT 1 FROM {STAGING_TABLE} s WHERE s.branch_key = a.branch_key AND s.deleted_at IS NULL)"
+    ))
+
+    # 3) 검증
+    live_after = count_rows(cur, STAGING_TABLE, "deleted_at IS NULL")
+    if live_after != len(frame):
+        raise RuntimeError(f"staging 행 수 불일치: {live_after} / {len(frame)}")
+    validate_bluehands_load(cur, STAGING_TABLE)
+    if live_before and deleted > live_before * MAX_DELETE_RATIO and not force:
+        raise RuntimeError(
+            f"입력에 없는 지점이 {deleted}/{live_before}개입니다. 입력 파일이 맞는지 확인하세요. (의도한 것이면 --force)"
+        )
+
+    # 4) FK 추가(검증은 위에서 했으므로 검사 없이 INPLACE로) + 교체
+    #    이름 없는 FK는 <테이블>_ibfk_N 으로 만들어지고 RENAME 때 테이블 이름을 따라 바뀐다(세대 간 이름 충돌 없음).
+    cur.execute("SET SESSION foreign_key_checks = 0")
+    try:
+        cur.execute(
+            f"ALTER TABLE {STAGING_TABLE} "
+            f"ADD FOREIGN KEY (region_id) REFERENCES regions(id) ON UPDATE CASCADE ON DELETE RESTRICT, "
+            f"ADD FOREIGN KEY (type_id) REFERENCES service_types(id) ON UPDATE CASCADE ON DELETE RESTRICT"
+        )
+    finally:
+        cur.execute("SET SESSION foreign_key_checks = 1")
+
+    cur.execute(f"DROP TABLE IF EXISTS {PREVIOUS_TABLE}")
+    cur.execute(f"RENAME TABLE bluehands TO {PREVIOUS_TABLE}, {STAGING_TABLE} TO bluehands")
+    return {"live_before": live_before, "live_after": live_after, "deleted": deleted}
+
+
+def rollback_swap(conn):
+    # 목적:
+    #  - --swap 직후 문제가 있으면 직전 세대(PREVIOUS_TABLE)를 다시 bluehands로 되돌린다.
+    #    되돌린 세대는 STAGING_TABLE 이름으로 남겨서 원인을 확인할 수 있게 한다.
+    with conn.cursor() as cur:
+        cur.execute("SHOW TABLES LIKE %s", (PREVIOUS_TABLE,))
+        if not cur.fetchall():
+            die(f"되돌릴 이전 세대 테이블({PREVIOUS_TABLE})이 없습니다.")
+        cur.execute(f"DROP TABLE IF EXISTS {STAGING_TABLE}")
+        cur.execute(f"RENAME TABLE bluehands TO {STAGING_TABLE}, {PREVIOUS_TABLE} TO bluehands")
+
+
+def file_signature(path: str) -> str:
+    # 파일이 바뀌었는지 판단용(크기:수정시각). 바뀌었으면 이전 진행 상황으로 이어 넣지 않는다.
+    st = os.stat(path)
+    return f"{st.st_size}:{int(st.st_mtime)}"
+
+
+def load_progress(cur, source: str):
+    cur.execute(
+        "SELECT signature, chunk_size, chunks_done, rows_done FROM import_progress WHERE source = %s",
+        (source,),
+    )
+    return cur.fetchone()
+
+
+def save_progress(cur, source: str, signature: str, chunk_size: int, chunks_done: int, rows_done: int):
+    cur.execute(
+        "INSERT INTO import_progress (source, signature, chunk_size, chunks_done, rows_done) "
+        "VALUES (%s, %s, %s, %s, %s) "
+        "ON DUPLICATE KEY UPDATE signature = VALUES(signature), chunk_size = VALUES(chunk_size), "
+        "chunks_done = VALUES(chunks_done), rows_done = VALUES(rows_done)",
+        (source, signature, chunk_size, chunks_done, rows_done),
+    )
+
+
+def import_chunked(conn, path: str, chunksize: int, resume: bool = False) -> dict:
+    # 목적:
+    #  - chunksize행씩 읽기 -> 정리 -> 차원 id 매핑 -> bluehands upsert -> 진행 상황 저장 -> commit 반복.
+    #  - 한 번에 잡는 트랜잭션/메모리는 chunk 하나 분량이다.
+    #  - 같은 지점이 다른 chunk에 또 나오면 upsert라서 마지막 값이 남는다(전체 적재의 중복 처리와 같음).
+    source = os.path.abspath(path)
+    signature = file_signature(path)
+
+    with conn.cursor() as cur:
+        skip_chunks, rows_done = 0, 0
+        progress = load_progress(cur, source) if resume else None
+        if progress and progress["signature"] == signature and progress["chunk_size"] == chunksize:
+            skip_chunks, rows_done = progress["chunks_done"], progress["rows_done"]
+            print(f"🔁 이어서 적재: chunk {skip_chunks}개({rows_done}행)는 이미 적재됨")
+        elif progress:
+            print("[WARN] 파일 또는 chunksize가 지난번과 달라서 처음부터 적재합니다.")
+        save_progress(cur, source, signature, chunksize, skip_chunks, rows_done)
+        conn.commit()
+
+        region_map = load_name_to_id(cur, "regions")
+        type_map = load_name_to_id(cur, "service_types")
+
+        chunks_done = skip_chunks
+        started = time.perf_counter()
+        written = 0
+        for i, chunk in enumerate(iter_crawl_output(path, chunksize)):
+            if i < skip_chunks:
+                continue
+            ensure_required_columns(chunk)
+            try:
+                cleaned = clean_frame(chunk)
+                extend_name_to_id(cur, "regions", cleaned[COL_REGION].unique().tolist(), region_map)
+                extend_name_to_id(cur, "service_types", cleaned[COL_TYPE].unique().tolist(), type_map)
+                frame = build_bluehands_frame(cleaned, region_map, type_map)
+                upsert_bluehands(cur, frame)
+
+                chunks_done = i + 1
+                rows_done += len(frame)
+                save_progress(cur, source, signature, chunksize, chunks_done, rows_done)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                die(f"chunk {i + 1} 적재 실패: {e}\n  -> chunk {chunks_done}개까지는 commit 됨. --resume으로 이어서 실행하세요.")
+
+            written += len(frame)
+            elapsed = time.perf_counter() - started
+            print(f"  chunk {chunks_done}: +{len(frame)}행 (누적 {rows_done}행, {written / elapsed:,.0f} rows/sec)")
+
+    return {"chunks": chunks_done, "rows": rows_done, "written": written, "seconds": time.perf_counter() - started}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 결과를 bluehands_db에 적재")
+    parser.add_argument("--input", default=CSV_PATH, help="크롤러 결과 파일 (.parquet / .ndjson / .csv)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="branch_key 기준 upsert + 사라진 지점 soft delete (변경된 행만 씀)")
+    parser.add_argument("--force", action="store_true",
+                        help=f"--incremental / --swap에서 기존 지점의 {int(MAX_DELETE_RATIO * 100)}%% 넘게 "
+                             "없어져도(삭제 / 교체 전 테이블보다 빠짐) 진행")
+    parser.add_argument("--bulk", choices=["auto", "on", "off"], default="auto",
+                        help=f"전체 INSERT를 LOAD DATA로 적재 (auto: {BULK_LOAD_THRESHOLD}행 이상일 때)")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="N행씩 읽어서 chunk마다 commit (큰 파일용, import_progress 테이블 필요)")
+    parser.add_argument("--resume", action="store_true",
+                        help="--chunksize 적재를 마지막으로 commit된 chunk 다음부터 이어서 실행")
+    parser.add_argument("--swap", action="store_true",
+                        help=f"{STAGING_TABLE}에 적재/검증 후 RENAME TABLE로 라이브 테이블 교체")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=f"지역별 병렬 적재 프로세스 수 (예: {os.cpu_count()}). 1이면 단일 연결")
+    parser.add_argument("--rollback-swap", action="store_true",
+                        help=f"직전 --swap을 취소하고 {PREVIOUS_TABLE}를 다시 bluehands로 되돌림")
+    args = parser.parse_args()
+
+    if args.rollback_swap:
+        conn = connect_mysql()
+        try:
+            rollback_swap(conn)
+        except Exception as e:
+            die(f"Rollback failed: {e}")
+        finally:
+            conn.close()
+        print(f"[OK] {PREVIOUS_TABLE} -> bluehands 로 되돌렸습니다. (교체됐던 세대는 {STAGING_TABLE})")
+        return
+
+    if args.swap and (args.incremental or args.chunksize):
+        die("--swap은 --incremental / --chunksize와 같이 쓸 수 없습니다.")
+    if args.workers > 1 and (args.incremental or args.chunksize or args.swap):
+        die("--workers는 전체 INSERT에서만 쓸 수 있습니다. (--incremental / --chunksize / --swap 제외)")
+
+    # 0) 입력 파일 존재 확인
+    if not os.path.exists(args.input):
+        die(f"CSV 파일을 찾을 수 없습니다: {args.input}")
+
+    # 분할 적재: 파일 전체를 메모리에 올리지 않고 chunk 단위로 읽기/적재/commit
+    if args.chunksize:
+        if args.incremental:
+            die("--chunksize는 --incremental과 같이 쓸 수 없습니다. (soft delete 판단에 전체 지점 목록이 필요)")
+        conn = connect_mysql()
+        try:
+            stats = import_chunked(conn, args.input, args.chunksize, resume=args.resume)
+        finally:
+            conn.close()
+        rows_per_s = stats["written"] / stats["seconds"] if stats["seconds"] else 0
+        print("[OK] Import completed.")
+        print(f"  chunks: {stats['chunks']}, bluehands: {stats['rows']} (이번 실행 {stats['written']}행)")
+        print(f"  write path: chunked upsert, {stats['seconds']:.2f}s ({rows_per_s:,.0f} rows/sec)")
+        return
+
+    # 1) 크롤러 결과 로드(형식별 고정 dtype) + 헤더 검증
+    df = read_crawl_output(args.input)
+    ensure_required_columns(df)
+
+    # 2) 문자열 정리(공백/빈값/NaN -> None) + 전화번호 포맷
     # 3) 필수값이 비어있는 행 제거(최소한 region/name/type는 있어야 함)
-    df = df.dropna(subset=[COL_REGION, COL_NAME, COL_TYPE])
+    df = clean_frame(df)
 
     # 4) 차원 테이블 값 추출(중복 제거)
     regions = sorted(df[COL_REGION].dropna().unique().tolist())
     types = sorted(df[COL_TYPE].dropna().unique().tolist())
 
-    conn = connect_mysql()
+    # LOAD DATA 사용 여부(증분 모드는 바뀐 행만 upsert 하므로 해당 없음)
+    use_bulk = not args.incremental and (
+        args.bulk == "on" or (args.bulk == "auto" and len(df) >= BULK_LOAD_THRESHOLD)
+    )
+
+    conn = connect_mysql(local_infile=use_bulk)
     try:
         with conn.cursor() as cur:
             # 5) regions / service_types 채우기
@@ -242,56 +735,62 @@ def main():
             region_map = load_name_to_id(cur, "regions")
             type_map = load_name_to_id(cur, "service_types")
 
-            # 7) bluehands rows 구성
-            #    - 위경도/플래그는 CSV에서 이미 전처리 완료라고 가정.
-            #    - 다만 pandas에서 NaN으로 들어올 수 있으니 NaN -> None/0 정도만 최소 방어.
-            out_rows = []
-            for _, row in df.iterrows():
-                region_id = region_map.get(row[COL_REGION])
-                type_id = type_map.get(row[COL_TYPE])
-                if region_id is None or type_id is None:
-                    continue
-
-                lat = row[COL_LAT]
-                lng = row[COL_LNG]
-                lat = None if pd.isna(lat) else float(lat)
-                lng = None if pd.isna(lng) else float(lng)
-
-                def safe_int(v, default=0):
-                    if v is None or (isinstance(v, float) and pd.isna(v)):
-                        return int(default)
-                    return int(v)
-
-                out_rows.append({
-                    "name": row[COL_NAME],
-                    "region_id": int(region_id),
-                    "type_id": int(type_id),
-                    "address": row[COL_ADDRESS],
-                    "phone": row[COL_PHONE],
-                    "latitude": lat,
-                    "longitude": lng,
-
-                    "is_ev": safe_int(row[COL_IS_EV], 0),
-                    "is_ev_tech": safe_int(row[COL_IS_EV_TECH], 0),
-                    "is_hydrogen": safe_int(row[COL_IS_HYDROGEN], 0),
-                    "is_hydrogen": safe_int(row[COL_IS_HYDROGEN], 0),
-                    "is_frame": safe_int(row[COL_IS_FRAME], 0),
-                    "is_al_frame": safe_int(row[COL_IS_AL_FRAME], 0),
-                    "is_n_line": safe_int(row[COL_IS_N_LINE], 0),
-                    "is_commercial_mid": safe_int(row[COL_IS_COMMERCIAL_MID], 0),
-                    "is_commercial_big": safe_int(row[COL_IS_COMMERCIAL_BIG], 0),
-                    "is_commercial_ev": safe_int(row[COL_IS_COMMERCIAL_EV], 0),
-                    "is_cs_excellent": safe_int(row[COL_IS_CS_EXCELLENT], 0),
-                })
-
-            # 8) bluehands insert
-            insert_bluehands(cur, out_rows)
+            # 7) bluehands 적재용 컬럼 구성
+            out_frame = build_bluehands_frame(df, region_map, type_map)
+
+            # 8) bluehands insert / upsert
+            region_results = []
+            started = time.perf_counter()
+            if args.incremental:
+                stats = import_incremental(cur, out_frame, force=args.force)
+                write_path = "upsert"
+            elif args.swap:
+                stats = import_swap(cur, out_frame, use_bulk, force=args.force)
+                write_path = f"{STAGING_TABLE} + RENAME" + (" (LOAD DATA)" if use_bulk else "")
+            elif args.workers > 1:
+                conn.commit()  # 워커들이 FK로 참조할 regions/service_types를 먼저 확정
+                region_results = import_parallel(out_frame, use_bulk, args.workers)
+                write_path = f"{args.workers} workers x " + ("LOAD DATA" if use_bulk else "executemany")
+            elif use_bulk:
+                load_bluehands_bulk(cur, out_frame)
+                write_path = "LOAD DATA"
+            else:
+                insert_bluehands(cur, out_frame)
+                write_path = "executemany"
+            write_s = time.perf_counter() - started
 
         conn.commit()
-        print("[OK] Import completed.")
+        failed_regions = [r for r in region_results if r["error"] is not None]
+        print("[OK] Import completed." if not failed_regions else "[WARN] Import partially completed.")
         print(f"  regions: {len(regions)}")
         print(f"  service_types: {len(types)}")
-        print(f"  bluehands: {len(df)} (rows after cleaning), inserted: {len(out_rows)}")
+        print(f"  bluehands: {len(df)} (rows after cleaning), prepared: {len(out_frame)}")
+        if args.incremental:
+            print(
+                f"  incremental: inserted {stats['inserted']}, updated {stats['updated']}, "
+                f"soft-deleted {stats['deleted']}, unchanged {stats['unchanged']}"
+            )
+        elif args.swap:
+            print(
+                f"  swap: live {stats['live_before']} -> {stats['live_after']}, "
+                f"soft-deleted {stats['deleted']} (이전 세대: {PREVIOUS_TABLE})"
+            )
+        elif args.workers > 1:
+            name_by_region_id = {v: k for k, v in region_map.items()}
+            for r in sorted(region_results, key=lambda r: name_by_region_id.get(r["region_id"], "")):
+                status = "OK" if r["error"] is None else f"FAILED (rollback): {r['error']}"
+                print(f"  [{name_by_region_id.get(r['region_id'])}] {r['rows']}행, {r['seconds']:.2f}s - {status}")
+            inserted = sum(r["rows"] for r in region_results if r["error"] is None)
+            print(f"  inserted: {inserted} / {len(out_frame)}")
+        else:
+            print(f"  inserted: {len(out_frame)}")
+        rows_per_s = len(out_frame) / write_s if write_s else 0
+        print(f"  write path: {write_path}, {write_s:.2f}s ({rows_per_s:,.0f} rows/sec)")
+        if failed_regions:
+            die(
+                f"{len(failed_regions)}개 지역 적재 실패(성공한 지역은 commit 됨). "
+                "같은 파일로 --incremental을 실행하면 빠진 지점만 채워 넣습니다."
+            )
 
     except Exception as e:
         conn.rollback()
@@ -0,0 +1,132 @@
+# File: replay_server.py
+# 목적:
+#  - crawler.py --record 로 보관한 원본 응답(gzip)을 serviceNetwork.list.do 대신 돌려주는 로컬 서버.
+#  - 네트워크 없이 크롤러를 돌리거나, 지연/에러를 일부러 넣어서 재시도/속도를 재현성 있게 측정할 때 쓴다.
+#
+# 사용 예:
+#  python replay_server.py --archive ./raw --port 8765 --latency-ms 80 --jitter-ms 20 --error-rate 0.02
+#  python crawler.py --url http://127.0.0.1:8765/ --rate 1000
+#
+# 동작:
+#  - POST 폼의 selectBoxCity / pageNo 로 보관 파일을 찾는다(crawler.archive_path와 같은 규칙).
+#  - 보관 파일은 이미 gzip이므로 압축을 풀지 않고 Content-Encoding: gzip 으로 그대로 보낸다.
+#  - 파일이 없으면 빈 결과(totalCount=0)를 돌려준다.
+
+import argparse
+import gzip
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from crawler import archive_path
+
+EMPTY_RESPONSE = gzip.compress(json.dumps({"data": {"result": [], "totalCount": 0}}).encode("utf-8"))
+
+
+class ReplayConfig:
+    def __init__(self, archive_dir: str, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, seed=None):
+        self.archive_dir = archive_dir
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()  # random.Random은 스레드 간 공유 시 잠금 필요
+
+        # 통계
+        self.requests = 0
+        self.errors = 0
+
+    def next_delay_and_error(self):
+        with self.lock:
+            self.requests += 1
+            delay_ms = max(0.0, self.random.gauss(self.latency_ms, self.jitter_ms)) if self.jitter_ms else self.latency_ms
+            is_error = self.random.random() < self.error_rate
+            if is_error:
+                self.errors += 1
+        return delay_ms / 1000.0, is_error
+
+
+def make_handler(config: ReplayConfig):
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive 지원 (크롤러의 Session 재사용과 같은 조건)
+        disable_nagle_algorithm = True  # 헤더/본문을 따로 쓸 때 생기는 delayed-ACK 40ms 지연 방지
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            form = parse_qs(self.rfile.read(length).decode("utf-8"))
+            region_full_name = form.get("selectBoxCity", [""])[0]
+            page_no = int(form.get("pageNo", ["1"])[0])
+
+            delay_s, is_error = config.next_delay_and_error()
+            if delay_s:
+                time.sleep(delay_s)
+
+            if is_error:
+                self._send(500, b"", gzipped=False)
+                return
+
+            path = archive_path(config.archive_dir, region_full_name, page_no)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    body = f.read()
+            else:
+                body = EMPTY_RESPONSE
+            self._send(200, body, gzipped=True)
+
+        def _send(self, status: int, body: bytes, gzipped: bool):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 찍히는 로그는 벤치마크 결과를 흐리므로 끈다
+
+    return ReplayHandler
+
+
+def start_server(config: ReplayConfig, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """
+    목적:
+      - 백그라운드 스레드에서 재생 서버를 띄우고 서버 객체를 돌려준다(port=0이면 빈 포트 자동 선택).
+      - 다 쓰면 server.shutdown() 호출.
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 원본 응답 재생 서버")
+    parser.add_argument("--archive", required=True, help="crawler.py --record 로 만든 폴더")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답마다 넣을 평균 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="지연의 표준편차(ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500으로 응답할 비율(0~1)")
+    parser.add_argument("--seed", type=int, default=None, help="지연/에러 난수 시드(재현용)")
+    args = parser.parse_args()
+
+    config = ReplayConfig(args.archive, args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(config))
+    print(f"🔁 재생 서버 시작: http://{args.host}:{args.port}/ (archive={args.archive})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"요청 {config.requests}건 / 주입한 에러 {config.errors}건")
+
+
+if __name__ == "__main__":
+    main()
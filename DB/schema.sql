@@ -1,7 +1,7 @@
 -- schema.sql
 -- 현재 프로젝트 DB 스키마(스크린샷 기준)
 -- 초기 세팅용입니다. 초기 한번 실행하는걸 권장합니다.
--- regions / service_types / bluehands
+-- regions / service_types / bluehands / import_progress
 
 CREATE DATABASE IF NOT EXISTS bluehands_db
   DEFAULT CHARACTER SET utf8mb4
@@ -10,6 +10,9 @@ CREATE DATABASE IF NOT EXISTS bluehands_db
 USE bluehands_db;
 
 -- FK 때문에 drop 순서: 자식 -> 부모
+DROP TABLE IF EXISTS import_progress;
+DROP TABLE IF EXISTS bluehands_staging;  -- import_csv_to_mysql.py --swap 이 만드는 세대 테이블
+DROP TABLE IF EXISTS bluehands_old;
 DROP TABLE IF EXISTS bluehands;
 DROP TABLE IF EXISTS service_types;
 DROP TABLE IF EXISTS regions;
@@ -41,9 +44,20 @@ CREATE TABLE bluehands (
   address   VARCHAR(300) NULL,
   phone     VARCHAR(50)  NULL,
 
+  -- 시/도, 구/군 (주소의 첫 번째 / 두 번째 단어). 셀렉트박스 목록과 지역 필터가 주소 문자열을 매번 자르지 않도록
+  --  STORED 생성 컬럼 + idx_bluehands_sido_gugun 인덱스로 둔다. 주소가 없거나 빈 문자열이면 NULL.
+  sido  VARCHAR(100) AS (NULLIF(LEFT(TRIM(SUBSTRING_INDEX(address, ' ', 1)), 100), '')) STORED,
+  gugun VARCHAR(100) AS (NULLIF(LEFT(TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(address, ' ', 2), ' ', -1)), 100), '')) STORED,
+
   latitude  DOUBLE NULL,
   longitude DOUBLE NULL,
 
+  -- 내 주변 검색용 좌표(WGS84). 위경도에서 자동 계산되는 STORED 컬럼이라 임포터의 모든 적재 경로에서 같이 채워진다.
+  --  POINT(x, y) = POINT(경도, 위도) 저장 순서. SPATIAL INDEX는 NOT NULL이어야 해서 좌표가 없으면 (0, 0).
+  --  (0, 0)은 대서양 한가운데라 한국 주변 반경 검색에는 걸리지 않지만, 조회 시 latitude IS NOT NULL도 같이 건다.
+  geom POINT SRID 4326
+    AS (ST_SRID(POINT(IFNULL(longitude, 0), IFNULL(latitude, 0)), 4326)) STORED NOT NULL,
+
   is_ev        TINYINT(1) NOT NULL DEFAULT 0,
   is_ev_tech          TINYINT(1) NOT NULL DEFAULT 0,
   is_hydrogen         TINYINT(1) NOT NULL DEFAULT 0,
@@ -55,10 +69,46 @@ CREATE TABLE bluehands (
   is_commercial_ev    TINYINT(1) NOT NULL DEFAULT 0,
   is_cs_excellent     TINYINT(1) NOT NULL DEFAULT 0,
 
+  -- is_* 플래그 10개를 묶은 비트마스크(STORED 생성 컬럼이라 임포터의 모든 적재 경로에서 같이 채워진다).
+  --  비트 순서는 Function/service_mask.py의 SERVICE_FLAGS와 같다(is_ev = 1, is_ev_tech = 2, ...).
+  --  "선택한 서비스를 모두 가진 지점" = (service_mask & 선택마스크) = 선택마스크
+  service_mask SMALLINT UNSIGNED AS (
+      (is_ev <> 0)
+    | (is_ev_tech <> 0) << 1
+    | (is_hydrogen <> 0) << 2
+    | (is_frame <> 0) << 3
+    | (is_al_frame <> 0) << 4
+    | (is_n_line <> 0) << 5
+    | (is_commercial_mid <> 0) << 6
+    | (is_commercial_big <> 0) << 7
+    | (is_commercial_ev <> 0) << 8
+    | (is_cs_excellent <> 0) << 9
+  ) STORED NOT NULL,
+
+  -- 증분 적재(import_csv_to_mysql.py --incremental)용
+  --  branch_key: 지점명+주소 sha1 (자연키), row_hash: 나머지 값까지 포함한 sha1 (변경 감지)
+  --  deleted_at: 입력에서 사라진 지점은 지우지 않고 시각만 기록(soft delete). 조회 시 deleted_at IS NULL 조건 필수.
+  branch_key CHAR(40) NOT NULL,
+  row_hash   CHAR(40) NOT NULL,
+  deleted_at DATETIME NULL,
+  updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
   PRIMARY KEY (id),
+  UNIQUE KEY uk_bluehands_branch_key (branch_key),
 
-  KEY idx_bluehands_region_id (region_id),
+  -- 지역 + 서비스 필터. (region_id, service_mask)만 읽고 조건을 판정하는 커버링 인덱스
+  --  region_id가 맨 앞이라 fk_bluehands_region용 인덱스도 겸한다(예전 idx_bluehands_region_id 대체).
+  KEY idx_bluehands_region_service (region_id, service_mask),
+  SPATIAL INDEX sidx_bluehands_geom (geom),
+  -- 시/도 -> 구/군 목록(DISTINCT)과 필터를 인덱스만 읽고 처리한다(deleted_at까지 넣어서 커버링).
+  KEY idx_bluehands_sido_gugun (sido, gugun, deleted_at),
   KEY idx_bluehands_type_id (type_id),
+  -- 목록 페이지(keyset) 정렬 ORDER BY name, id. InnoDB 보조 인덱스는 뒤에 PK(id)를 달고 있어서 (name, id) 순서 그대로다.
+  KEY idx_bluehands_name (name),
+
+  -- 지점명/주소 검색용. ngram 파서(MySQL 8 내장, 한글 등 CJK용)로 2글자(ngram_token_size 기본값) 단위 색인.
+  --  조회는 MATCH(a.name, a.address) AGAINST(... IN BOOLEAN MODE). 1글자 검색어는 색인에 없어서 LIKE로 찾는다.
+  FULLTEXT KEY ft_bluehands_name_address (name, address) WITH PARSER ngram,
 
   CONSTRAINT fk_bluehands_region
     FOREIGN KEY (region_id) REFERENCES regions(id)
@@ -68,3 +118,16 @@ CREATE TABLE bluehands (
     FOREIGN KEY (type_id) REFERENCES service_types(id)
     ON UPDATE CASCADE ON DELETE RESTRICT
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 4) 분할 적재 진행 상황(import_csv_to_mysql.py --chunksize)
+--  chunk 하나를 넣을 때마다 같은 트랜잭션에서 chunks_done을 올린다 -> 중간에 끊겨도 --resume으로 이어서 적재
+--  signature(파일 크기:수정시각)나 chunk_size가 바뀌면 처음부터 다시 적재한다.
+CREATE TABLE import_progress (
+  source      VARCHAR(255) NOT NULL,
+  signature   VARCHAR(64)  NOT NULL,
+  chunk_size  INT NOT NULL,
+  chunks_done INT NOT NULL DEFAULT 0,
+  rows_done   BIGINT NOT NULL DEFAULT 0,
+  updated_at  TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (source)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
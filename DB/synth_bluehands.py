@@ -0,0 +1,229 @@
+# File: synth_bluehands.py
+# 목적:
+#  - 실제 블루핸즈(약 1,500개)보다 10배~1000배 많은 "그럴듯한" 지점 데이터를 만든다.
+#    (다른 브랜드 네트워크 / 과거 스냅샷을 같이 넣었을 때 임포터와 앱이 어떻게 버티는지 보려고)
+#  - 컬럼은 크롤러 출력과 똑같다(crawl_output.OUTPUT_COLUMNS) -> 임포터 ensure_required_columns 통과.
+#  - 출력은 CrawlOutputWriter로 흘려 쓰므로 100만 행도 메모리 걱정 없음(.csv / .parquet / .ndjson).
+#
+# 데이터 규칙:
+#  - 지역 비중은 실제 지점 분포와 비슷하게(경기/서울이 많고 세종/제주는 적게).
+#  - 좌표는 시/도별 주요 시/구 중심 좌표 주변에 정규분포로 흩뿌린다(약 2~3km).
+#  - 주소는 "<시/도 전체 이름> <시/군/구> <도로명> <번지>" -> 앱의 시/도, 구/군 추출 규칙과 맞음.
+#  - 전화번호는 지역번호에 맞춰 만든다. 서비스 플래그는 타입별 확률로 뽑는다.
+#
+# 사용 예:
+#  python synth_bluehands.py --rows 100000 --output synth_100k.parquet
+#  python synth_bluehands.py --rows 1000000 --output synth_1m.csv --dirty 0.05
+
+import argparse
+
+import numpy as np
+
+from crawl_output import FLAG_COLUMNS, CrawlOutputWriter
+
+# 시/도 약칭 -> (전체 이름, 지역번호, 비중, [(시/군/구, 위도, 경도), ...])
+REGION_CLUSTERS = {
+    "서울": ("서울특별시", "02", 0.17, [
+        ("강남구", 37.5172, 127.0473), ("송파구", 37.5145, 127.1059), ("강서구", 37.5509, 126.8495),
+        ("노원구", 37.6542, 127.0568), ("영등포구", 37.5264, 126.8962), ("성동구", 37.5633, 127.0371),
+        ("은평구", 37.6027, 126.9291), ("구로구", 37.4954, 126.8874),
+    ]),
+    "경기": ("경기도", "031", 0.26, [
+        ("수원시", 37.2636, 127.0286), ("성남시", 37.4200, 127.1265), ("고양시", 37.6584, 126.8320),
+        ("용인시", 37.2411, 127.1776), ("부천시", 37.5034, 126.7660), ("안산시", 37.3219, 126.8309),
+        ("화성시", 37.1995, 126.8311), ("평택시", 36.9921, 127.1129), ("의정부시", 37.7381, 127.0337),
+    ]),
+    "인천": ("인천광역시", "032", 0.06, [
+        ("남동구", 37.4473, 126.7314), ("부평구", 37.5070, 126.7219), ("서구", 37.5454, 126.6760),
+        ("연수구", 37.4101, 126.6783),
+    ]),
+    "강원": ("강원특별자치도", "033", 0.04, [
+        ("춘천시", 37.8813, 127.7298), ("원주시", 37.3422, 127.9202), ("강릉시", 37.7519, 128.8761),
+    ]),
+    "충남": ("충청남도", "041", 0.05, [
+        ("천안시", 36.8151, 127.1139), ("아산시", 36.7898, 127.0018), ("서산시", 36.7848, 126.4503),
+    ]),
+    "충북": ("충청북도", "043", 0.04, [
+        ("청주시", 36.6424, 127.4890), ("충주시", 36.9910, 127.9259), ("제천시", 37.1326, 128.1910),
+    ]),
+    "대전": ("대전광역시", "042", 0.03, [
+        ("서구", 36.3554, 127.3838), ("유성구", 36.3624, 127.3562), ("대덕구", 36.3467, 127.4156),
+    ]),
+    "세종": ("세종특별자치시", "044", 0.01, [
+        ("세종시", 36.4800, 127.2890),
+    ]),
+    "부산": ("부산광역시", "051", 0.07, [
+        ("해운대구", 35.1631, 129.1636), ("부산진구", 35.1630, 129.0532), ("사하구", 35.1046, 128.9749),
+        ("북구", 35.1972, 128.9903),
+    ]),
+    "울산": ("울산광역시", "052", 0.03, [
+        ("남구", 35.5438, 129.3301), ("북구", 35.5827, 129.3612), ("울주군", 35.5223, 129.2424),
+    ]),
+    "대구": ("대구광역시", "053", 0.05, [
+        ("수성구", 35.8581, 128.6306), ("달서구", 35.8299, 128.5327), ("북구", 35.8858, 128.5828),
+    ]),
+    "경북": ("경상북도", "054", 0.05, [
+        ("포항시", 36.0190, 129.3435), ("구미시", 36.1195, 128.3446), ("경주시", 35.8562, 129.2247),
+    ]),
+    "경남": ("경상남도", "055", 0.06, [
+        ("창원시", 35.2279, 128.6811), ("김해시", 35.2285, 128.8894), ("진주시", 35.1800, 128.1076),
+    ]),
+    "전남": ("전라남도", "061", 0.03, [
+        ("여수시", 34.7604, 127.6622), ("순천시", 34.9507, 127.4872), ("목포시", 34.8118, 126.3922),
+    ]),
+    "광주": ("광주광역시", "062", 0.03, [
+        ("북구", 35.1740, 126.9120), ("서구", 35.1520, 126.8895), ("광산구", 35.1396, 126.7937),
+    ]),
+    "전북": ("전북특별자치도", "063", 0.03, [
+        ("전주시", 35.8242, 127.1480), ("익산시", 35.9483, 126.9577), ("군산시", 35.9676, 126.7366),
+    ]),
+    "제주": ("제주특별자치도", "064", 0.01, [
+        ("제주시", 33.4996, 126.5312), ("서귀포시", 33.2541, 126.5601),
+    ]),
+}
+
+# 타입 이름 -> 비중 (앱 범례: 전문 블루핸즈 / 종합 블루핸즈 / 하이테크센터)
+TYPE_WEIGHTS = {"종합 블루핸즈": 0.70, "전문 블루핸즈": 0.25, "하이테크센터": 0.05}
+
+# 타입별 서비스 플래그 확률 (하이테크센터는 전기/수소/상용 정비 비율이 높음)
+FLAG_PROBS = {
+    "종합 블루핸즈": {
+        "is_ev": 0.35, "is_ev_tech": 0.20, "is_hydrogen": 0.04, "is_frame": 0.45, "is_al_frame": 0.06,
+        "is_n_line": 0.05, "is_commercial_mid": 0.08, "is_commercial_big": 0.03, "is_commercial_ev": 0.03,
+        "is_cs_excellent": 0.15,
+    },
+    "전문 블루핸즈": {
+        "is_ev": 0.15, "is_ev_tech": 0.05, "is_hydrogen": 0.01, "is_frame": 0.10, "is_al_frame": 0.01,
+        "is_n_line": 0.01, "is_commercial_mid": 0.02, "is_commercial_big": 0.01, "is_commercial_ev": 0.01,
+        "is_cs_excellent": 0.10,
+    },
+    "하이테크센터": {
+        "is_ev": 0.90, "is_ev_tech": 0.80, "is_hydrogen": 0.40, "is_frame": 0.80, "is_al_frame": 0.50,
+        "is_n_line": 0.40, "is_commercial_mid": 0.40, "is_commercial_big": 0.30, "is_commercial_ev": 0.25,
+        "is_cs_excellent": 0.30,
+    },
+}
+
+ROAD_NAMES = ["중앙로", "시청로", "역전로", "산업로", "공단로", "번영로", "자동차로", "대학로", "문화로", "평화로"]
+CLUSTER_SPREAD_DEG = 0.025  # 좌표 표준편차(도) ≈ 2~3km
+DEFAULT_BATCH = 50_000
+
+
+def region_aliases() -> list[str]:
+    return list(REGION_CLUSTERS.keys())
+
+
+def type_names() -> list[str]:
+    return list(TYPE_WEIGHTS.keys())
+
+
+def _phone(rng, area_codes: np.ndarray) -> list[str]:
+    # 지역번호 + 국번(3~4자리) + 4자리. 서울(02)은 국번 4자리가 많다.
+    mid = rng.integers(200, 9999, len(area_codes))
+    last = rng.integers(0, 10000, len(area_codes))
+    return [f"{a}-{m}-{l:04d}" for a, m, l in zip(area_codes.tolist(), mid.tolist(), last.tolist())]
+
+
+def _make_dirty(rng, rows: dict, ratio: float):
+    # 정리 로직이 실제로 일하도록 일부 값을 "크롤링 원본처럼" 흐트러뜨린다.
+    n = len(rows["name"])
+    pick = np.flatnonzero(rng.random(n) < ratio)
+    for i in pick.tolist():
+        kind = i % 4
+        if kind == 0:
+            rows["phone"][i] = rows["phone"][i].replace("-", "")  # 하이픈 없음
+        elif kind == 1:
+            rows["name"][i] = f"  {rows['name'][i]} "  # 앞뒤 공백
+        elif kind == 2:
+            rows["phone"][i] = ""  # 전화번호 없음
+        else:
+            rows["phone"][i] = f"1588-{rng.integers(0, 10000):04d}"  # 대표번호
+
+
+def generate_batch(rng, start: int, n: int, dirty: float = 0.0) -> list[dict]:
+    """
+    목적:
+      - start번째 지점부터 n개를 만들어서 크롤러 행(dict) 리스트로 돌려준다.
+      - 지점명에 일련번호를 넣어서 (지점명, 주소)가 겹치지 않게 한다(branch_key 유일).
+    """
+    aliases = region_aliases()
+    weights = np.array([REGION_CLUSTERS[a][2] for a in aliases])
+    region_idx = rng.choice(len(aliases), size=n, p=weights / weights.sum())
+
+    types = type_names()
+    type_w = np.array([TYPE_WEIGHTS[t] for t in types])
+    type_idx = rng.choice(len(types), size=n, p=type_w / type_w.sum())
+
+    rows = {col: [] for col in ["region", "name", "type", "address", "latitude", "longitude"]}
+    area_codes = np.empty(n, dtype=object)
+    for i in range(n):
+        alias = aliases[region_idx[i]]
+        full_name, area_code, _, clusters = REGION_CLUSTERS[alias]
+        gugun, lat, lng = clusters[rng.integers(0, len(clusters))]
+        serial = start + i
+
+        rows["region"].append(alias)
+        rows["name"].append(f"블루핸즈 {gugun[:-1] or gugun}{serial}점")
+        rows["type"].append(types[type_idx[i]])
+        rows["address"].append(
+            f"{full_name} {gugun} {ROAD_NAMES[serial % len(ROAD_NAMES)]} {serial % 997 + 1}"
+        )
+        rows["latitude"].append(round(lat + rng.normal(0, CLUSTER_SPREAD_DEG), 7))
+        rows["longitude"].append(round(lng + rng.normal(0, CLUSTER_SPREAD_DEG), 7))
+        area_codes[i] = area_code
+    rows["phone"] = _phone(rng, area_codes)
+
+    # 서비스 플래그: 타입별 확률로 한 번에 뽑기
+    flags = {}
+    for col in FLAG_COLUMNS:
+        probs = np.array([FLAG_PROBS[t][col] for t in types])[type_idx]
+        flags[col] = (rng.random(n) < probs).astype("uint8")
+    # 수소차/EV 기술 지점은 EV 정비도 한다
+    flags["is_ev"] |= flags["is_hydrogen"] | flags["is_ev_tech"]
+
+    if dirty:
+        _make_dirty(rng, rows, dirty)
+
+    out = []
+    for i in range(n):
+        row = {col: rows[col][i] for col in rows}
+        for col in FLAG_COLUMNS:
+            row[col] = int(flags[col][i])
+        out.append(row)
+    return out
+
+
+def write_synthetic(path: str, n_rows: int, seed: int = 42, dirty: float = 0.0,
+                    batch: int = DEFAULT_BATCH) -> int:
+    """
+    목적:
+      - n_rows개를 batch개씩 만들어서 path에 흘려 쓴다(형식은 확장자). 쓴 행 수를 돌려준다.
+      - 같은 seed면 항상 같은 파일이 나온다(벤치마크 재현용).
+    """
+    rng = np.random.default_rng(seed)
+    writer = CrawlOutputWriter(path, batch_rows=batch)
+    try:
+        for start in range(0, n_rows, batch):
+            writer.write_rows(generate_batch(rng, start, min(batch, n_rows - start), dirty))
+        writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.rows_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="블루핸즈 합성 데이터 생성기")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--output", default="synth_bluehands.csv", help=".csv / .parquet / .ndjson")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dirty", type=float, default=0.0,
+                        help="전화번호/공백 등을 원본처럼 흐트러뜨릴 행 비율(0~1)")
+    args = parser.parse_args()
+
+    written = write_synthetic(args.output, args.rows, args.seed, args.dirty)
+    print(f"✅ {written}행 -> '{args.output}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,13 @@
 import streamlit as st
-import mysql.connector
+from db_pool import get_conn
 import pandas as pd
 
 st.title("📍 지역 선택 (셀렉트박스 1개)")
 
-conn = mysql.connector.connect(
-    host="localhost",
-    user="root",
-    password="mysql",
-    database="bluehands_db",
-    charset="utf8mb4"
-)
+conn = get_conn()
 
-BASE_WHERE = "address IS NOT NULL AND address <> ''"
+# sido/gugun: 주소에서 잘라 둔 생성 컬럼(schema.sql). 주소가 없거나 빈 문자열이면 NULL
+BASE_WHERE = "deleted_at IS NULL AND sido IS NOT NULL"  # deleted_at: 폐점(soft delete) 지점 제외
 
 # --- rerun 호환 (버전 차이 대응) ---
 def do_rerun():
@@ -34,7 +29,7 @@ if "region_pick" not in st.session_state:
 # --- 데이터 로더 ---
 def load_sido():
     df = pd.read_sql(f"""
-        SELECT DISTINCT TRIM(SUBSTRING_INDEX(address, ' ', 1)) AS sido
+        SELECT DISTINCT sido
           FROM bluehands
          WHERE {BASE_WHERE}
          ORDER BY sido
@@ -43,10 +38,10 @@ def load_sido():
 
 def load_gugun(sido: str):
     df = pd.read_sql(f"""
-        SELECT DISTINCT TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(address, ' ', 2), ' ', -1)) AS gugun
+        SELECT DISTINCT gugun
           FROM bluehands
          WHERE {BASE_WHERE}
-           AND TRIM(SUBSTRING_INDEX(address, ' ', 1)) = %s
+           AND sido = %s
          ORDER BY gugun
     """, conn, params=(sido,))
     return ["← 시/도 다시 선택", "(전체)"] + df["gugun"].dropna().tolist()
@@ -1,6 +1,5 @@
 import os
 import streamlit as st
-import mysql.connector
 import folium
 from folium.plugins import LocateControl
 from streamlit_folium import st_folium
@@ -9,6 +8,7 @@ import streamlit.components.v1 as components  # 자바스크립트용
 import time
 import math
 from math import radians, cos, sin, asin, sqrt
+from db_pool import get_conn
 
 # -----------------------------------------------------------------------------
 # 0. 거리 계산 함수 - 하버사인 공식
@@ -43,18 +43,12 @@ def get_bluehands_data(search_text):
     conn = None
     cursor = None
     try:
-        # ⚠️ DB 정보 확인
-        conn = mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="root",
-            database="bluehands_db"
-        )
+        conn = get_conn()
         cursor = conn.cursor(dictionary=True)
-        query = "SELECT name, latitude, longitude, address, phone FROM bluehands_db.bluehands"
+        query = "SELECT name, latitude, longitude, address, phone FROM bluehands_db.bluehands WHERE deleted_at IS NULL"
         params = []
         if search_text:
-            query += " WHERE name LIKE %s OR address LIKE %s"
+            query += " AND (name LIKE %s OR address LIKE %s)"
             pattern = f"%{search_text}%"
             params = [pattern, pattern]
         cursor.execute(query, params)
@@ -0,0 +1,136 @@
+# File: autocomplete.py
+# 목적:
+#  - 사이드바 검색창 입력 중 추천(지점명 / 시군구명). MySQL에 가지 않고 프로세스 메모리의 정렬 배열로 답한다.
+#  - 추천 키를 정렬된 리스트로 두고 bisect로 "검색어로 시작하는 범위"만 본다(접두사 검색 = 정렬 배열 범위).
+#  - 키는 두 가지:
+#      자모 키  : 음절을 자모로 푼 문자열(fuzzy_search.to_jamo). 입력 중인 "강나"도 "강남"의 접두사가 된다.
+#      초성 키  : 음절마다 초성만("강남" -> "ㄱㄴ"). 검색어가 자음으로만 되어 있으면 이쪽으로 찾는다.
+#  - 지점명은 전체 이름 말고 두 번째 단어부터 시작하는 키도 넣는다("블루핸즈 강남점" -> "강남점"으로도 찾음).
+#
+# 사용 예:
+#  index = SuggestIndex([Suggestion("블루핸즈 강남점", "지점", "서울"), ...])
+#  index.suggest("ㄱㄴ")         # [Suggestion("블루핸즈 강남점", ...), Suggestion("서울특별시 강남구", ...)]
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    from fuzzy_search import CHOSEONG, HANGUL_BASE, HANGUL_LAST, to_jamo
+except ImportError:  # 프로젝트 루트에서 Function.autocomplete로 import 할 때
+    from Function.fuzzy_search import CHOSEONG, HANGUL_BASE, HANGUL_LAST, to_jamo
+
+SUGGEST_LIMIT = 8          # 추천 최대 개수
+SUGGEST_SCAN = 200         # 접두사 범위에서 최대 몇 개 키까지 볼지(순서 매길 후보 수)
+SUGGEST_CACHE_SIZE = 4096  # 검색어 -> 추천 결과 캐시(같은 접두사를 여러 세션이 반복 입력)
+
+# 호환 자모 자음(키보드로 치는 "ㄱ") -> 초성 순서(CHOSEONG와 같은 순서)
+COMPAT_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+COMPAT_TO_CONJOINING = {c: CHOSEONG[i] for i, c in enumerate(COMPAT_CHOSEONG)}
+KIND_ORDER = {"지역": 0, "지점": 1}  # 같은 순위면 시군구를 먼저
+
+
+class Suggestion(NamedTuple):
+    label: str                    # 화면에 보여 주고 검색창에 넣을 문자열
+    kind: str                     # "지점" / "지역"
+    region: Optional[str] = None  # regions.name (지역 선택과 맞춰 거를 때)
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절 -> 호환 자모 초성("강남" -> "ㄱㄴ"). 그 밖의 글자는 소문자로 그대로 둔다."""
+    out = []
+    for ch in text.lower():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            out.append(COMPAT_CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(text: str) -> bool:
+    letters = [ch for ch in text if not ch.isspace()]
+    return bool(letters) and all(ch in COMPAT_TO_CONJOINING for ch in letters)
+
+
+def _query_jamo(text: str) -> str:
+    # 입력 중 "강ㄴ"처럼 끝에 자음만 친 경우도 자모 키의 접두사가 되게 호환 자음을 초성 자모로 바꾼다
+    return "".join(COMPAT_TO_CONJOINING.get(ch, ch) for ch in to_jamo(text))
+
+
+def _word_starts(label: str) -> List[str]:
+    # "블루핸즈 강남 현대점" -> ["블루핸즈 강남 현대점", "강남 현대점", "현대점"]
+    words = label.split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class _PrefixArray:
+    """정렬된 (키, 순위, 항목 번호) 배열. 순위 0 = 전체 이름으로 맞음, 1 = 중간 단어부터 맞음."""
+
+    def __init__(self, items: Iterable[Tuple[str, int, int]]):
+        items = sorted(set(items))
+        self.keys = [k for k, _, _ in items]
+        self.values = [(rank, entry) for _, rank, entry in items]
+
+    def scan(self, prefix: str, max_keys: int) -> Dict[int, int]:
+        """prefix로 시작하는 키 -> {항목 번호: 가장 좋은 순위} (최대 max_keys개 키까지)"""
+        found: Dict[int, int] = {}
+        i = bisect_left(self.keys, prefix)
+        end = min(len(self.keys), i + max_keys)
+        while i < end and self.keys[i].startswith(prefix):
+            rank, entry = self.values[i]
+            found[entry] = min(rank, found.get(entry, rank))
+            i += 1
+        return found
+
+
+class SuggestIndex:
+    def __init__(self, entries: Iterable[Suggestion]):
+        self.entries: List[Suggestion] = list(dict.fromkeys(entries))  # 같은 이름 지점은 하나만
+        jamo_keys, choseong_keys = [], []
+        for entry_no, entry in enumerate(self.entries):
+            for rank, key in enumerate(_word_starts(entry.label)):
+                rank = min(rank, 1)
+                jamo_keys.append((to_jamo(key), rank, entry_no))
+                choseong_keys.append((to_choseong(key), rank, entry_no))
+        self.jamo = _PrefixArray(jamo_keys)
+        self.choseong = _PrefixArray(choseong_keys)
+        self._cache: Dict[Tuple[str, Optional[str], int], List[Suggestion]] = {}
+
+    def suggest(self, text: Optional[str], region: Optional[str] = None,
+                limit: int = SUGGEST_LIMIT) -> List[Suggestion]:
+        """
+        입력 중인 검색어 -> 추천 목록(전체 이름이 맞는 것 먼저, 그다음 시군구 -> 지점, 가나다순).
+          - 자음으로만 된 검색어("ㄱㄴ")는 초성으로, 그 밖에는 자모 접두사로 찾는다.
+          - region: 지역 선택이 "(전체)"가 아니면 그 지역 항목만
+        """
+        query = " ".join((text or "").split())
+        if not query:
+            return []
+        region = None if region == "(전체)" else region
+        cache_key = (query, region, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if is_choseong_query(query):
+            found = self.choseong.scan(query, SUGGEST_SCAN)
+        else:
+            found = self.jamo.scan(_query_jamo(query), SUGGEST_SCAN)
+        candidates = [
+            (rank, self.entries[entry_no]) for entry_no, rank in found.items()
+            if region is None or self.entries[entry_no].region == region
+        ]
+        candidates.sort(key=lambda c: (c[0], KIND_ORDER.get(c[1].kind, 9), c[1].label))
+        result, seen = [], set()
+        for _, entry in candidates:
+            if (entry.label, entry.kind) in seen:
+                continue  # 지역을 안 골랐으면 같은 이름은 한 번만
+            seen.add((entry.label, entry.kind))
+            result.append(entry)
+            if len(result) >= limit:
+                break
+
+        if len(self._cache) >= SUGGEST_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[cache_key] = result
+        return result
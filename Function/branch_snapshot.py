@@ -0,0 +1,288 @@
+# File: branch_snapshot.py
+# 목적:
+#  - bluehands 전체(영업 중 지점)를 프로세스 메모리에 NumPy 컬럼 배열로 한 번 올려 두고,
+#    지역 / 서비스 옵션 / 검색어 조건을 벡터 연산(마스크)으로 바로 답한다.
+#    사이드바를 바꿀 때마다 MySQL에 다녀오지 않고, 조합마다 따로 캐시할 필요도 없다.
+#  - 데이터가 바뀌면(임포트) 새 스냅샷을 다 만든 뒤 참조만 바꿔 끼운다(조회 중인 세션은 이전 스냅샷을 끝까지 씀).
+#
+# 컬럼:
+#  - ids / type_ids / region_ids : 정수 배열
+#  - lat / lng                   : float64 (좌표 없음 = NaN)
+#  - service_mask                : uint16 (Function/service_mask.py 비트 규칙, DB 생성 컬럼과 같음)
+#  - names / addresses / phones  : object 배열 (sys.intern으로 같은 문자열은 한 객체)
+#  - name_rank                   : 지점명 정렬 순위(collation_key: DB의 utf8mb4_0900_ai_ci 정렬을 흉내 냄)
+#  - names_lc / addresses_lc     : 소문자 고정폭 유니코드 배열(1글자 검색어 스캔, 정렬 점수용)
+#  - text_index                  : 지점명 + 주소 n-gram(2·3글자) 역색인(trigram_index.py). 지역명은 넣지 않는다(region_mask로 거름)
+#  - fuzzy_index                 : 지점명 자모 단위 오타 허용 색인(fuzzy_search.py). 처음 쓸 때 만든다
+#  - districts / suggest_index   : "시도 시군구" 문자열, 입력 중 추천용 접두사 색인(autocomplete.py). 처음 쓸 때 만든다
+#
+# 사용 예:
+#  store = SnapshotStore(get_conn)          # 프로세스당 1개 (final.py에서 st.cache_resource)
+#  rows = store.current().search("강남 현대", ["is_ev"], "서울")
+
+import sys
+import threading
+import unicodedata
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from service_mask import SERVICE_BITS, service_mask_of
+    from trigram_index import FIELD_SEP, TrigramIndex
+    from fuzzy_search import FuzzyNameIndex
+    from autocomplete import Suggestion, SuggestIndex
+    from text_search import tokenize
+except ImportError:  # 프로젝트 루트(final.py)에서 Function.branch_snapshot으로 import 할 때
+    from Function.service_mask import SERVICE_BITS, service_mask_of
+    from Function.trigram_index import FIELD_SEP, TrigramIndex
+    from Function.fuzzy_search import FuzzyNameIndex
+    from Function.autocomplete import Suggestion, SuggestIndex
+    from Function.text_search import tokenize
+
+SNAPSHOT_CHECK_S = 30  # 이 간격마다 데이터 버전을 확인해서 바뀌었으면 다시 적재
+FUZZY_LIMIT = 50       # 오타 허용 검색 결과 최대 개수
+
+LOAD_SQL = """
+    SELECT a.id, a.type_id, a.region_id, r.name AS region_name,
+           a.name, a.address, a.phone, a.latitude, a.longitude, a.service_mask,
+           a.sido, a.gugun
+      FROM bluehands a
+      JOIN regions r ON a.region_id = r.id
+     WHERE a.deleted_at IS NULL
+     ORDER BY a.id
+"""
+
+# 추가/수정/soft delete는 updated_at이, 행 삭제(swap 되돌리기 등)는 COUNT/MAX(id)가 바뀐다
+VERSION_SQL = "SELECT COUNT(*), MAX(updated_at), MAX(id) FROM bluehands"
+
+
+def _intern(value) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def collation_key(name: Optional[str]) -> str:
+    """
+    지점명 정렬 키. DB 정렬(utf8mb4_0900_ai_ci: 대소문자 / 악센트 / 전각·반각 무시)을 흉내 낸다.
+      - NFKC로 전각 글자("ＡＢ１")를 반각으로, casefold로 대소문자를 맞추고, 결합 악센트를 뺀다
+      - 그다음은 코드 포인트 순서: 공백/기호 < 숫자 < 라틴 < 한글. UCA 순서와 대부분 같지만
+        일부 기호(예: "_")의 위치는 다를 수 있다(같은 정렬 키끼리는 id 순).
+    """
+    folded = unicodedata.normalize("NFD", unicodedata.normalize("NFKC", name or "").casefold())
+    return unicodedata.normalize("NFC", "".join(ch for ch in folded if not unicodedata.combining(ch)))
+
+
+def _search_array(values: List[Optional[str]]) -> np.ndarray:
+    # 검색용: None -> "", 소문자(utf8mb4_general/0900_ai_ci처럼 대소문자 무시)
+    return np.char.lower(np.array([v or "" for v in values], dtype=str))
+
+
+class BranchSnapshot:
+    def __init__(self, rows: List[Dict[str, Any]], version: tuple):
+        self.version = version
+        self.loaded_at = time.time()
+        self.size = len(rows)
+
+        self.ids = np.array([r["id"] for r in rows], dtype=np.int64)
+        self.type_ids = np.array([r["type_id"] for r in rows], dtype=np.int32)
+        self.region_ids = np.array([r["region_id"] for r in rows], dtype=np.int32)
+        self.lat = np.array([np.nan if r["latitude"] is None else r["latitude"] for r in rows], dtype=np.float64)
+        self.lng = np.array([np.nan if r["longitude"] is None else r["longitude"] for r in rows], dtype=np.float64)
+        self.service_mask = np.array([r["service_mask"] for r in rows], dtype=np.uint16)
+
+        self.names = np.array([_intern(r["name"]) for r in rows], dtype=object)
+        self.addresses = np.array([_intern(r["address"]) for r in rows], dtype=object)
+        self.phones = np.array([_intern(r["phone"]) for r in rows], dtype=object)
+        self.region_names = np.array([_intern(r["region_name"]) for r in rows], dtype=object)
+        self.districts = np.array([
+            _intern(" ".join(v for v in (r.get("sido"), r.get("gugun")) if v)) for r in rows
+        ], dtype=object)
+        self.names_lc = _search_array([r["name"] for r in rows])
+        self.addresses_lc = _search_array([r["address"] for r in rows])
+        # 지점명 정렬 순위(collation_key 순, 같으면 id 순. 적재할 때 한 번만 계산)
+        # 행이 id 순으로 들어오므로 stable 정렬이면 같은 키끼리는 id 순이 된다
+        name_keys = np.array([collation_key(n) for n in self.names.tolist()], dtype=str)
+        self.name_rank = np.empty(self.size, dtype=np.int64)
+        self.name_rank[np.argsort(name_keys, kind="stable")] = np.arange(self.size)
+
+        self.region_id_by_name = {r["region_name"]: r["region_id"] for r in rows}
+        self.text_index = TrigramIndex([
+            FIELD_SEP.join(v or "" for v in (r["name"], r["address"])).lower()
+            for r in rows
+        ])
+        self._fuzzy_index: Optional[FuzzyNameIndex] = None
+        self._fuzzy_lock = threading.Lock()
+        self._suggest_index: Optional[SuggestIndex] = None
+        self._suggest_lock = threading.Lock()
+
+    # ----- 조건 -> 불리언 마스크 -----
+    def region_mask(self, region_filter: Optional[str]) -> Optional[np.ndarray]:
+        if not region_filter or region_filter == "(전체)":
+            return None
+        region_id = self.region_id_by_name.get(region_filter)
+        if region_id is None:
+            return np.zeros(self.size, dtype=bool)
+        return self.region_ids == region_id
+
+    def services_mask(self, selected_filters) -> Optional[np.ndarray]:
+        required = service_mask_of(selected_filters)
+        if not required:
+            return None
+        return (self.service_mask & required) == required
+
+    def text_match(self, search_text: Optional[str], idx: np.ndarray):
+        """
+        idx(후보 행 위치) 중 검색어에 맞는 행 -> (행 위치, 점수) 또는 (None, None)
+          - 검색 규칙/점수는 Function/text_search.py(DB 조회)와 같다: 토큰마다 지점명 또는 주소에 있어야 하고,
+            점수는 토큰이 지점명에 있으면 2 + 주소에 있으면 1. 정렬은 점수 높은 순 -> 지점명 -> id
+          - n-gram 역색인(2글자 이상 토큰)은 후보를 줄이는 데만 쓰고, 맞는지는 토큰 길이와 상관없이
+            아래에서 지점명/주소 문자열로 똑같이 확인한다(1글자 토큰은 색인이 없어서 여기서만 걸러짐)
+        """
+        tokens = [t.lower() for t in tokenize(search_text)]
+        if not tokens:
+            return None, None
+        whole = len(idx) == self.size  # 지역/서비스 조건이 없으면 후보 교집합 생략
+        found = self.text_index.search(tokens, None if whole else idx)
+        rows = idx if found is None else found.astype(np.int64)
+
+        names, addresses = self.names_lc[rows], self.addresses_lc[rows]
+        keep = np.ones(len(rows), dtype=bool)
+        score = np.zeros(len(rows), dtype=np.int32)
+        for tok in tokens:
+            in_name = np.char.find(names, tok) >= 0
+            in_addr = np.char.find(addresses, tok) >= 0
+            keep &= in_name | in_addr  # 모든 토큰 같은 규칙(색인 내용이 바뀌어도 결과는 그대로)
+            score += in_name * 2 + in_addr
+        return rows[keep], score[keep]
+
+    # ----- 조회 -----
+    def search_indices(self, search_text=None, selected_filters=None, region_filter=None) -> np.ndarray:
+        """조건에 맞는 행 위치 배열. 검색어가 있으면 점수 높은 순 -> 지점명 -> id 순, 없으면 지점명 -> id 순(DB 조회와 같음)."""
+        mask = np.ones(self.size, dtype=bool)
+        for m in (self.region_mask(region_filter), self.services_mask(selected_filters)):
+            if m is not None:
+                mask &= m
+        idx = np.flatnonzero(mask)
+        matched, score = self.text_match(search_text, idx)
+        if matched is None:
+            return idx[np.argsort(self.name_rank[idx])]  # name_rank는 id까지 반영한 순위라 겹치지 않는다
+        return matched[np.lexsort((self.name_rank[matched], -score))]  # 마지막 키가 1순위
+
+    @property
+    def fuzzy_index(self) -> FuzzyNameIndex:
+        # 오타 검색은 가끔만 쓰므로 스냅샷 적재를 늦추지 않도록 처음 쓸 때 만든다(한 번만)
+        if self._fuzzy_index is None:
+            with self._fuzzy_lock:
+                if self._fuzzy_index is None:
+                    self._fuzzy_index = FuzzyNameIndex(self.names.tolist())
+        return self._fuzzy_index
+
+    @property
+    def suggest_index(self) -> SuggestIndex:
+        # 지점명 + 시군구명. 첫 추천 요청 때 한 번만 만든다(fuzzy_index와 같은 방식)
+        if self._suggest_index is None:
+            with self._suggest_lock:
+                if self._suggest_index is None:
+                    regions = self.region_names.tolist()
+                    entries = [Suggestion(n, "지역", r) for n, r in zip(self.districts.tolist(), regions) if n]
+                    entries += [Suggestion(n, "지점", r) for n, r in zip(self.names.tolist(), regions) if n]
+                    self._suggest_index = SuggestIndex(entries)
+        return self._suggest_index
+
+    def suggest(self, text: Optional[str], region_filter: Optional[str] = None) -> List[Suggestion]:
+        """입력 중인 검색어 -> 추천(지점명 / 시군구명). 초성("ㄱㄴ")도 된다."""
+        return self.suggest_index.suggest(text, region_filter)
+
+    def fuzzy_search(self, search_text=None, selected_filters=None, region_filter=None,
+                     limit: int = FUZZY_LIMIT) -> List[Dict[str, Any]]:
+        """
+        지점명 오타 허용 검색. 자모 편집 거리가 가까운 순(같으면 id 순) 상위 limit개.
+        결과 행에는 distance(검색 단어별 거리 합)가 붙는다.
+        """
+        allowed = None
+        for m in (self.region_mask(region_filter), self.services_mask(selected_filters)):
+            if m is not None:
+                allowed = m if allowed is None else allowed & m
+        hits = self.fuzzy_index.search(search_text, limit=limit, allowed=allowed)
+        rows = self.rows(np.asarray([row for row, _ in hits], dtype=np.int64))
+        for row, (_, dist) in zip(rows, hits):
+            row["distance"] = dist
+        return rows
+
+    def rows(self, idx: np.ndarray) -> List[Dict[str, Any]]:
+        """행 위치 -> get_bluehands_data와 같은 모양의 dict 목록 (is_* 플래그는 service_mask에서 풀어 씀)"""
+        out = []
+        for i in idx.tolist():
+            mask = int(self.service_mask[i])
+            row = {
+                "id": int(self.ids[i]),
+                "type_id": int(self.type_ids[i]),
+                "name": self.names[i],
+                "latitude": None if np.isnan(self.lat[i]) else float(self.lat[i]),
+                "longitude": None if np.isnan(self.lng[i]) else float(self.lng[i]),
+                "address": self.addresses[i],
+                "phone": self.phones[i],
+            }
+            for col, bit in SERVICE_BITS.items():
+                row[col] = 1 if mask & bit else 0
+            out.append(row)
+        return out
+
+    def search(self, search_text=None, selected_filters=None, region_filter=None) -> List[Dict[str, Any]]:
+        return self.rows(self.search_indices(search_text, selected_filters, region_filter))
+
+
+class SnapshotStore:
+    """
+    목적:
+      - 현재 스냅샷을 들고 있다가 check_interval_s마다 DB 버전을 확인해서 바뀌었으면 새로 만든다.
+      - 새 스냅샷을 다 만든 다음 self._snapshot 참조만 바꾼다(한 번의 대입 = 원자적).
+        다시 만드는 동안 다른 세션은 기다리지 않고 이전 스냅샷으로 답한다.
+    """
+
+    def __init__(self, get_conn: Callable, check_interval_s: float = SNAPSHOT_CHECK_S):
+        self.get_conn = get_conn
+        self.check_interval_s = check_interval_s
+        self._snapshot: Optional[BranchSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def _query(self, sql: str, dictionary: bool):
+        conn = self.get_conn()
+        try:
+            cur = conn.cursor(dictionary=dictionary)
+            cur.execute(sql)
+            return cur.fetchall()
+        finally:
+            conn.close()
+
+    def load_version(self) -> tuple:
+        return tuple(self._query(VERSION_SQL, dictionary=False)[0])
+
+    def reload(self, version: Optional[tuple] = None) -> BranchSnapshot:
+        version = version if version is not None else self.load_version()
+        snapshot = BranchSnapshot(self._query(LOAD_SQL, dictionary=True), version)
+        self._snapshot = snapshot
+        self.reloads += 1
+        return snapshot
+
+    def current(self) -> BranchSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.check_interval_s:
+            return snapshot
+
+        # 처음 적재는 모두 기다리고, 이후 확인은 한 세션만(나머지는 이전 스냅샷 사용)
+        if not self._lock.acquire(blocking=snapshot is None):
+            return snapshot
+        try:
+            if self._snapshot is not None and time.monotonic() - self._checked_at < self.check_interval_s:
+                return self._snapshot  # 기다리는 동안 다른 세션이 이미 확인함
+            version = self.load_version()
+            if self._snapshot is None or version != self._snapshot.version:
+                self.reload(version)
+            self._checked_at = time.monotonic()
+            return self._snapshot
+        finally:
+            self._lock.release()
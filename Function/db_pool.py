@@ -0,0 +1,235 @@
+# File: db_pool.py
+# 목적:
+#  - 모든 Streamlit 페이지/헬퍼가 같이 쓰는 MySQL 연결 풀(프로세스당 1개).
+#  - 쿼리/rerun마다 mysql.connector.connect()로 새로 연결하면 TCP + 인증 + charset 협상을 매번 다시 한다.
+#    풀에서 빌려 쓰고 close()로 돌려주면 이미 열린 연결을 재사용한다.
+#  - 풀은 st.cache_resource로 한 번만 만든다(세션이 여러 개여도 프로세스 안에서 공유).
+#
+# 사용 예:
+#  from db_pool import get_conn          # Function/ 페이지
+#  from Function.db_pool import get_conn # 프로젝트 루트(final.py)
+#
+#  conn = get_conn()
+#  try:
+#      cur = conn.cursor(dictionary=True)
+#      ...
+#  finally:
+#      conn.close()   # 실제로 끊지 않고 풀에 반납
+#
+#  with connection() as conn:   # 위와 같음
+#      ...
+#
+# 환경변수(없으면 기본값):
+#  - MYSQL_HOST / MYSQL_PORT / MYSQL_USER / MYSQL_PASSWORD / MYSQL_DB (final.py 규격)
+#    예전 페이지들이 쓰던 DB_HOST / DB_PORT / DB_USER / DB_PASSWORD / DB_NAME도 대신 읽는다.
+#  - MYSQL_POOL_SIZE (default: 8, mysql.connector 최대 32)
+#  - MYSQL_POOL_WAIT_S (default: 5) 풀이 다 빌려 갔을 때 반납을 기다리는 최대 시간(초)
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict
+
+import mysql.connector
+from mysql.connector import errors, pooling
+import streamlit as st
+from dotenv import load_dotenv
+
+load_dotenv()
+
+POOL_NAME = "bluehands"
+POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "8"))
+POOL_WAIT_S = float(os.getenv("MYSQL_POOL_WAIT_S", "5"))
+POOL_RETRY_S = 0.01  # 풀이 비었을 때 다시 시도하는 간격
+
+
+def _env(name: str, legacy: str, default: str = None):
+    return os.getenv(name, os.getenv(legacy, default))
+
+
+DB_CONFIG: Dict[str, Any] = {
+    "host": _env("MYSQL_HOST", "DB_HOST", "localhost"),
+    "port": int(_env("MYSQL_PORT", "DB_PORT", "3306")),
+    "user": _env("MYSQL_USER", "DB_USER", "root"),
+    "password": _env("MYSQL_PASSWORD", "DB_PASSWORD", ""),
+    "database": _env("MYSQL_DB", "DB_NAME", "bluehands_db"),
+    "charset": "utf8mb4",
+}
+
+
+class PoolMetrics:
+    """
+    목적:
+      - 풀 사용 현황(빌린 수, 사용 중, 최대 동시 사용, 대기 시간, 타임아웃)을 모은다.
+    주의:
+      - 여러 세션 스레드에서 동시에 부르므로 잠금 안에서만 갱신한다.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.borrowed = 0
+        self.returned = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waited = 0        # 풀이 비어 있어서 기다린 횟수
+        self.wait_s_total = 0.0
+        self.wait_s_max = 0.0
+        self.timeouts = 0      # POOL_WAIT_S 안에 못 빌린 횟수
+
+    def on_borrow(self, wait_s: float):
+        with self.lock:
+            self.borrowed += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            if wait_s > 0:
+                self.waited += 1
+                self.wait_s_total += wait_s
+                self.wait_s_max = max(self.wait_s_max, wait_s)
+
+    def on_return(self):
+        with self.lock:
+            self.returned += 1
+            self.in_use -= 1
+
+    def on_timeout(self, wait_s: float):
+        with self.lock:
+            self.timeouts += 1
+            self.wait_s_total += wait_s
+            self.wait_s_max = max(self.wait_s_max, wait_s)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            waits = self.waited + self.timeouts  # 평균 대기 시간은 타임아웃까지 포함
+            return {
+                "borrowed": self.borrowed,
+                "returned": self.returned,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "waited": self.waited,
+                "wait_ms_avg": round(self.wait_s_total / waits * 1000, 2) if waits else 0.0,
+                "wait_ms_max": round(self.wait_s_max * 1000, 2),
+                "timeouts": self.timeouts,
+            }
+
+
+class PooledConnection:
+    """
+    목적:
+      - 풀에서 빌린 연결을 감싸서 close() 때 반납 횟수를 센다(두 번 close 해도 한 번만 반납).
+      - 나머지 속성/메서드(cursor, commit, ...)는 원래 연결에 그대로 넘긴다.
+    """
+
+    def __init__(self, conn, metrics: PoolMetrics):
+        self._conn = conn
+        self._metrics = metrics
+        self._closed = False
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._conn.close()  # PooledMySQLConnection.close() = 풀에 반납
+        finally:
+            self._metrics.on_return()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __del__(self):
+        # 스크립트가 중간에 멈춰서(예외, st.rerun/st.stop) close()를 못 불러도 풀에서 새지 않게
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ConnectionPool:
+    def __init__(self, config: Dict[str, Any], size: int = POOL_SIZE, wait_s: float = POOL_WAIT_S):
+        self.size = size
+        self.wait_s = wait_s
+        self.metrics = PoolMetrics()
+        # pool_reset_session: 반납할 때 세션 변수/임시 테이블을 정리해서 다음 사용자에게 새지 않게 한다
+        self._pool = pooling.MySQLConnectionPool(
+            pool_name=POOL_NAME, pool_size=size, pool_reset_session=True, **config
+        )
+
+    def get_connection(self) -> PooledConnection:
+        """
+        목적:
+          - 풀에서 연결 하나를 빌린다. 다 빌려 갔으면 wait_s까지 반납을 기다린다.
+          - 헬스 체크: mysql.connector 풀이 빌려줄 때 ping(is_connected)을 하고,
+            끊겨 있으면(서버 wait_timeout, 재시작 등) 다시 연결해서 준다. 여기서 또 ping 하지 않는다.
+        """
+        started = time.perf_counter()
+        wait_s = 0.0  # 바로 빌렸으면 0 (대기 통계에 넣지 않음)
+        while True:
+            try:
+                conn = self._pool.get_connection()
+                break
+            except errors.PoolError:
+                wait_s = time.perf_counter() - started
+                if wait_s >= self.wait_s:
+                    self.metrics.on_timeout(wait_s)
+                    raise
+                time.sleep(POOL_RETRY_S)
+
+        self.metrics.on_borrow(wait_s)
+        return PooledConnection(conn, self.metrics)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"pool_size": self.size, "wait_timeout_s": self.wait_s, **self.metrics.snapshot()}
+
+
+@st.cache_resource
+def get_pool() -> ConnectionPool:
+    # 프로세스당 한 번만 실행된다(모든 세션/페이지가 같은 풀을 쓴다)
+    return ConnectionPool(DB_CONFIG)
+
+
+def get_conn() -> PooledConnection:
+    """
+    공용 MySQL 연결 풀(프로세스당 1개)에서 연결을 빌린다.
+    다 쓰면 conn.close()를 부른다. 실제로 끊지 않고 풀에 반납한다(with connection()도 같음).
+    """
+    return get_pool().get_connection()
+
+
+@contextmanager
+def connection():
+    conn = get_conn()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def pool_stats() -> Dict[str, Any]:
+    return get_pool().stats()
+
+
+def check_health() -> Dict[str, Any]:
+    """
+    목적:
+      - 풀에서 연결을 빌려 SELECT 1 을 실행하고 결과/지연시간과 풀 현황을 돌려준다(모니터링용).
+    """
+    started = time.perf_counter()
+    try:
+        with connection() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT 1")
+            cur.fetchall()
+            cur.close()
+        ok, error = True, None
+    except mysql.connector.Error as e:
+        ok, error = False, str(e)
+    return {
+        "ok": ok,
+        "error": error,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+        **pool_stats(),
+    }
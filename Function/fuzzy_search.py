@@ -0,0 +1,155 @@
+# File: fuzzy_search.py
+# 목적:
+#  - 지점명 오타 허용 검색(예: "블루핸주" -> "블루핸즈").
+#  - 한글 음절을 자모(초성/중성/종성)로 풀어서 비교한다. "즈"↔"주"는 음절로는 1글자 다르지만
+#    자모로는 ㅡ↔ㅜ 하나만 달라서, 비슷하게 생긴/친 오타일수록 거리가 작게 나온다.
+#  - 모든 지점과 편집 거리를 계산하지 않도록 SymSpell 방식의 "삭제 사전"을 미리 만든다.
+#      단어(자모)에서 글자를 최대 MAX_DISTANCE개 지운 문자열 -> 원래 단어 목록
+#    검색어도 똑같이 지워 보고 사전에서 만난 단어만 실제 편집 거리로 확인한다.
+#  - 긴 단어는 앞 PREFIX_LEN 자모만 사전에 넣는다(SymSpell prefix). 사전 크기를 줄이고, 확인은 전체로 한다.
+#
+# 사용 예:
+#  index = FuzzyNameIndex(["블루핸즈 강남점", "블루핸즈 역삼점", ...])
+#  index.search("블루핸주 강남점")   # [(행 위치, 거리합), ...] 거리 작은 순
+
+from collections import Counter, defaultdict
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = [chr(0x1100 + i) for i in range(19)]
+JUNGSEONG = [chr(0x1161 + i) for i in range(21)]
+JONGSEONG = [""] + [chr(0x11A8 + i) for i in range(27)]
+
+MAX_DISTANCE = 2  # 단어 하나에 허용하는 자모 편집 거리
+PREFIX_LEN = 7    # 삭제 사전에 넣는 단어 앞부분 길이(자모)
+SIMILAR_CACHE_SIZE = 1024  # 검색 단어 -> 비슷한 단어 결과 캐시(같은 단어를 여러 세션이 반복 입력)
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절 -> 초성 + 중성 (+ 종성) 자모. 그 밖의 글자는 소문자로 그대로 둔다."""
+    out = []
+    for ch in text.lower():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            idx = code - HANGUL_BASE
+            out.append(CHOSEONG[idx // 588])
+            out.append(JUNGSEONG[(idx % 588) // 28])
+            out.append(JONGSEONG[idx % 28])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def edit_distance(a: str, b: str, limit: int = MAX_DISTANCE) -> int:
+    """
+    Damerau-Levenshtein(인접 교환 1회 = 1) 거리. limit를 넘으면 limit + 1을 돌려주고 일찍 멈춘다.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def bag_distance(a: str, b: str) -> int:
+    # 글자 개수만 비교한 편집 거리 하한(순서 무시). DP보다 훨씬 싸서 후보를 먼저 거르는 데 쓴다
+    ca, cb = Counter(a), Counter(b)
+    return max(sum((ca - cb).values()), sum((cb - ca).values()))
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    # 앞 PREFIX_LEN 자모에서 0~max_distance개를 지운 문자열 전부 (한 글자씩 지우기를 max_distance번 반복)
+    out = {word[:PREFIX_LEN]}
+    level = out
+    for _ in range(max_distance):
+        level = {w[:i] + w[i + 1:] for w in level for i in range(len(w))}
+        out |= level
+    return out
+
+
+class FuzzyNameIndex:
+    def __init__(self, names: List[str], max_distance: int = MAX_DISTANCE):
+        """names[i] = i번째 행의 지점명. 공백으로 나눈 단어 단위로 색인한다."""
+        self.max_distance = max_distance
+        self.term_rows: Dict[str, List[int]] = defaultdict(list)  # 단어(자모) -> 행 위치
+        self.row_terms: List[Tuple[str, ...]] = []                 # 행 위치 -> 단어(자모)
+        for row, name in enumerate(names):
+            terms = tuple(dict.fromkeys(to_jamo(w) for w in (name or "").split()))
+            self.row_terms.append(terms)
+            for term in terms:
+                self.term_rows[term].append(row)
+
+        self.deletes: Dict[str, List[str]] = defaultdict(list)  # 삭제 문자열 -> 단어(자모)
+        for term in self.term_rows:
+            for d in _deletes(term, max_distance):
+                self.deletes[d].append(term)
+        self._similar_cache: Dict[str, Dict[str, int]] = {}
+
+    def similar_terms(self, word: str) -> Dict[str, int]:
+        """검색 단어 하나 -> {비슷한 색인 단어: 거리} (거리 <= max_distance)"""
+        query = to_jamo(word)
+        cached = self._similar_cache.get(query)
+        if cached is not None:
+            return cached
+        limit = self.max_distance
+        found: Dict[str, int] = {}
+        for d in _deletes(query, limit):
+            for term in self.deletes.get(d, ()):
+                if term in found:
+                    continue
+                if abs(len(term) - len(query)) > limit or bag_distance(query, term) > limit:
+                    found[term] = limit + 1
+                else:
+                    found[term] = edit_distance(query, term, limit)
+        result = {t: dist for t, dist in found.items() if dist <= limit}
+        if len(self._similar_cache) >= SIMILAR_CACHE_SIZE:
+            self._similar_cache.clear()
+        self._similar_cache[query] = result
+        return result
+
+    def search(self, text: str, limit: Optional[int] = None, allowed=None) -> List[Tuple[int, int]]:
+        """
+        검색어의 모든 단어가 지점명 어떤 단어와 비슷한 행 -> [(행 위치, 거리합), ...] 거리 작은 순.
+        행마다 검색 단어별로 가장 가까운 지점명 단어 거리를 더한다.
+          - limit: 상위 limit개만
+          - allowed: 행 위치로 인덱싱하는 참/거짓 배열(다른 조건으로 거른 행만 남길 때)
+        """
+        words = (text or "").split()
+        if not words:
+            return []
+        matches = [self.similar_terms(word) for word in words]
+        # 해당 행이 가장 적은 단어부터: 첫 단어로 후보 행을 만들고, 나머지 단어는 그 후보 행의 단어만 본다
+        matches.sort(key=lambda m: sum(len(self.term_rows[t]) for t in m))
+
+        total: Dict[int, int] = {}
+        for term, dist in matches[0].items():
+            for row in self.term_rows[term]:
+                if dist < total.get(row, self.max_distance + 1):
+                    total[row] = dist
+        if allowed is not None:
+            total = {row: dist for row, dist in total.items() if allowed[row]}
+        for similar in matches[1:]:
+            if not total:
+                break
+            narrowed = {}
+            for row, acc in total.items():
+                dists = [similar[t] for t in self.row_terms[row] if t in similar]
+                if dists:
+                    narrowed[row] = acc + min(dists)
+            total = narrowed
+        key = lambda item: (item[1], item[0])
+        if limit is not None:
+            return heapq.nsmallest(limit, total.items(), key=key)
+        return sorted(total.items(), key=key)
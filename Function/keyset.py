@@ -0,0 +1,51 @@
+# File: keyset.py
+# 목적:
+#  - keyset(정렬 키 범위) 페이지 쿼리 규칙을 한곳에 둔다. final.py 표와 Function/selectbox.py가 같이 쓴다.
+#  - 정렬: (관련도 DESC,) 지점명, id  -> 이름이 같아도 id로 순서가 고정된다
+#  - 다음 페이지 = "이전 페이지 마지막 행의 정렬 키보다 뒤"인 행. OFFSET과 달리 뒤 페이지로 가도 느려지지 않는다.
+#  - 관련도는 ROUND로 자릿수를 고정해서 돌려받은 값과 = 비교가 정확히 맞게 한다.
+#
+# 사용 예:
+#  sql, params = keyset_query("a.id, a.name", "FROM bluehands a WHERE a.deleted_at IS NULL", [], after=cursor)
+#  cur.execute(sql + " LIMIT 5", params)
+#  cursor = keyset_cursor(rows[-1])   # 다음 페이지 after
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+SCORE_DIGITS = 6  # 정렬 키로 쓰는 관련도 소수 자릿수
+
+
+def keyset_query(columns: str, base_sql: str, params: Sequence[Any],
+                 score_sql: Optional[str] = None, score_params: Sequence[Any] = (),
+                 after: Optional[tuple] = None,
+                 name_col: str = "a.name", id_col: str = "a.id") -> Tuple[str, List[Any]]:
+    """
+    페이지 조회 쿼리 -> (LIMIT 없는 SQL, params)
+      - base_sql: "FROM ... WHERE ..." (WHERE 절까지. 정렬 키 조건은 AND로 뒤에 붙인다), params는 그 params
+      - score_sql / score_params: 관련도 식(검색어가 없으면 None). SELECT에 relevance로 넣는다
+      - after: 이전 페이지 마지막 행의 keyset_cursor. None이면 처음부터
+    params 순서: SELECT의 관련도 -> base_sql -> 정렬 키 조건
+    """
+    select_params, key_sql, key_params = [], "", []
+    if score_sql:
+        score_expr = f"ROUND({score_sql}, {SCORE_DIGITS})"
+        columns = f"{columns}, {score_expr} AS relevance"
+        select_params = list(score_params)
+        order_sql = f"relevance DESC, {name_col}, {id_col}"
+        if after:
+            key_sql = f" AND ({score_expr} < %s OR ({score_expr} = %s AND ({name_col}, {id_col}) > (%s, %s)))"
+            key_params = [*score_params, after[0], *score_params, after[0], after[1], after[2]]
+    else:
+        order_sql = f"{name_col}, {id_col}"
+        if after:
+            key_sql = f" AND ({name_col}, {id_col}) > (%s, %s)"
+            key_params = [after[0], after[1]]
+    query = f"SELECT {columns} {base_sql}{key_sql} ORDER BY {order_sql}"
+    return query, select_params + list(params) + key_params
+
+
+def keyset_cursor(row) -> tuple:
+    """행(dict / pandas 행) -> 다음 페이지 조회에 넘길 정렬 키. numpy 숫자는 파이썬 값으로 바꾼다(DB 드라이버용)."""
+    if "relevance" in row:
+        return (float(row["relevance"]), row["name"], int(row["id"]))
+    return (row["name"], int(row["id"]))
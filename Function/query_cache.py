@@ -0,0 +1,175 @@
+# File: query_cache.py
+# 목적:
+#  - 지역/서비스/검색어 조회 결과를 프로세스 안 모든 세션이 같이 쓰는 캐시(st.cache_resource로 1개).
+#  - 찾기 전에 조건을 정규화해서 같은 조회는 같은 키가 되게 한다.
+#      검색어  : 유니코드 NFC + 앞뒤 공백 제거 + 연속 공백 1개 + 소문자(DB 정렬 규칙/스냅샷 검색 모두 대소문자 무시)
+#      서비스  : 정렬한 튜플(멀티셀렉트 선택 순서 무시)
+#      지역    : "(전체)" / 빈 값 -> None
+#    st.cache_data는 인자를 그대로 키로 써서 "강남 " / "강남", ["is_ev","is_frame"] / ["is_frame","is_ev"]가 따로 캐시됐다.
+#  - 크기 제한: 결과 크기(바이트 추정) 합이 max_bytes를 넘으면 가장 오래 안 쓴 것부터 버린다(LRU). TTL도 유지.
+#  - hit / miss / eviction / expired 카운터를 stats()로 본다.
+#
+# 사용 예:
+#  @cached_query("bluehands_data")
+#  def get_bluehands_data(search_text, selected_filters, region_filter): ...
+#
+#  query_cache_stats()   # {"hits": ..., "misses": ..., "evictions": ..., "bytes": ..., ...}
+#                        # (final.py 사이드바에서 BLUEHANDS_DEBUG=1 일 때 보여 준다)
+#
+#  조회 함수는 DB 오류를 잡아서 빈 결과로 돌려주면 안 된다(그 빈 결과가 모든 세션에 캐시된다).
+#  예외를 그대로 올리면 저장하지 않고, 부르는 쪽에서 오류를 보여 준다.
+#
+# 환경변수(없으면 기본값):
+#  - QUERY_CACHE_MB (default: 64)    캐시 전체 크기 상한
+#  - QUERY_CACHE_TTL_S (default: 600) 항목 유효 시간(초). DB가 바뀌어도 이 시간 뒤에는 새로 조회
+
+import functools
+import os
+import re
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import streamlit as st
+
+QUERY_CACHE_BYTES = int(float(os.getenv("QUERY_CACHE_MB", "64")) * 1024 * 1024)
+QUERY_CACHE_TTL_S = float(os.getenv("QUERY_CACHE_TTL_S", "600"))
+ALL_REGIONS = "(전체)"
+SPACES_RE = re.compile(r"\s+")
+
+
+def normalize_text(search_text: Optional[str]) -> str:
+    return SPACES_RE.sub(" ", unicodedata.normalize("NFC", search_text or "")).strip().lower()
+
+
+def normalize_query(search_text, selected_filters, region_filter) -> Tuple[str, Tuple[str, ...], Optional[str]]:
+    """(검색어, 서비스 플래그, 지역) -> 캐시 키로 쓰는 정규형. 조회 함수에도 이 값을 그대로 넘긴다."""
+    region = (region_filter or "").strip()
+    return (
+        normalize_text(search_text),
+        tuple(sorted(set(selected_filters or []))),
+        None if region in ("", ALL_REGIONS) else region,
+    )
+
+
+def estimate_bytes(value: Any) -> int:
+    """결과 크기 추정(sys.getsizeof 합). 행 dict 목록 / 튜플 / 숫자 / 문자열 정도만 들어온다."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_bytes(k) + estimate_bytes(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_bytes(v) for v in value)
+    return size
+
+
+class QueryCache:
+    """
+    목적:
+      - 키 -> (결과, 크기, 저장 시각)을 OrderedDict에 LRU 순서로 둔다(맨 뒤 = 최근 사용).
+    주의:
+      - 여러 세션 스레드가 같이 쓰므로 dict 조작은 잠금 안에서만 한다. 조회(loader)는 잠금 밖에서 한다
+        (같은 키가 동시에 miss 나면 둘 다 조회할 수 있지만, 그동안 다른 키 조회를 막지 않는다).
+      - 돌려주는 결과는 세션끼리 같은 객체다. 받은 쪽에서 고치지 말 것(st.cache_data와 달리 복사하지 않음).
+    """
+
+    def __init__(self, max_bytes: int = QUERY_CACHE_BYTES, ttl_s: float = QUERY_CACHE_TTL_S):
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0  # 크기 상한 때문에 버린 수
+        self.expired = 0    # TTL이 지나서 버린 수
+        self.oversized = 0  # 혼자서 max_bytes를 넘어서 저장하지 않은 수
+
+    def _drop(self, key: Hashable):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[2] > self.ttl_s:
+                self._drop(key)
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        size = estimate_bytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                self.oversized += 1
+                return
+            self._entries[key] = (value, size, time.monotonic())
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))  # 가장 오래 안 쓴 것
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        found, value = self.get(key)
+        if found:
+            return value
+        value = loader()  # 조회가 예외를 내면 저장하지 않고 그대로 올린다(실패 결과를 캐시하지 않음)
+        self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "oversized": self.oversized,
+            }
+
+
+@st.cache_resource
+def get_query_cache() -> QueryCache:
+    # 프로세스당 한 번만 실행된다(모든 세션/페이지가 같은 캐시를 쓴다)
+    return QueryCache()
+
+
+def cached_query(name: str):
+    """
+    (search_text, selected_filters, region_filter, *나머지) 조회 함수를 공용 캐시로 감싼다.
+    앞의 세 인자는 normalize_query로 정규화해서 키로 쓰고 조회 함수에도 정규화한 값을 넘긴다.
+    나머지 인자(페이지 커서 등)는 그대로 키에 넣는다(해시 가능해야 함).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(search_text, selected_filters, region_filter, *args, **kwargs):
+            query = normalize_query(search_text, selected_filters, region_filter)
+            key = (name, query, args, tuple(sorted(kwargs.items())))
+            return get_query_cache().get_or_load(key, lambda: func(*query, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def query_cache_stats() -> Dict[str, Any]:
+    return get_query_cache().stats()
@@ -1,26 +1,24 @@
 import streamlit as st
-import mysql.connector
+from db_pool import get_conn
+from keyset import keyset_cursor, keyset_query  # keyset 페이지 쿼리/정렬 키 (final.py 표와 같은 규칙)
+from service_mask import SERVICE_FLAGS  # is_* 서비스 플래그 컬럼 이름
+from text_search import build_token_search, tokenize  # 검색어 규칙 (final.py와 같음)
 import pandas as pd
-import re
 
 st.title("📊 시/도 → 구/군 필터링 (주소 기반)")
 
-conn = mysql.connector.connect(
-    host="localhost",
-    user="root",
-    password="mysql",
-    database="bluehands_db",
-    charset="utf8mb4"
-)
+conn = get_conn()
 
-base_where = "a.address IS NOT NULL AND a.address <> ''"
+# a.sido / a.gugun: 주소의 첫 번째 / 두 번째 단어를 미리 잘라 둔 생성 컬럼(schema.sql, 인덱스 있음)
+#  주소가 없거나 빈 문자열이면 NULL이라 sido IS NOT NULL = "주소가 있는 지점"
+base_where = "a.deleted_at IS NULL AND a.sido IS NOT NULL"  # deleted_at: 폐점(soft delete) 지점 제외
 
 # 시/도 목록
-sido_df = pd.read_sql(f"""                                          -- SUBSTRING_INDEX(a.address, ' ', 1)
-    SELECT DISTINCT TRIM(SUBSTRING_INDEX(a.address, ' ', 1)) AS sido     -- 문자열을 공백 기준으로 잘라서 앞에서 1개 가져오기   
-      FROM bluehands a                                                   -- TRIM: 앞 뒤 공백 제거
-     WHERE {base_where}  -- WHERE a.address IS NOT NULL AND a.address <> ''
-     ORDER BY sido       -- 주소가 아예 없는 데이터 제외,  주소가 빈 문자열("")인 데이터 제외
+sido_df = pd.read_sql(f"""
+    SELECT DISTINCT a.sido     -- 주소의 첫 번째 단어(생성 컬럼) -> 인덱스만 읽는다
+      FROM bluehands a
+     WHERE {base_where}
+     ORDER BY a.sido
 """, conn)
 sido_options = ["(전체)"] + sido_df["sido"].dropna().tolist() # .dropna: 혹시라도 값이 없는 행(NaN)이 있으면 제거
                                                              # .tolist(): 리스트로 변환
@@ -56,13 +54,12 @@ if selected_sido == "(전체)":
     gugun_options = ["(전체)"]
 else:
     gugun_df = pd.read_sql(f"""
-        SELECT DISTINCT TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(a.address, ' ', 2), ' ', -1)) AS gugun 
-        -- 주소에서 두번째 단어 추출(ex. 인천광역시 동구에서 동구)
-        
+        SELECT DISTINCT a.gugun
+        -- 주소의 두 번째 단어(ex. 인천광역시 동구에서 동구), 생성 컬럼
           FROM bluehands a
          WHERE {base_where}
-           AND TRIM(SUBSTRING_INDEX(a.address, ' ', 1)) = %s
-         ORDER BY gugun
+           AND a.sido = %s
+         ORDER BY a.gugun
     """, conn, params=(selected_sido,))
     gugun_options = ["(전체)"] + gugun_df["gugun"].dropna().tolist()
 
@@ -98,9 +95,9 @@ params = []
 # 사용자가 "(전체)"가 아닌 특정 시/도를 선택했을 때만 조건 추가
 if selected_sido != "(전체)":
 
-    # 주소의 "첫 번째 단어" = 시/도
+    # 주소의 "첫 번째 단어" = 시/도 (생성 컬럼 a.sido)
     # 예: "서울특별시 강남구 테헤란로" → 서울특별시
-    where_clauses.append("TRIM(SUBSTRING_INDEX(a.address, ' ', 1)) = %s")
+    where_clauses.append("a.sido = %s")
 
     # 위의 %s 자리에 들어갈 실제 값
     params.append(selected_sido)
@@ -111,12 +108,10 @@ if selected_sido != "(전체)":
     # 구/군도 "(전체)"가 아닐 때만 조건 추가
     if selected_gugun != "(전체)":
 
-        # 주소의 "두 번째 단어" = 구/군
-        # SUBSTRING_INDEX(a.address, ' ', 2) → "서울특별시 강남구"
-        # 다시 거기서 뒤에서 한 단어(-1) → "강남구"
-        where_clauses.append(
-            "TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(a.address, ' ', 2), ' ', -1)) = %s"
-        )
+        # 주소의 "두 번째 단어" = 구/군 (생성 컬럼 a.gugun)
+        # 예: "서울특별시 강남구 테헤란로" → 강남구
+        # (sido, gugun) 인덱스로 바로 찾는다
+        where_clauses.append("a.gugun = %s")
 
         # 두 번째 %s에 들어갈 값
         params.append(selected_gugun)
@@ -127,71 +122,113 @@ if selected_sido != "(전체)":
 # → 여러 조건을 AND로 연결해서 최종 WHERE 절 완성
 #
 # 예시 결과:
-# WHERE a.address IS NOT NULL AND a.address <> ''
-#   AND TRIM(SUBSTRING_INDEX(a.address, ' ', 1)) = %s
-#   AND TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(a.address, ' ', 2), ' ', -1)) = %s
+# WHERE a.deleted_at IS NULL AND a.sido IS NOT NULL
+#   AND a.sido = %s
+#   AND a.gugun = %s
 #
 # params = ['서울특별시', '강남구']
 # ---------------------------
 
 
-# ✅ 다단어 AND 검색 (LIKE)
+# ✅ 다단어 AND 검색 (FULLTEXT ngram 인덱스 ft_bluehands_name_address)
 # 예: 사용자가 "강남 현대" 입력하면
-# → ["강남", "현대"] 두 단어로 나눔
-if search_text:
+# → ["강남", "현대"] 두 단어로 나눠서 각 단어가 지점명 또는 주소에 모두 들어 있는 지점
+# 토큰/조건/관련도 규칙은 text_search.py (메인 화면 final.py와 같은 규칙, 같은 순서)
+score_sql = None      # 관련도(검색어가 많이 맞을수록 큼) 계산식, 정렬에 사용
+score_params = []
 
-    # 공백 기준으로 단어 분리
-    # r"\s+" = 스페이스 여러 개도 하나로 처리
-    tokens = [t for t in re.split(r"\s+", search_text) if t]
-
-    # 각 단어(tok)가
-    # 지점명(a.name) OR 주소(a.address) OR 지역명(r.name)
-    # 중 하나에라도 포함되어야 함
-    # 그리고 단어들 사이 관계는 AND
-    for tok in tokens:
+if search_text:
 
-        where_clauses.append("""
-            (
-                a.name LIKE %s OR
-                a.address LIKE %s OR
-                r.name LIKE %s
-            )
-        """)
+    # 공백 기준으로 단어 분리 (BOOLEAN MODE 연산자 문자는 뺀다)
+    tokens = tokenize(search_text)
 
-        # LIKE 검색용 와일드카드
-        # "%강남%" → 앞뒤에 뭐가 있어도 포함되면 OK
-        kw = f"%{tok}%"
+    # 지역명(regions.name: 서울, 경기 ...)과 똑같은 단어는 지역 조건으로 처리
+    # (주소에는 "경기도", "충청남도"처럼 적혀 있어서 "경기", "충남"이 주소 검색에 안 걸릴 수 있음)
+    region_names = set(pd.read_sql("SELECT name FROM regions", conn)["name"])
+    for tok in [t for t in tokens if t in region_names]:
+        where_clauses.append("r.name = %s")
+        params.append(tok)
+    tokens = [t for t in tokens if t not in region_names]
 
-        # 위에 %s 3개에 들어갈 실제 값들
-        params.extend([kw, kw, kw])
+    # 나머지 단어: 2글자 이상은 MATCH(인덱스), 1글자는 LIKE(특수문자 이스케이프)
+    text_conditions, text_params, score_sql, score_params = build_token_search(tokens)
+    where_clauses.extend(text_conditions)
+    params.extend(text_params)
 
 
 # 지금까지 모은 조건들을 AND로 연결해서
 # 최종 WHERE 절 문자열 완성
 # 예:
-# "a.address IS NOT NULL ... AND a.name LIKE %s AND ..."
+# "a.deleted_at IS NULL AND a.sido IS NOT NULL ... AND a.name LIKE %s AND ..."
 where_sql = " AND ".join(where_clauses)
 
 
-# 최종 실행될 SQL 쿼리
-query = f"""
-    SELECT a.*, r.name AS region_name, t.name AS type_name
+# ---------------------------
+# 📄 페이지 나누기 (keyset)
+# ---------------------------
+# 예전에는 LIMIT 200에서 잘렸다. 지금은 COUNT(*)로 전체 개수를 세고,
+# 한 페이지(PAGE_ROWS개)씩 "이전 페이지 마지막 행의 정렬 키 다음부터" 가져온다.
+# OFFSET과 달리 뒤 페이지로 갈수록 느려지지 않는다.
+PAGE_ROWS = 200
+
+# 조건(검색어/시도/구군)이 바뀌면 첫 페이지부터
+query_sig = (search_text, selected_sido, selected_gugun)
+if st.session_state.get("sb_page_query") != query_sig:
+    st.session_state["sb_page_query"] = query_sig
+    st.session_state["sb_page_cursors"] = [None]   # sb_page_cursors[i] = i번째 페이지 직전 행의 정렬 키
+    st.session_state["sb_page_index"] = 0
+
+from_sql = """
       FROM bluehands a
       JOIN regions r ON a.region_id = r.id      -- 지역 이름 가져오려고 조인
       JOIN service_types t ON a.type_id = t.id  -- 서비스 타입 이름 가져오려고 조인
-     WHERE {where_sql}                          -- 위에서 만든 조건들 적용
-     ORDER BY a.name                            -- 지점명 가나다순 정렬
-     LIMIT 200                                  -- 너무 많으면 느려지니까 200개 제한
 """
 
+total = int(pd.read_sql(f"SELECT COUNT(*) AS cnt {from_sql} WHERE {where_sql}", conn, params=params)["cnt"].iloc[0])
+
+# 정렬: (관련도 높은 순,) 지점명 가나다순, 같은 이름이면 id 순 -> 순서가 항상 같다
+# 쿼리(정렬 + "이전 페이지 다음부터" 조건)는 keyset.py가 만든다
+after = st.session_state["sb_page_cursors"][st.session_state["sb_page_index"]]
+# 화면에 보여 줄 컬럼만 (a.*는 geom(WKB 바이트) / branch_key / row_hash / service_mask 같은 내부 컬럼까지 딸려 온다)
+DISPLAY_COLS = (
+    "a.id, a.name, a.region_id, a.type_id, a.address, a.phone, a.latitude, a.longitude, "
+    + ", ".join(f"a.{col}" for col in SERVICE_FLAGS)
+    + ", r.name AS region_name, t.name AS type_name"
+)
+query, query_params = keyset_query(
+    DISPLAY_COLS,
+    f"{from_sql} WHERE {where_sql}",
+    params, score_sql, score_params, after,
+)
+
 
 # SQL 실행 + 결과를 판다스 DataFrame으로 가져오기
-# params 리스트의 값들이 %s 자리에 순서대로 안전하게 들어감
-result_df = pd.read_sql(query, conn, params=params)
+# query_params 리스트의 값들이 %s 자리에 순서대로 안전하게 들어감
+result_df = pd.read_sql(query + f" LIMIT {PAGE_ROWS}", conn, params=query_params)  # 이번 페이지만
 
-result_df = pd.read_sql(query, conn, params=params)
+page_index = st.session_state["sb_page_index"]
+total_pages = max(1, -(-total // PAGE_ROWS))   # 올림 나눗셈
 
 st.subheader("조회 결과")
+st.caption(f"총 {total}건 | {page_index + 1} / {total_pages} 페이지")
 st.dataframe(result_df, use_container_width=True)
 
+def go_prev():
+    st.session_state["sb_page_index"] -= 1
+
+def go_next(cursor):
+    cursors = st.session_state["sb_page_cursors"]
+    del cursors[st.session_state["sb_page_index"] + 1:]
+    cursors.append(cursor)
+    st.session_state["sb_page_index"] += 1
+
+prev_col, next_col = st.columns(2)
+with prev_col:
+    st.button("◀ 이전", on_click=go_prev, disabled=page_index == 0)
+with next_col:
+    if len(result_df) and page_index + 1 < total_pages:
+        st.button("다음 ▶", on_click=go_next, args=(keyset_cursor(result_df.iloc[-1]),))
+    else:
+        st.button("다음 ▶", disabled=True)
+
 conn.close()
@@ -4,16 +4,12 @@
 #  - is_* 플래그(0/1, True/False, "1"/"0", "Y"/"N" 등)를 판정해
 #    값이 1인 항목만 한글 라벨 리스트/문자열로 변환한다.
 #
-# 환경변수(없으면 기본값):
-#  - DB_HOST (default: localhost)
-#  - DB_PORT (default: 3306)
-#  - DB_USER (default: root)
-#  - DB_PASSWORD (default: )
-#  - DB_NAME (default: bluehands_db)
+# DB 연결:
+#  - 공용 연결 풀(db_pool.py)에서 빌린다. 접속 정보 환경변수도 db_pool.py 참고
+#    (MYSQL_* 또는 예전 DB_HOST / DB_PORT / DB_USER / DB_PASSWORD / DB_NAME).
 
 from typing import Any, Dict, List, Tuple
-import os
-import mysql.connector
+from db_pool import get_conn
 
 
 # 플래그 컬럼명 -> 사용자 표시 라벨(한글)
@@ -98,21 +94,9 @@ def format_labels(labels: List[str], sep: str = " · ") -> str:
 def _connect_db():
     """
     목적:
-      - 환경변수로 DB 접속 정보를 읽어 MySQL 연결을 만든다.
-    """
-    host = os.getenv("DB_HOST", "localhost")
-    port = int(os.getenv("DB_PORT", "3306"))
-    user = os.getenv("DB_USER", "root")
-    password = os.getenv("DB_PASSWORD", "")
-    database = os.getenv("DB_NAME", "bluehands_db")
-
-    return mysql.connector.connect(
-        host=host,
-        port=port,
-        user=user,
-        password=password,
-        database=database,
-    )
+      - 공용 연결 풀에서 연결을 빌린다(close()하면 풀에 반납).
+    """
+    return get_conn()
 
 
 def fetch_branch_row_by_id(branch_id: int) -> Dict[str, Any]:
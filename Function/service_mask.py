@@ -0,0 +1,64 @@
+# File: service_mask.py
+# 목적:
+#  - bluehands의 is_* 플래그 10개를 정수 하나(service_mask)로 묶는 규칙을 한곳에 둔다.
+#  - DB 쪽은 schema.sql의 생성 컬럼 service_mask가 같은 규칙으로 계산하고,
+#    조회는 "(a.service_mask & ?) = ?" 하나로 "선택한 서비스를 모두 가진 지점"을 찾는다.
+#  - 파이썬 쪽은 같은 비트로 이미 받아 온 행(dict)을 메모리에서 거른다.
+#
+# 사용 예:
+#  sql, params = service_filter_sql(["is_ev", "is_frame"])   # "(a.service_mask & %s) = %s", [9, 9]
+#  rows = filter_rows_by_services(rows, ["is_ev"])
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 비트 순서 = 리스트 순서 (is_ev = 1, is_ev_tech = 2, is_hydrogen = 4, ...)
+# ⚠️ schema.sql의 service_mask 생성 컬럼 식과 순서가 같아야 한다. 새 플래그는 맨 뒤에만 추가할 것.
+SERVICE_FLAGS: List[str] = [
+    "is_ev", "is_ev_tech", "is_hydrogen",
+    "is_frame", "is_al_frame", "is_n_line",
+    "is_commercial_mid", "is_commercial_big", "is_commercial_ev",
+    "is_cs_excellent",
+]
+SERVICE_BITS: Dict[str, int] = {col: 1 << i for i, col in enumerate(SERVICE_FLAGS)}
+
+
+def service_mask_of(cols: Optional[Iterable[str]]) -> int:
+    """선택한 플래그 컬럼명들 -> 비트마스크. 모르는 컬럼명이면 KeyError."""
+    mask = 0
+    for col in cols or []:
+        mask |= SERVICE_BITS[col]
+    return mask
+
+
+def row_service_mask(row: Dict[str, Any]) -> int:
+    """
+    행(dict) -> 비트마스크.
+      - service_mask 컬럼을 같이 조회했으면 그 값을 그대로 쓰고,
+      - 없으면 행에 있는 is_* 값(0/1)으로 계산한다(조회하지 않은 플래그는 0으로 본다).
+    """
+    if row.get("service_mask") is not None:
+        return int(row["service_mask"])
+    mask = 0
+    for col, bit in SERVICE_BITS.items():
+        if row.get(col):
+            mask |= bit
+    return mask
+
+
+def has_services(mask: int, required: int) -> bool:
+    return (mask & required) == required
+
+
+def service_filter_sql(cols: Optional[Iterable[str]], column: str = "a.service_mask") -> Tuple[Optional[str], List[int]]:
+    """선택한 플래그를 모두 가진 지점 조건 -> (SQL 조각, params). 선택이 없으면 (None, [])."""
+    required = service_mask_of(cols)
+    if not required:
+        return None, []
+    return f"({column} & %s) = %s", [required, required]
+
+
+def filter_rows_by_services(rows: List[Dict[str, Any]], cols: Optional[Iterable[str]]) -> List[Dict[str, Any]]:
+    required = service_mask_of(cols)
+    if not required:
+        return list(rows)
+    return [row for row in rows if has_services(row_service_mask(row), required)]
@@ -0,0 +1,62 @@
+# File: text_search.py
+# 목적:
+#  - 지점명/주소 검색어 규칙을 한곳에 둔다. final.py(DB 조회), Function/selectbox.py, 메모리 스냅샷
+#    (branch_snapshot.BranchSnapshot.text_match)이 모두 이 규칙을 따른다.
+#
+# 검색 규칙:
+#  - 토큰: 검색어에서 BOOLEAN MODE 연산자 문자(+ - < > ( ) ~ * " @)를 빼고 공백으로 나눈 단어
+#  - 토큰마다 지점명 또는 주소에 (글자 그대로) 들어 있어야 한다(모든 토큰 AND). 지역명(regions.name)은 보지 않는다
+#  - 관련도 = 토큰마다 지점명에 있으면 2 + 주소에 있으면 1 의 합. 정렬은 관련도 DESC, 지점명, id
+#
+# SQL로는:
+#  - 2글자 이상 토큰: 모두 포함(+)해야 하는 MATCH ... AGAINST (BOOLEAN MODE) 하나로 묶는다(FULLTEXT ngram 인덱스로 후보 찾기)
+#  - 1글자 토큰: 인덱스를 못 타므로 LIKE (MATCH가 먼저 후보를 줄여 주면 그 안에서만 비교)
+#  - 관련도는 찾은 행에서만 LIKE로 계산한다
+#
+# 사용 예:
+#  conditions, params, score_sql, score_params = build_text_search("강남 현대")
+
+import re
+from typing import List, Optional, Sequence, Tuple
+
+FULLTEXT_MIN_TOKEN_LEN = 2  # ngram_token_size 기본값. 이보다 짧은 토큰은 인덱스에 없어서 LIKE로 찾는다
+BOOLEAN_OPERATORS_RE = re.compile(r'[+\-<>()~*"@]')  # BOOLEAN MODE 연산자 문자는 검색어에서 뺀다
+LIKE_SPECIAL_RE = re.compile(r"([%_\\])")
+
+
+def tokenize(search_text: Optional[str]) -> List[str]:
+    return BOOLEAN_OPERATORS_RE.sub(" ", search_text or "").split()
+
+
+def like_pattern(token: str) -> str:
+    # 토큰을 글자 그대로 포함 검색(% _ \ 는 LIKE 특수문자라 이스케이프). 스냅샷의 문자열 포함 검사와 같게
+    return "%" + LIKE_SPECIAL_RE.sub(r"\\\1", token) + "%"
+
+
+def build_token_search(tokens: Sequence[str]) -> Tuple[List[str], List[str], Optional[str], List[str]]:
+    """
+    토큰 목록 -> (WHERE 조건 리스트, 조건 params, 관련도 SELECT 식, 관련도 params)
+    관련도 식은 토큰이 없으면 None.
+    """
+    long_tokens = [t for t in tokens if len(t) >= FULLTEXT_MIN_TOKEN_LEN]
+    short_tokens = [t for t in tokens if len(t) < FULLTEXT_MIN_TOKEN_LEN]
+
+    conditions, params = [], []
+    if long_tokens:
+        against = " ".join(f'+"{t}"' for t in long_tokens)  # ngram 파서가 각 토큰을 2글자 구절 검색으로 바꾼다
+        conditions.append("MATCH(a.name, a.address) AGAINST(%s IN BOOLEAN MODE)")
+        params.append(against)
+    for tok in short_tokens:
+        conditions.append("(a.name LIKE %s OR a.address LIKE %s)")
+        params.extend([like_pattern(tok)] * 2)
+
+    score_sql, score_params = None, []
+    if tokens:
+        score_sql = "(" + " + ".join(["(a.name LIKE %s) * 2 + COALESCE(a.address LIKE %s, 0)"] * len(tokens)) + ")"
+        score_params = [p for tok in tokens for p in [like_pattern(tok)] * 2]
+    return conditions, params, score_sql, score_params
+
+
+def build_text_search(search_text: Optional[str]):
+    """검색어 -> build_token_search와 같은 4개 값"""
+    return build_token_search(tokenize(search_text))
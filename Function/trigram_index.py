@@ -0,0 +1,103 @@
+# File: trigram_index.py
+# 목적:
+#  - 지점명 / 주소 부분 문자열 검색("강남 현대", "테헤란로")을 LIKE 스캔 없이 답하는 글자 n-gram 역색인.
+#  - gram(연속 글자 3개, 2글자 검색어용으로 2개도) -> 그 gram을 가진 행 위치의 정렬된 int32 배열(posting list).
+#  - 검색어 토큰마다 gram posting을 교집합하고, 토큰끼리도 교집합(AND)한 뒤 마지막에 실제 포함 여부를 확인한다.
+#  - 2-gram도 넣는 이유: 한국어 검색어는 "강남", "현대"처럼 2글자가 흔하다. trigram만 있으면 2글자 토큰은
+#    색인으로 못 풀고 전체를 스캔해야 한다. (DB 쪽 FULLTEXT ngram_token_size=2와도 맞춤)
+#  - 색인 대상은 지점명 / 주소뿐이다. 지역명(regions.name)은 넣지 않는다: 지역 선택은 BranchSnapshot.region_mask로,
+#    selectbox.py의 지역명 토큰은 r.name = %s 정확 일치로 따로 거른다(text_search.py 검색 규칙과 같음).
+#
+# 정확도:
+#  - 2~3글자 토큰: gram이 곧 토큰이라 posting이 정답 그대로(확인 불필요)
+#  - 4글자 이상: trigram이 다 있어도 떨어져 있을 수 있어서 후보만 실제 문자열로 확인
+#  - 1글자 토큰: 색인하지 않는다(posting이 너무 큼). None을 돌려주면 호출하는 쪽에서 스캔한다.
+#  - 필드 사이에 구분 문자를 넣어서 "지점명 끝 + 주소 앞"이 이어진 gram은 만들지 않는다.
+#
+# 사용 예:
+#  index = TrigramIndex(["블루핸즈 강남점\x1f서울특별시 강남구 ...", ...])
+#  rows = index.search(["강남", "현대"])   # 정렬된 행 위치 배열, 색인으로 못 푸는 토큰만 있으면 None
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+FIELD_SEP = "\x1f"  # 필드 구분 문자(검색어에는 나오지 않음)
+GRAM_SIZES = (2, 3)
+EMPTY = np.empty(0, dtype=np.int32)
+
+
+def _grams(text: str, n: int) -> Iterable[str]:
+    return (text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def _token_grams(token: str) -> List[str]:
+    # 토큰을 덮는 gram 목록: 2~3글자는 토큰 자체, 그보다 길면 겹치는 trigram 전부
+    if len(token) <= 3:
+        return [token]
+    return list(dict.fromkeys(_grams(token, 3)))
+
+
+class TrigramIndex:
+    def __init__(self, texts: List[str]):
+        """
+        texts[i] = i번째 행의 검색 대상 문자열(소문자, 필드는 FIELD_SEP로 이어 붙임)
+        """
+        self.texts = texts
+        self.size = len(texts)
+
+        postings: Dict[str, list] = defaultdict(list)
+        for row, text in enumerate(texts):
+            grams = {
+                part[i:i + n]
+                for part in text.split(FIELD_SEP)
+                for n in GRAM_SIZES
+                for i in range(len(part) - n + 1)
+            }
+            for gram in grams:
+                postings[gram].append(row)  # 행 순서대로 넣으므로 이미 정렬됨
+
+        # list -> int32 배열 (행 하나당 4바이트, 파이썬 int 리스트보다 훨씬 작다)
+        self.postings: Dict[str, np.ndarray] = {
+            gram: np.asarray(rows, dtype=np.int32) for gram, rows in postings.items()
+        }
+
+    def posting_bytes(self) -> int:
+        return sum(p.nbytes for p in self.postings.values())
+
+    def _token_rows(self, token: str) -> np.ndarray:
+        lists = [self.postings.get(g, EMPTY) for g in _token_grams(token)]
+        lists.sort(key=len)  # 짧은 것부터 교집합하면 금방 작아진다
+        rows = lists[0]
+        for other in lists[1:]:
+            if not len(rows):
+                break
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows
+
+    def search(self, tokens: List[str], candidates: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        모든 토큰을 포함하는 행 위치(정렬된 int 배열).
+          - candidates: 다른 조건(지역/서비스)으로 먼저 줄인 행 위치(정렬됨). 주면 그 안에서만 찾는다.
+          - 2글자 이상 토큰이 하나도 없으면 None (색인으로 못 푸는 검색)
+          - 1글자 토큰은 여기서 무시하므로 호출하는 쪽에서 결과를 한 번 더 거른다.
+        """
+        indexed = sorted({t for t in tokens if len(t) >= 2}, key=len, reverse=True)  # 긴 토큰이 보통 더 좁다
+        if not indexed:
+            return None
+
+        rows = candidates
+        for token in indexed:
+            found = self._token_rows(token)
+            rows = found if rows is None else np.intersect1d(rows, found, assume_unique=True)
+            if not len(rows):
+                return EMPTY
+
+        # 확인: 4글자 이상 토큰은 trigram이 떨어져 있어도 후보가 되므로 실제로 들어 있는지 본다
+        long_tokens = [t for t in indexed if len(t) > 3]
+        if long_tokens:
+            texts = self.texts
+            keep = [r for r in rows.tolist() if all(t in texts[r] for t in long_tokens)]
+            rows = np.asarray(keep, dtype=np.int32)
+        return rows
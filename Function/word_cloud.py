@@ -11,6 +11,8 @@ from math import radians, cos, sin, asin, sqrt
 from streamlit_js_eval import get_geolocation
 from dotenv import load_dotenv
 from wordcloud import WordCloud
+from service_mask import service_filter_sql
+from db_pool import get_conn
 
 # ✅ 폰트 경로 (프로젝트 루트 기준: ./fonts/Pretendard-Regular.otf)
 FONT_PATH = os.path.join(os.getcwd(), "fonts", "Pretendard-Regular.otf")
@@ -149,15 +151,6 @@ FILTER_OPTIONS = {
 }
 FLAG_COLS_SQL = ", ".join(FILTER_OPTIONS.keys())
 
-DB_CONFIG = {
-    "host": os.getenv("DB_HOST"),
-    "port": int(os.getenv("DB_PORT", "3306")),
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PASSWORD"),
-    "database": os.getenv("DB_NAME"),
-    "charset": "utf8mb4",
-}
-
 PAGE_SIZE = 5
 
 if "clicked_centers" not in st.session_state:
@@ -169,9 +162,6 @@ if "last_click_key" not in st.session_state:
 # -----------------------------------------------------------------------------
 # 3) Helpers
 # -----------------------------------------------------------------------------
-def get_conn():
-    return mysql.connector.connect(**DB_CONFIG)
-
 def scroll_down():
     js = """<script>setTimeout(function(){window.parent.scrollTo({top: 500, behavior:'smooth'});}, 300);</script>"""
     components.html(js, height=0)
@@ -330,7 +320,7 @@ def get_bluehands_data(search_text, selected_filters, region_filter):
             LEFT JOIN regions b ON a.region_id = b.id
         """
 
-        conditions = []
+        conditions = ["a.deleted_at IS NULL"]  # 폐점(soft delete) 지점 제외
         params = []
 
         if search_text:
@@ -338,9 +328,10 @@ def get_bluehands_data(search_text, selected_filters, region_filter):
             ptn = f"%{search_text}%"
             params.extend([ptn, ptn])
 
-        if selected_filters:
-            for col in selected_filters:
-                conditions.append(f"a.{col} = 1")
+        mask_sql, mask_params = service_filter_sql(selected_filters)  # 선택한 서비스를 모두 가진 지점
+        if mask_sql:
+            conditions.append(mask_sql)
+            params.extend(mask_params)
 
         if region_filter and region_filter != "(전체)":
             conditions.append("b.name = %s")
@@ -1,7 +1,6 @@
 import os  # 운영체제(OS)와 상호작용하기 위한 라이브러리 (환경변수 값을 읽어올 때 사용)
 import math  # 기본적인 수학 계산을 위한 파이썬 내장 라이브러리
 import streamlit as st  # 웹 애플리케이션 UI 프레임워크
-import mysql.connector  # MySQL 연결/쿼리 실행
 import folium  # 지도 생성/마커 표시
 from folium.plugins import LocateControl  # 현재 위치 버튼
 from streamlit_folium import st_folium  # Streamlit에 Folium 지도 렌더링
@@ -9,6 +8,17 @@ import streamlit.components.v1 as components  # HTML/JS 실행
 from math import radians, cos, sin, asin, sqrt  # 거리 계산(하버사인)
 from streamlit_js_eval import get_geolocation  # 브라우저 GPS API 호출
 from dotenv import load_dotenv  # .env 로드
+from Function.service_mask import service_filter_sql  # 서비스 플래그 비트마스크 조건
+from Function.db_pool import get_conn, pool_stats  # DB 연결 (Function/db_pool.py)
+from Function.branch_snapshot import SnapshotStore  # 지점 전체를 메모리(NumPy 배열)에 올려 두고 조회
+from Function.keyset import keyset_cursor, keyset_query  # 표 페이지(keyset) 쿼리/정렬 키
+from Function.text_search import build_text_search  # 지점명/주소 검색 규칙(selectbox.py / 스냅샷과 같음)
+from Function.query_cache import cached_query, normalize_query, query_cache_stats  # 조건 정규화 + 크기 제한 공용 결과 캐시
+
+try:
+    from streamlit_searchbox import st_searchbox  # 입력하는 동안 추천 목록을 띄우는 검색창(pip install streamlit-searchbox)
+except ImportError:  # 없으면 예전처럼 Enter로 검색하는 st.text_input (세션마다 한 번 안내)
+    st_searchbox = None
 
 # .env 파일에서 환경 변수(DB 접속 정보 등)를 로드합니다.
 load_dotenv()
@@ -256,17 +266,26 @@ LEGEND_HTML = """
 </div>
 """
 
-# 꼭 이 규격으로 할겁니다. 확인들 하세요
-DB_CONFIG = {
-    "host": os.getenv("MYSQL_HOST"),
-    "port": int(os.getenv("MYSQL_PORT", "3306")),
-    "user": os.getenv("MYSQL_USER"),
-    "password": os.getenv("MYSQL_PASSWORD"),
-    "database": os.getenv("MYSQL_DB"),
-    "charset": "utf8mb4",
-}
+# DB 접속 정보는 Function/db_pool.py (MYSQL_HOST / MYSQL_PORT / MYSQL_USER / MYSQL_PASSWORD / MYSQL_DB)
 
 PAGE_SIZE = 5
+MAP_MARKER_LIMIT = 500  # DB 조회 경로에서 지도에 올리는 최대 지점 수(정렬 순서 앞쪽). 표는 keyset 페이지로 전부 볼 수 있다
+
+# 지역/서비스/검색어 조회는 기본적으로 메모리 스냅샷(Function/branch_snapshot.py)에서 답한다.
+# BLUEHANDS_SNAPSHOT=0 이면 조건마다 DB 조회(앞쪽 MAP_MARKER_LIMIT개 + 결과가 더 많으면 keyset 페이지)
+USE_SNAPSHOT = os.getenv("BLUEHANDS_SNAPSHOT", "1") != "0"
+
+# BLUEHANDS_DEBUG=1 이면 사이드바 아래에 조회 캐시 / DB 연결 풀 상태를 보여 준다(운영 점검용)
+SHOW_DEBUG = os.getenv("BLUEHANDS_DEBUG", "0") == "1"
+
+# 검색창 입력 중 추천(Function/autocomplete.py, 스냅샷에서만 답함. MySQL 조회 없음)
+SUGGEST_DEBOUNCE_MS = 250  # 입력이 이 시간 동안 멈췄을 때만 추천을 요청(키 입력마다 rerun 하지 않게)
+
+# 내 주변 검색(get_nearby_bluehands)
+NEARBY_RADIUS_OPTIONS = [1, 3, 5, 10, 20, 50]  # 사이드바 반경 선택지(km)
+NEARBY_START_RADIUS_KM = 5  # K개 최근접 검색은 이 반경부터 2배씩 넓혀 가며 찾는다
+NEARBY_MAX_RADIUS_KM = 640  # 한반도 전체를 덮는 반경
+KM_PER_DEG_LAT = 111.32
 
 # 최근 클릭한 센터(최대 5개) 저장
 if "clicked_centers" not in st.session_state:
@@ -278,9 +297,6 @@ if "last_click_key" not in st.session_state:
 # -----------------------------------------------------------------------------
 # 2. 헬퍼 함수
 # -----------------------------------------------------------------------------
-def get_conn():
-    return mysql.connector.connect(**DB_CONFIG)
-
 def haversine(lon1, lat1, lon2, lat2):
     if any(x is None for x in [lon1, lat1, lon2, lat2]):
         return None
@@ -442,8 +458,8 @@ def render_hy_table_page(rows_page: list[dict]):
     table_html = build_hy_table_html(rows_page)
     st.markdown(f'<div class="stCard">{table_html}</div>', unsafe_allow_html=True)
 
-def render_paginated_table(rows_all: list[dict]):
-    total = len(rows_all)
+def render_paginated_table(total: int, fetch_page):
+    # fetch_page(page_no) -> 그 페이지 행 목록 (DB keyset 조회 또는 이미 받은 목록 슬라이스)
     total_pages = max(1, math.ceil(total / PAGE_SIZE))
 
     if "page" not in st.session_state:
@@ -455,7 +471,7 @@ def render_paginated_table(rows_all: list[dict]):
     # 테이블 출력
     start_idx = (page_now - 1) * PAGE_SIZE
     end_idx = start_idx + PAGE_SIZE
-    render_hy_table_page(rows_all[start_idx:end_idx])
+    render_hy_table_page(fetch_page(page_now))
 
     block_size = 10
     current_block = (page_now - 1) // block_size
@@ -517,6 +533,60 @@ def render_paginated_table(rows_all: list[dict]):
 # -----------------------------------------------------------------------------
 # 4. DB 조회
 # -----------------------------------------------------------------------------
+@st.cache_resource
+def get_snapshot_store():
+    # 프로세스당 1개. 데이터 버전이 바뀌면 store가 알아서 새 스냅샷으로 바꿔 끼운다
+    return SnapshotStore(get_conn)
+
+def search_bluehands(search_text, selected_filters, region_filter):
+    """
+    지역/서비스/검색어 조회 -> (행 목록, 전체 결과 수)
+      - 메모리 스냅샷: 조건에 맞는 행 전부 (전체 결과 수 = 행 수)
+      - DB(스냅샷 적재 실패 / BLUEHANDS_SNAPSHOT=0): 정렬 순서 앞쪽 MAP_MARKER_LIMIT개까지만(지도용).
+        결과가 그보다 적으면 이 한 번의 조회로 끝나고, 많을 때만 COUNT(*)로 전체 수를 센다
+        (표는 전체 수 > 행 수일 때 keyset 페이지로 가져온다).
+    """
+    if USE_SNAPSHOT:
+        try:
+            rows = get_snapshot_store().current().search(search_text, selected_filters, region_filter)
+            return rows, len(rows)
+        except Exception as e:
+            st.warning(f"메모리 스냅샷 조회 실패, DB에서 직접 조회합니다: {e}")
+    try:
+        # 하나 더 받아 보고 넘치는지로 "결과가 더 있는지"를 안다
+        rows = get_bluehands_page(search_text, selected_filters, region_filter, limit=MAP_MARKER_LIMIT + 1)
+        if len(rows) <= MAP_MARKER_LIMIT:
+            return rows, len(rows)
+        return rows[:MAP_MARKER_LIMIT], count_bluehands(search_text, selected_filters, region_filter)
+    except Exception as e:
+        st.error(f"DB Error: {e}")
+        return [], 0
+
+def fuzzy_search_bluehands(search_text, selected_filters, region_filter):
+    """
+    검색어 오타 허용 조회(지점명 자모 편집 거리). 정확한 검색 결과가 없을 때만 쓴다.
+    스냅샷을 못 쓰면 빈 목록(DB에는 같은 색인이 없다).
+    """
+    if not (USE_SNAPSHOT and search_text and search_text.strip()):
+        return []
+    try:
+        return get_snapshot_store().current().fuzzy_search(search_text, selected_filters, region_filter)
+    except Exception:
+        return []
+
+def suggest_bluehands(search_text, region_filter):
+    """
+    검색창 입력 중 추천 -> [(표시 문자열, 검색창에 넣을 값), ...]
+    지점명/시군구명 접두사와 초성("ㄱㄴ" -> 강남)으로 찾는다. 스냅샷을 못 쓰면 추천 없음.
+    """
+    if not (USE_SNAPSHOT and search_text and search_text.strip()):
+        return []
+    try:
+        suggestions = get_snapshot_store().current().suggest(search_text, region_filter)
+    except Exception:
+        return []
+    return [(f"{s.label} · {s.kind}", s.label) for s in suggestions]
+
 @st.cache_data(ttl=3600)
 def get_regions():
     conn = None
@@ -531,39 +601,179 @@ def get_regions():
         if conn:
             conn.close()
 
-@st.cache_data(ttl=600)
+def build_bluehands_where(search_text, selected_filters, region_filter):
+    """
+    검색 조건 -> (WHERE 절, params, 관련도 식, 관련도 params)
+    목록/개수/페이지 조회가 같은 조건을 쓰도록 한곳에서 만든다. 관련도 식은 검색어가 없으면 None.
+    """
+    text_conditions, text_params, score_sql, score_params = build_text_search(search_text)
+    conditions, params = ["a.deleted_at IS NULL"], []  # 폐점(soft delete) 지점 제외
+    conditions.extend(text_conditions)
+    params.extend(text_params)
+
+    mask_sql, mask_params = service_filter_sql(selected_filters)  # 선택한 서비스를 모두 가진 지점
+    if mask_sql:
+        conditions.append(mask_sql)
+        params.extend(mask_params)
+
+    if region_filter and region_filter != "(전체)":
+        conditions.append("b.name = %s")
+        params.append(region_filter)
+
+    return " WHERE " + " AND ".join(conditions), params, score_sql, score_params
+
+# @cached_query / @st.cache_data 조회 함수들은 DB 오류를 잡지 않고 그대로 올린다(실패한 빈 결과가 공용 캐시에 남지 않게).
+# 오류 표시는 부르는 쪽(search_bluehands / fetch_keyset_page / 내 주변 조회)에서 한다.
+
+# 결과 전체를 한 번에 받는다(DB/bench_app.py 기준선). 앱 화면은 search_bluehands로 MAP_MARKER_LIMIT개까지만 받는다
+@cached_query("bluehands_data")  # 세션 공용, 조건 정규화 키 (Function/query_cache.py)
 def get_bluehands_data(search_text, selected_filters, region_filter):
     conn = None
     try:
         conn = get_conn()
         cursor = conn.cursor(dictionary=True)
+        where_sql, params, score_sql, score_params = build_bluehands_where(search_text, selected_filters, region_filter)
+        score_col = f", {score_sql} AS relevance" if score_sql else ""
         query = (
-            f"SELECT a.id, a.type_id, a.name, a.latitude, a.longitude, a.address, a.phone, {FLAG_COLS_SQL} "
-            f"FROM bluehands a LEFT JOIN regions b ON a.region_id = b.id"
+            f"SELECT a.id, a.type_id, a.name, a.latitude, a.longitude, a.address, a.phone, {FLAG_COLS_SQL}{score_col} "
+            f"FROM bluehands a LEFT JOIN regions b ON a.region_id = b.id{where_sql}"
         )
-        conditions, params = [], []
-
-        if search_text:
-            conditions.append("(a.name LIKE %s OR a.address LIKE %s)")
-            params.extend([f"%{search_text}%", f"%{search_text}%"])
+        # 스냅샷과 같은 순서: 검색어가 많이 맞는 지점부터, 없으면 지점명 -> id
+        query += " ORDER BY relevance DESC, a.name, a.id" if score_sql else " ORDER BY a.name, a.id"
 
-        if selected_filters:
-            for col in selected_filters:
-                conditions.append(f"a.{col} = 1")
+        cursor.execute(query, score_params + params)
+        return cursor.fetchall()
+    finally:
+        if conn:
+            conn.close()
 
-        if region_filter and region_filter != "(전체)":
-            conditions.append("b.name = %s")
-            params.append(region_filter)
+@cached_query("bluehands_count")
+def count_bluehands(search_text, selected_filters, region_filter):
+    conn = None
+    try:
+        conn = get_conn()
+        cursor = conn.cursor()
+        where_sql, params, _, _ = build_bluehands_where(search_text, selected_filters, region_filter)
+        cursor.execute(f"SELECT COUNT(*) FROM bluehands a LEFT JOIN regions b ON a.region_id = b.id{where_sql}", params)
+        return int(cursor.fetchone()[0])
+    finally:
+        if conn:
+            conn.close()
 
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+def _keyset_query(search_text, selected_filters, region_filter, after, columns):
+    """
+    페이지 조회(keyset) 쿼리 -> (LIMIT 없는 SQL, params)
+    정렬 (관련도 DESC,) a.name, a.id와 다음 페이지 조건은 Function/keyset.py (selectbox.py와 같은 규칙)
+    """
+    where_sql, params, score_sql, score_params = build_bluehands_where(search_text, selected_filters, region_filter)
+    base_sql = f"FROM bluehands a LEFT JOIN regions b ON a.region_id = b.id{where_sql}"
+    return keyset_query(columns, base_sql, params, score_sql, score_params, after)
 
-        cursor.execute(query, params)
+@cached_query("bluehands_page")
+def get_bluehands_page(search_text, selected_filters, region_filter, after=None, limit=PAGE_SIZE):
+    """after 다음부터 limit개만 조회 (OFFSET 없이 정렬 키 범위로 바로 찾아감)"""
+    conn = None
+    try:
+        conn = get_conn()
+        cursor = conn.cursor(dictionary=True)
+        columns = f"a.id, a.type_id, a.name, a.latitude, a.longitude, a.address, a.phone, {FLAG_COLS_SQL}"
+        query, params = _keyset_query(search_text, selected_filters, region_filter, after, columns)
+        cursor.execute(query + f" LIMIT {int(limit)}", params)
         return cursor.fetchall()
+    finally:
+        if conn:
+            conn.close()
 
+@cached_query("bluehands_seek")
+def seek_bluehands_cursor(search_text, selected_filters, region_filter, after, skip):
+    """
+    after에서 skip개 뒤 행의 정렬 키 (페이지 번호로 여러 페이지를 건너뛸 때).
+    정렬 키 컬럼만 읽으므로 행 전체를 가져오는 것보다 가볍다.
+    """
+    conn = None
+    try:
+        conn = get_conn()
+        cursor = conn.cursor(dictionary=True)
+        query, params = _keyset_query(search_text, selected_filters, region_filter, after, "a.id, a.name")
+        cursor.execute(query + f" LIMIT 1 OFFSET {int(skip) - 1}", params)
+        row = cursor.fetchone()
+        return keyset_cursor(row) if row else None
+    finally:
+        if conn:
+            conn.close()
+
+def fetch_keyset_page(query_args, page_no):
+    """
+    query_args = normalize_query(search_text, selected_filters, region_filter)의 page_no 페이지 행.
+    페이지별 시작 정렬 키를 세션에 저장해 두고, 처음 가 보는 페이지는 가장 가까운 앞 페이지에서 건너뛴다.
+    """
+    state = st.session_state.get("page_cursors")
+    if not state or state["query"] != query_args:
+        state = {"query": query_args, "cursors": {1: None}}  # 조건이 바뀌면 처음부터
+        st.session_state.page_cursors = state
+    cursors = state["cursors"]
+
+    try:
+        if page_no not in cursors:
+            known = max(p for p in cursors if p < page_no)
+            cursors[page_no] = seek_bluehands_cursor(
+                *query_args, after=cursors[known], skip=(page_no - known) * PAGE_SIZE
+            )
+        if page_no > 1 and cursors[page_no] is None:
+            return []  # 결과 끝을 넘어선 페이지
+        rows = get_bluehands_page(*query_args, after=cursors[page_no])
     except Exception as e:
         st.error(f"DB Error: {e}")
         return []
+    if rows:
+        cursors[page_no + 1] = keyset_cursor(rows[-1])
+    return rows
+
+def _bbox_wkt(lat, lng, radius_km):
+    # 반경 radius_km 원을 감싸는 사각형(경도-위도 순서 WKT). MBRContains로 SPATIAL INDEX를 타게 하는 1차 필터.
+    dlat = radius_km / KM_PER_DEG_LAT
+    dlng = radius_km / (KM_PER_DEG_LAT * max(cos(radians(lat)), 0.01))
+    w, e, s, n = lng - dlng, lng + dlng, lat - dlat, lat + dlat
+    return f"POLYGON(({w} {s}, {e} {s}, {e} {n}, {w} {n}, {w} {s}))"
+
+@st.cache_data(ttl=600)
+def get_nearby_bluehands(user_lat, user_lng, radius_km=None, k=None, selected_filters=None):
+    """
+    내 위치 기준 주변 지점 조회 (거리 계산은 DB에서)
+      - radius_km만: 반경 안의 지점 전부, 가까운 순
+      - k만: 가장 가까운 k개 (NEARBY_START_RADIUS_KM부터 반경을 2배씩 넓혀 가며 찾음)
+      - 둘 다: 반경 안에서 가까운 k개
+    결과 행에는 distance_km가 붙는다.
+    """
+    if user_lat is None or user_lng is None:
+        return []
+
+    conn = None
+    try:
+        conn = get_conn()
+        cursor = conn.cursor(dictionary=True)
+
+        mask_sql, mask_params = service_filter_sql(selected_filters)
+        filter_sql = f" AND {mask_sql}" if mask_sql else ""
+        query = (
+            f"SELECT a.id, a.type_id, a.name, a.latitude, a.longitude, a.address, a.phone, {FLAG_COLS_SQL}, "
+            f"ST_Distance_Sphere(a.geom, ST_SRID(POINT(%s, %s), 4326)) / 1000 AS distance_km "
+            f"FROM bluehands a "
+            f"WHERE a.deleted_at IS NULL AND a.latitude IS NOT NULL "
+            f"AND MBRContains(ST_GeomFromText(%s, 4326, 'axis-order=long-lat'), a.geom){filter_sql} "
+            f"HAVING distance_km <= %s ORDER BY distance_km"
+        )
+        if k:
+            query += f" LIMIT {int(k)}"
+
+        radius = radius_km if radius_km else NEARBY_START_RADIUS_KM
+        while True:
+            cursor.execute(query, [user_lng, user_lat, _bbox_wkt(user_lat, user_lng, radius), *mask_params, radius])
+            rows = cursor.fetchall()
+            # 반경이 정해져 있거나, k개를 채웠거나, 더 넓힐 수 없으면 끝
+            if radius_km or not k or len(rows) >= k or radius >= NEARBY_MAX_RADIUS_KM:
+                return rows
+            radius = min(radius * 2, NEARBY_MAX_RADIUS_KM)
     finally:
         if conn:
             conn.close()
@@ -631,21 +841,48 @@ with st.sidebar:
     reverse_map = {v: k for k, v in FILTER_OPTIONS.items()}
     selected_service_cols = [reverse_map[label] for label in selected_labels]
 
+    st.write("---")
+    near_me = st.checkbox("📍 내 주변 지점만 보기", value=False, disabled=user_lat is None)
+    near_radius_km = None
+    if near_me:
+        near_radius_km = st.select_slider("반경 (km)", options=NEARBY_RADIUS_OPTIONS, value=5)
+
     col1, col2 = st.columns([3, 1])
     with col1:
         placeholder_text = f"'{selected_region}' 내 검색" if selected_region != "(전체)" else "지점명 또는 주소"
-        search_query = st.text_input(
-            "검색어 입력",
-            placeholder=placeholder_text,
-            key="main_search",
-            label_visibility="collapsed",
-        )
+        if st_searchbox is not None and USE_SNAPSHOT:
+            # 입력 중 추천을 고르면 그 이름으로, Enter만 누르면 입력한 그대로 검색
+            search_query = st_searchbox(
+                lambda text: suggest_bluehands(text, selected_region),
+                placeholder=placeholder_text,
+                key="main_search",
+                debounce=SUGGEST_DEBOUNCE_MS,
+                default_use_searchterm=True,
+            ) or ""
+        else:
+            search_query = st.text_input(
+                "검색어 입력",
+                placeholder=placeholder_text,
+                key="main_search",
+                label_visibility="collapsed",
+            )
     with col2:
         if st.button("검색", type="primary", use_container_width=True):
             scroll_down()
 
+    if st_searchbox is None and USE_SNAPSHOT and not st.session_state.get("searchbox_notice_shown"):
+        st.session_state.searchbox_notice_shown = True  # 세션마다 첫 화면에서 한 번만
+        st.info("ℹ️ 검색어 자동완성을 쓰려면 `pip install streamlit-searchbox` 후 다시 실행하세요. 지금은 Enter로 검색합니다.")
+
     top5_placeholder = st.empty()
 
+    if SHOW_DEBUG:
+        with st.expander("🧪 캐시 / 연결 풀 상태", expanded=False):
+            st.caption("조회 캐시 (Function/query_cache.py)")
+            st.json(query_cache_stats())
+            st.caption("DB 연결 풀 (Function/db_pool.py)")
+            st.json(pool_stats())
+
     def render_top5(ph):
         with ph.container():
             st.write("---")
@@ -668,10 +905,29 @@ with st.sidebar:
     # 첫 렌더 (클릭 처리 전 상태)
     render_top5(top5_placeholder)
 
-should_search = search_query or selected_service_cols or (selected_region != "(전체)")
+should_search = search_query or selected_service_cols or (selected_region != "(전체)") or near_me
 
 if should_search:
-    data_list = get_bluehands_data(search_query, selected_service_cols, selected_region)
+    if near_me:
+        # 내 주변: 지역/검색어 대신 현재 위치 반경으로 찾음 (서비스 옵션은 같이 적용)
+        try:
+            data_list = get_nearby_bluehands(
+                round(user_lat, 4), round(user_lng, 4),  # GPS 미세 변동으로 캐시가 매번 깨지지 않게
+                radius_km=near_radius_km, selected_filters=selected_service_cols,
+            )
+        except Exception as e:  # 실패는 캐시하지 않고 다음 rerun에 다시 조회
+            st.error(f"DB Error: {e}")
+            data_list = []
+        total_count = len(data_list)
+    else:
+        # DB 경로에서는 data_list가 앞쪽 MAP_MARKER_LIMIT개까지만일 수 있다(total_count가 전체 결과 수)
+        data_list, total_count = search_bluehands(search_query, selected_service_cols, selected_region)
+        if not data_list and search_query:
+            # 정확히 맞는 지점이 없으면 오타를 허용해서 비슷한 지점명으로 다시 찾음 (예: 블루핸주 -> 블루핸즈)
+            data_list = fuzzy_search_bluehands(search_query, selected_service_cols, selected_region)
+            total_count = len(data_list)
+            if data_list:
+                st.info(f"'{search_query}'와(과) 정확히 일치하는 지점이 없어 비슷한 이름의 지점을 보여드립니다.")
 
     if not data_list:
         st.error("조건에 맞는 검색 결과가 없습니다.")
@@ -698,6 +954,8 @@ if should_search:
 
     if data_list:
         add_markers_to_map(m, data_list, user_lat, user_lng)
+        if total_count > len(data_list):
+            st.caption(f"지도에는 결과 {total_count}개 중 앞쪽 {len(data_list)}개만 표시합니다. 전체 목록은 아래 표에서 볼 수 있습니다.")
 
         # Streamlit에 지도 렌더링
         map_out = st_folium(m, height=500, use_container_width=True)
@@ -733,11 +991,19 @@ if should_search:
 
     # 검색결과 + 범례 (지도 아래 흰색 바)
     if data_list:
-        render_result_bar(len(data_list))
+        render_result_bar(total_count)
 
     # 테이블 + 페이지네이션
     if data_list:
-        render_paginated_table(data_list)
+        if total_count <= len(data_list):
+            # 결과를 이미 다 받았으면(내 주변 / 스냅샷 / 적은 DB 결과) 잘라서 보여준다. 추가 조회 없음
+            render_paginated_table(
+                len(data_list), lambda p: data_list[(p - 1) * PAGE_SIZE:p * PAGE_SIZE]
+            )
+        else:
+            # 지도용으로 앞쪽만 받은 DB 결과: 표는 현재 페이지 5행만 keyset으로 가져온다
+            query_args = normalize_query(search_query, selected_service_cols, selected_region)
+            render_paginated_table(total_count, lambda p: fetch_keyset_page(query_args, p))
 
 else:
     st.info("👈 왼쪽 사이드바에서 원하는 지역과 정비 옵션을 선택하거나, 지점명을 검색해보세요.")
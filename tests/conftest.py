@@ -0,0 +1,13 @@
+# File: conftest.py
+# 목적:
+#  - Function/, DB/ 모듈을 스크립트에서처럼(from trigram_index import ...) import 할 수 있게 경로를 잡는다.
+#  - MySQL 없이 돌아가는 단위 테스트만 둔다(실행: 프로젝트 루트에서 python -m pytest -q).
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for sub in ("Function", "DB"):
+    path = os.path.join(ROOT, sub)
+    if path not in sys.path:
+        sys.path.insert(0, path)
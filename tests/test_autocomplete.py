@@ -0,0 +1,29 @@
+from autocomplete import Suggestion, SuggestIndex, to_choseong
+
+ENTRIES = [
+    Suggestion("서울특별시 강남구", "지역", "서울"),
+    Suggestion("블루핸즈 강남점", "지점", "서울"),
+    Suggestion("블루핸즈 강동점", "지점", "서울"),
+    Suggestion("블루핸즈 해운대점", "지점", "부산"),
+]
+
+
+def test_to_choseong():
+    assert to_choseong("강남 A") == "ㄱㄴ a"
+
+
+def test_prefix_while_typing():
+    labels = [s.label for s in SuggestIndex(ENTRIES).suggest("블루핸즈 강나")]
+    assert labels == ["블루핸즈 강남점"]  # 입력 중인 "나"도 "남"의 접두사
+
+
+def test_middle_word_and_choseong():
+    index = SuggestIndex(ENTRIES)
+    assert [s.label for s in index.suggest("강남")] == ["서울특별시 강남구", "블루핸즈 강남점"]
+    assert [s.label for s in index.suggest("ㄱㄴ")] == ["서울특별시 강남구", "블루핸즈 강남점"]
+
+
+def test_region_filter_and_limit():
+    index = SuggestIndex(ENTRIES)
+    assert [s.label for s in index.suggest("블루", region="부산")] == ["블루핸즈 해운대점"]
+    assert len(index.suggest("블루", limit=2)) == 2
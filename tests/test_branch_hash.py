@@ -0,0 +1,21 @@
+import math
+
+import pandas as pd
+
+from branch_hash import HASH_COLUMNS, branch_key, row_hash, row_hashes
+
+
+def test_row_hashes_matches_row_hash():
+    rows = [
+        {"region": "서울", "name": " 블루핸즈 강남점 ", "type": "종합", "address": "서울 강남구", "phone": "02-1234-5678",
+         "latitude": 37.123456789, "longitude": 127.1, **{c: 1 for c in HASH_COLUMNS[7:]}},
+        {"region": "부산", "name": "블루핸즈 해운대점", "type": None, "address": "부산 해운대구", "phone": None,
+         "latitude": math.nan, "longitude": None, **{c: 0 for c in HASH_COLUMNS[7:]}},
+    ]
+    df = pd.DataFrame(rows)
+    assert row_hashes({col: df[col] for col in HASH_COLUMNS}) == [row_hash(r) for r in rows]
+
+
+def test_branch_key_ignores_surrounding_spaces():
+    assert branch_key(" 블루핸즈 강남점", "서울 강남구 ") == branch_key("블루핸즈 강남점", "서울 강남구")
+    assert branch_key("블루핸즈 강남점", "서울 강남구") != branch_key("블루핸즈 강남점", "서울 서초구")
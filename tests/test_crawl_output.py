@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from crawl_output import FLAG_COLUMNS, OUTPUT_COLUMNS, CrawlOutputWriter, iter_crawl_output, read_crawl_output
+
+
+def _row(i):
+    row = {
+        "region": "서울", "name": f"블루핸즈 {i}점", "type": "종합",
+        "address": f"서울특별시 강남구 {i}", "phone": "02-0123-4567",
+        "latitude": 37.5 + i / 1000, "longitude": 127.0 + i / 1000,
+    }
+    row.update({col: i % 2 for col in FLAG_COLUMNS})
+    return row
+
+
+@pytest.mark.parametrize("ext", [".csv", ".ndjson", ".parquet"])
+def test_round_trip_keeps_values_and_types(tmp_path, ext):
+    path = str(tmp_path / f"out{ext}")
+    rows = [_row(i) for i in range(7)]
+    writer = CrawlOutputWriter(path, batch_rows=3)
+    writer.write_rows(rows[:4])
+    writer.write_rows(rows[4:])
+    assert os.path.exists(path + ".partial") and not os.path.exists(path)
+    writer.commit()
+
+    assert writer.rows_written == 7
+    assert not os.path.exists(path + ".partial")
+    df = read_crawl_output(path)
+    assert list(df.columns) == OUTPUT_COLUMNS
+    assert df.to_dict("records") == rows
+    assert str(df["latitude"].dtype) == "float64"
+    assert all(str(df[col].dtype) == "uint8" for col in FLAG_COLUMNS)
+    assert df["phone"].tolist()[0] == "02-0123-4567"  # 앞자리 0이 숫자로 바뀌지 않는다
+
+    chunks = list(iter_crawl_output(path, chunksize=3))
+    assert [len(c) for c in chunks] == [3, 3, 1]
+
+
+def test_abort_removes_partial_file(tmp_path):
+    path = str(tmp_path / "out.csv")
+    writer = CrawlOutputWriter(path, batch_rows=1)
+    writer.write_rows([_row(0)])
+    writer.abort()
+    assert not os.path.exists(path) and not os.path.exists(path + ".partial")
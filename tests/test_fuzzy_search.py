@@ -0,0 +1,26 @@
+from fuzzy_search import FuzzyNameIndex, edit_distance, to_jamo
+
+NAMES = ["블루핸즈 강남점", "블루핸즈 강동점", "블루핸즈 해운대점", "현대 서비스"]
+
+
+def test_edit_distance_on_jamo():
+    assert edit_distance(to_jamo("블루핸즈"), to_jamo("블루핸주")) == 1
+    assert edit_distance(to_jamo("강남"), to_jamo("강남")) == 0
+
+
+def test_search_allows_typos_and_orders_by_distance():
+    index = FuzzyNameIndex(NAMES)
+    hits = index.search("블루핸주 강남점")
+    assert hits[0] == (0, 1)
+    assert {row for row, _ in hits} <= {0, 1, 2}
+    assert [dist for _, dist in hits] == sorted(dist for _, dist in hits)
+
+
+def test_search_respects_allowed_rows():
+    index = FuzzyNameIndex(NAMES)
+    allowed = [False, True, True, True]
+    assert 0 not in {row for row, _ in index.search("블루핸주 강남점", allowed=allowed)}
+
+
+def test_unrelated_word_finds_nothing():
+    assert FuzzyNameIndex(NAMES).search("전혀다른이름") == []
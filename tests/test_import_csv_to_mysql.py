@@ -0,0 +1,19 @@
+import pandas as pd
+
+from import_csv_to_mysql import format_phone_kor, normalize_str
+
+
+def test_normalize_str():
+    col = pd.Series(["  강남점 ", "", "   ", None, float("nan"), "서초점"])
+    assert normalize_str(col).tolist() == ["강남점", None, None, None, None, "서초점"]
+
+
+def test_format_phone_kor():
+    col = pd.Series([
+        "01012345678", "021234567", "0212345678", "031-123-4567", "03112345678",
+        "1588-1234", "", None,
+    ])
+    assert format_phone_kor(col).tolist() == [
+        "010-1234-5678", "02-123-4567", "02-1234-5678", "031-123-4567", "031-1234-5678",
+        "15881234", None, None,
+    ]
@@ -0,0 +1,20 @@
+from keyset import keyset_cursor, keyset_query
+
+
+def test_keyset_query_without_score():
+    sql, params = keyset_query("a.id, a.name", "FROM bluehands a WHERE a.x = %s", [7], after=("강남점", 3))
+    assert sql == "SELECT a.id, a.name FROM bluehands a WHERE a.x = %s AND (a.name, a.id) > (%s, %s) ORDER BY a.name, a.id"
+    assert params == [7, "강남점", 3]
+
+
+def test_keyset_query_with_score_param_order():
+    sql, params = keyset_query("a.id", "FROM bluehands a WHERE a.x = %s", [7], "(a.name LIKE %s)", ["%강%"],
+                               after=(2.0, "강남점", 3))
+    assert sql.startswith("SELECT a.id, ROUND((a.name LIKE %s), 6) AS relevance FROM")
+    assert sql.endswith("ORDER BY relevance DESC, a.name, a.id")
+    assert params == ["%강%", 7, "%강%", 2.0, "%강%", 2.0, "강남점", 3]
+
+
+def test_keyset_cursor():
+    assert keyset_cursor({"id": 3, "name": "강남점"}) == ("강남점", 3)
+    assert keyset_cursor({"id": 3, "name": "강남점", "relevance": 2}) == (2.0, "강남점", 3)
@@ -0,0 +1,38 @@
+import pytest
+
+from query_cache import QueryCache, estimate_bytes, normalize_query
+
+
+def test_normalize_query():
+    assert normalize_query("  강남   현대 ", ["is_frame", "is_ev"], "(전체)") == ("강남 현대", ("is_ev", "is_frame"), None)
+    assert normalize_query("ABC", None, " 서울 ") == ("abc", (), "서울")
+
+
+def test_lru_eviction_by_bytes():
+    value = ["x" * 100]
+    cache = QueryCache(max_bytes=estimate_bytes(value) * 2, ttl_s=60)
+    cache.put("a", value)
+    cache.put("b", value)
+    assert cache.get("a") == (True, value)  # a를 최근 사용으로
+    cache.put("c", value)
+    assert cache.get("b") == (False, None)  # 가장 오래 안 쓴 b가 밀려남
+    assert cache.get("a")[0] and cache.get("c")[0]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_failed_load_is_not_cached():
+    cache = QueryCache(ttl_s=60)
+
+    def fail():
+        raise RuntimeError("DB down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("k", fail)
+    assert cache.get_or_load("k", lambda: [1]) == [1]
+
+
+def test_ttl_expiry():
+    cache = QueryCache(ttl_s=-1)
+    cache.put("k", 1)
+    assert cache.get("k") == (False, None)
+    assert cache.stats()["expired"] == 1
@@ -0,0 +1,164 @@
+# File: test_snapshot_sql.py
+# 목적:
+#  - 메모리 스냅샷(branch_snapshot.BranchSnapshot.search)과 DB 조회(final.py get_bluehands_data /
+#    get_bluehands_page + keyset)가 같은 행을 같은 순서로 돌려주는지 본다.
+#  - MySQL 대신 sqlite3 메모리 DB에 final.py 조회 함수를 그대로 실행한다(bench_app.load_app_functions).
+#    sqlite에 없는 문법만 바꿔 끼운다:
+#      %s -> ?,  LIKE ? -> LIKE ? ESCAPE '\'(MySQL 기본 이스케이프),
+#      MATCH(a.name, a.address) AGAINST(? IN BOOLEAN MODE) -> 구절("...")마다 지점명 또는 주소에 포함(ngram 구절 검색)
+#    지점명 정렬은 스냅샷과 같은 collation_key로 맞춘다(MySQL utf8mb4_0900_ai_ci 대신).
+
+import re
+import sqlite3
+
+import pytest
+
+from bench_app import load_app_functions
+from branch_snapshot import BranchSnapshot, collation_key
+from keyset import keyset_cursor
+from service_mask import SERVICE_FLAGS, service_mask_of
+
+REGIONS = {1: "서울", 2: "부산"}
+BRANCHES = [  # (region_id, 지점명, 주소, 서비스)
+    (1, "블루핸즈 강남점", "서울특별시 강남구 테헤란로 1", ["is_ev", "is_frame"]),
+    (1, "블루핸즈 현대 강남점", "서울특별시 강남구 강남대로 2", ["is_ev"]),
+    (1, "블루핸즈 서초점", "서울특별시 서초구 강남대로 3", []),
+    (1, "블루핸즈 강남점", "서울특별시 강남구 역삼로 4", ["is_frame"]),  # 같은 이름 -> id 순
+    (1, "ABC모터스", None, ["is_hydrogen"]),
+    (1, "abc정비", "서울특별시 중구 세종대로 5", []),
+    (2, "블루핸즈 해운대점", "부산광역시 해운대구 중앙로 6", ["is_ev"]),
+    (2, "블루핸즈 현대_센텀점", "부산광역시 해운대구 센텀로 7", ["is_ev", "is_frame"]),
+    (2, "블루핸즈 100%점", "부산광역시 강서구 강남로 8", []),
+    (2, "Café 블루핸즈", "부산광역시 중구 중앙대로 9", ["is_frame"]),
+]
+
+CASES = [
+    ("", [], None),
+    ("", [], "서울"),
+    ("", ["is_ev"], None),
+    ("강남", [], None),
+    ("강남 현대", [], None),
+    ("강", [], None),
+    ("강 해운대", [], "부산"),
+    ("블루핸즈", ["is_frame"], None),
+    ("_", [], None),
+    ("100%", [], None),
+    ("abc", [], None),
+    ('"강남" +현대', [], None),
+    ("없는지점", [], None),
+]
+
+MATCH_RE = re.compile(r"MATCH\(a\.name, a\.address\) AGAINST\(\? IN BOOLEAN MODE\)")
+
+
+def _mysql_match(name, address, against):
+    phrases = re.findall(r'"([^"]*)"', against)
+    texts = [(name or "").lower(), (address or "").lower()]
+    return int(all(any(p.lower() in t for t in texts) for p in phrases))
+
+
+def _compare_names(a, b):
+    a, b = collation_key(a), collation_key(b)
+    return (a > b) - (a < b)
+
+
+class _Cursor:
+    def __init__(self, conn, dictionary):
+        self._cur = conn.cursor()
+        self._dictionary = dictionary
+
+    def execute(self, sql, params=()):
+        sql = sql.replace("%s", "?")
+        sql = MATCH_RE.sub("mysql_match(a.name, a.address, ?)", sql)
+        sql = sql.replace("LIKE ?", "LIKE ? ESCAPE '\\'")
+        self._cur.execute(sql, list(params))
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return {d[0]: v for d, v in zip(self._cur.description, row)}
+
+    def fetchall(self):
+        return [self._row(r) for r in self._cur.fetchall()]
+
+    def fetchone(self):
+        return self._row(self._cur.fetchone())
+
+
+class _Conn:
+    def __init__(self, db):
+        self._db = db
+
+    def cursor(self, dictionary=False):
+        return _Cursor(self._db, dictionary)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="module")
+def db():
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.create_collation("ai_ci", _compare_names)
+    conn.create_function("mysql_match", 3, _mysql_match)
+    flag_cols = ", ".join(f"{c} INTEGER" for c in SERVICE_FLAGS)
+    conn.execute("CREATE TABLE regions (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.execute(
+        "CREATE TABLE bluehands (id INTEGER PRIMARY KEY, type_id INTEGER, region_id INTEGER, "
+        "name TEXT COLLATE ai_ci, address TEXT, phone TEXT, latitude REAL, longitude REAL, "
+        f"service_mask INTEGER, deleted_at TEXT, {flag_cols})"
+    )
+    conn.executemany("INSERT INTO regions VALUES (?, ?)", REGIONS.items())
+    for i, (region_id, name, address, services) in enumerate(BRANCHES, 1):
+        flags = [1 if c in services else 0 for c in SERVICE_FLAGS]
+        conn.execute(
+            f"INSERT INTO bluehands VALUES (?, 1, ?, ?, ?, NULL, NULL, NULL, ?, NULL, {', '.join('?' * len(flags))})",
+            [i, region_id, name, address, service_mask_of(services), *flags],
+        )
+    return conn
+
+
+@pytest.fixture(scope="module")
+def app(db):
+    return load_app_functions(lambda: _Conn(db))
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    rows = [
+        {"id": i, "type_id": 1, "region_id": region_id, "region_name": REGIONS[region_id], "name": name,
+         "address": address, "phone": None, "latitude": None, "longitude": None,
+         "service_mask": service_mask_of(services)}
+        for i, (region_id, name, address, services) in enumerate(BRANCHES, 1)
+    ]
+    return BranchSnapshot(rows, version=(len(rows),))
+
+
+@pytest.mark.parametrize("search_text, filters, region", CASES)
+def test_snapshot_matches_sql(app, snapshot, search_text, filters, region):
+    expected = [r["id"] for r in app["get_bluehands_data"](search_text, filters, region)]
+    assert [r["id"] for r in snapshot.search(search_text, filters, region)] == expected
+    assert app["count_bluehands"](search_text, filters, region) == len(expected)
+
+
+@pytest.mark.parametrize("search_text, filters, region", CASES)
+def test_keyset_pages_match_full_result(app, search_text, filters, region):
+    expected = [r["id"] for r in app["get_bluehands_data"](search_text, filters, region)]
+    paged, after = [], None
+    while True:
+        rows = app["get_bluehands_page"](search_text, filters, region, after=after, limit=3)
+        if not rows:
+            break
+        paged += [r["id"] for r in rows]
+        after = keyset_cursor(rows[-1])
+    assert paged == expected
+
+    if len(expected) > 3:  # 3행 건너뛴 정렬 키 = 첫 페이지 마지막 행의 정렬 키
+        first = app["get_bluehands_page"](search_text, filters, region, limit=3)
+        assert app["seek_bluehands_cursor"](search_text, filters, region, None, 3) == keyset_cursor(first[-1])
+
+
+def test_name_order_folds_case_and_width(snapshot):
+    names = [r["name"] for r in snapshot.search("", [], None)]
+    assert names == sorted(names, key=collation_key)
+    assert names.index("ABC모터스") < names.index("abc정비") < names.index("Café 블루핸즈")
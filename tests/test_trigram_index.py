@@ -0,0 +1,35 @@
+import numpy as np
+
+from trigram_index import FIELD_SEP, TrigramIndex
+
+TEXTS = [
+    FIELD_SEP.join(["블루핸즈 강남점", "서울특별시 강남구 테헤란로 1"]),
+    FIELD_SEP.join(["블루핸즈 현대점", "서울특별시 서초구 강남대로 2"]),
+    FIELD_SEP.join(["블루핸즈 해운대점", "부산광역시 해운대구 중앙로 3"]),
+]
+
+
+def _brute_force(tokens):
+    return [i for i, text in enumerate(TEXTS) if all(t in text for t in tokens)]
+
+
+def test_search_matches_substring_scan():
+    index = TrigramIndex(TEXTS)
+    for tokens in (["강남"], ["강남", "현대"], ["테헤란로"], ["해운대구"], ["강남대로"], ["없는지점"]):
+        assert index.search(tokens).tolist() == _brute_force(tokens)
+
+
+def test_grams_do_not_cross_fields():
+    index = TrigramIndex(TEXTS)
+    assert index.search(["남점서"]).tolist() == []  # "강남점" 끝 + "서울" 앞
+
+
+def test_single_char_tokens_are_left_to_caller():
+    index = TrigramIndex(TEXTS)
+    assert index.search(["강"]) is None
+    assert index.search(["강", "현대"]).tolist() == [1]  # 1글자 토큰은 무시
+
+
+def test_candidates_limit_result():
+    index = TrigramIndex(TEXTS)
+    assert index.search(["블루핸즈"], np.array([0, 2], dtype=np.int32)).tolist() == [0, 2]